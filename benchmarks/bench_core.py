@@ -0,0 +1,129 @@
+"""
+Benchmarks the hot paths of the library: parsing into models or records, model
+building, URL helpers, routes and tag lookups.
+
+Run it with ``python benchmarks/bench_core.py``, or every benchmark at once with
+``python benchmarks/run.py``. The payloads are synthesized with a fixed seed so
+the numbers can be compared between runs and commits.
+
+For every case this reports the operations per second and, measured with
+:mod:`tracemalloc`, the peak memory allocated per item and the amount of memory
+blocks that are still alive per item once the operation returns.
+"""
+
+from __future__ import annotations
+
+import sys
+import timeit
+import tracemalloc
+from typing import Any, Callable, List, Tuple
+
+from payloads import creator_payload, search_payload
+
+from redgifs import API, MediaType, Order, ReplayTransport, Tags
+from redgifs.http import Route
+from redgifs.parser import parse_creator, parse_search, parse_search_records
+from redgifs.utils import _gifs_iter, build_file_url, to_embed_url, to_web_url
+
+SIZES = (40, 80, 1000)
+PAGES = 10
+
+Case = Tuple[str, Callable[[], Any], int]
+
+
+def measure(func: Callable[[], Any], items: int) -> Tuple[float, float, float]:
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    ops = number / min(timer.repeat(repeat=3, number=number))
+
+    func()  # Warm up any caches before tracing the allocations
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    result = func()
+    _, peak = tracemalloc.get_traced_memory()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    blocks = sum(stat.count_diff for stat in after.compare_to(before, 'filename'))
+    del result
+    return ops, peak / items, blocks / items
+
+
+def pagination_case(count: int) -> Case:
+    transport = ReplayTransport()
+    for page in range(1, PAGES + 1):
+        route = Route(
+            'GET',
+            '/v2/users/{username}/search?page={page}&count={count}&order={order}&type={type}',
+            username='someone',
+            page=page,
+            count=count,
+            order=Order.RECENT.value,
+            type='g',
+        )
+        transport.add('GET', route.url, creator_payload(count, seed=page, page=page))
+    api = API(transport=transport)
+
+    def paginate() -> List[Any]:
+        gifs = []
+        for page in range(1, PAGES + 1):
+            gifs.extend(api.search_creator('someone', page=page, count=count).gifs)
+        return gifs
+
+    return f'search_creator {PAGES} pages', paginate, PAGES * count
+
+
+def cases() -> List[Case]:
+    found: List[Case] = []
+    for size in SIZES:
+        search = search_payload(size)
+        creator = creator_payload(size)
+        found.append((f'parse_search [{size}]', lambda p=search: parse_search('amateur', p, MediaType.GIF), size))
+        found.append(
+            (f'parse_search_records [{size}]', lambda p=search: parse_search_records('amateur', p, MediaType.GIF), size)
+        )
+        found.append((f'parse_creator [{size}]', lambda p=creator: parse_creator(p, MediaType.GIF), size))
+        found.append((f'_gifs_iter [{size}]', lambda g=search['gifs']: _gifs_iter(g), size))
+
+    for size in SIZES[:2]:
+        name, func, items = pagination_case(size)
+        found.append((f'{name} [{size}]', func, items))
+
+    urls = [g['urls']['sd'] for g in search_payload(1000)['gifs']]
+    ids = [g['id'] for g in search_payload(1000)['gifs']]
+    found.append(('build_file_url', lambda: [build_file_url(u) for u in urls], len(urls)))
+    found.append(('to_embed_url', lambda: [to_embed_url(u) for u in urls], len(urls)))
+    found.append(('to_web_url', lambda: [to_web_url(i) for i in ids], len(ids)))
+
+    found.append(('Route()', lambda: Route('GET', '/v2/search/trending'), 1))
+    found.append(
+        (
+            'Route(**parameters)',
+            lambda: Route(
+                'GET',
+                '/v2/gifs/search?type=g&order={order}&count={count}&page={page}&tags={search_text}',
+                search_text='Big Tits',
+                order='trending',
+                count=80,
+                page=1,
+            ),
+            1,
+        )
+    )
+
+    tags = Tags()
+    found.append(('Tags.search (exact)', lambda: tags.search('amateur'), 1))
+    found.append(('Tags.search (fuzzy)', lambda: tags.search('amatuer'), 1))
+    return found
+
+
+def main(filter: str = '') -> None:
+    print(f'{"case":<34} {"ops/s":>12} {"peak B/item":>12} {"blocks/item":>12}')
+    for name, func, items in cases():
+        if filter not in name:
+            continue
+        ops, peak, blocks = measure(func, items)
+        print(f'{name:<34} {ops:12.1f} {peak:12.1f} {blocks:12.1f}')
+
+
+if __name__ == '__main__':
+    main(sys.argv[1] if len(sys.argv) > 1 else '')
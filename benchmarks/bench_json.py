@@ -0,0 +1,54 @@
+"""
+Compares the JSON decoders that can be used for the API responses.
+
+Run it with ``python benchmarks/bench_json.py``. orjson and msgspec are only
+benchmarked when they're installed.
+"""
+
+from __future__ import annotations
+
+import json
+import timeit
+from typing import Any, Callable, Dict
+
+from payloads import creator_payload, creators_payload, search_payload
+
+
+def decoders() -> Dict[str, Callable[[bytes], Any]]:
+    found: Dict[str, Callable[[bytes], Any]] = {'json': json.loads}
+    try:
+        import orjson
+    except ImportError:
+        pass
+    else:
+        found['orjson'] = orjson.loads
+    try:
+        import msgspec
+    except ImportError:
+        pass
+    else:
+        found['msgspec'] = msgspec.json.decode
+    return found
+
+
+def main() -> None:
+    payloads = {
+        'search_gif(count=40)': search_payload(40),
+        'search_gif(count=80)': search_payload(80),
+        'search_creator(count=80)': creator_payload(80),
+        'search_creators(count=80)': creators_payload(80),
+    }
+    for name, payload in payloads.items():
+        body = json.dumps(payload).encode()
+        print(f'{name}: {len(body) / 1024:.1f} KiB')
+        baseline = None
+        for decoder_name, loads in decoders().items():
+            assert loads(body) == payload
+            number, _ = timeit.Timer(lambda: loads(body)).autorange()
+            best = min(timeit.repeat(lambda: loads(body), number=number, repeat=5)) / number
+            baseline = baseline or best
+            print(f'  {decoder_name:<8} {best * 1e6:9.1f} us/op  {baseline / best:5.2f}x')
+
+
+if __name__ == '__main__':
+    main()
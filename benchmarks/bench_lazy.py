@@ -0,0 +1,61 @@
+"""
+Compares parsing pages into eager models and into lazy models (``lazy=True``).
+
+Run it with ``python benchmarks/bench_lazy.py``. Lazy models skip computing
+``create_date`` and ``urls`` while parsing, so the savings depend on which
+attributes are read afterwards. This is measured for reading only ``id`` and
+``tags``, and for reading every attribute.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable, List
+
+from bench_core import measure
+from payloads import creator_payload, search_payload
+
+from redgifs import MediaType
+from redgifs.parser import parse_creator, parse_search
+
+SIZE = 80
+
+
+def read_ids(gifs: List[Any]) -> None:
+    for gif in gifs:
+        gif.id, gif.tags
+
+
+def read_all(gifs: List[Any]) -> None:
+    for gif in gifs:
+        gif.id, gif.tags, gif.create_date, gif.urls.web_url, gif.urls.file_url, gif.urls.embed_url
+
+
+def main() -> None:
+    search = search_payload(SIZE)
+    creator = creator_payload(SIZE)
+    parsers: List[tuple[str, Callable[[bool], List[Any]]]] = [
+        ('parse_search', lambda lazy: parse_search('amateur', search, MediaType.GIF, lazy).gifs or []),
+        ('parse_creator', lambda lazy: parse_creator(creator, MediaType.GIF, lazy).gifs),
+    ]
+
+    print(f'{"case":<44} {"ops/s":>12} {"peak B/item":>12} {"speedup":>8}')
+    for name, parse in parsers:
+        for read_name, read in (('parse only', None), ('read id, tags', read_ids), ('read all', read_all)):
+            results = []
+            for lazy in (False, True):
+
+                def run(parse: Callable[[bool], List[Any]] = parse, read: Any = read, lazy: bool = lazy) -> List[Any]:
+                    gifs = parse(lazy)
+                    if read is not None:
+                        read(gifs)
+                    return gifs
+
+                ops, peak, _ = measure(run, SIZE)
+                results.append(ops)
+                speedup = f'{ops / results[0]:7.2f}x' if lazy else ''
+                label = f'{name} [{SIZE}] {read_name}{" (lazy)" if lazy else ""}'
+                print(f'{label:<44} {ops:12.1f} {peak:12.1f} {speedup:>8}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,50 @@
+"""
+Measures the per-request cost of logging a response body.
+
+Run it with ``python benchmarks/bench_logging.py``. "before" is the f-string that used
+to format the whole body on every request, "after" is :func:`redgifs.http._log_response`.
+"""
+
+from __future__ import annotations
+
+import logging
+import timeit
+from typing import Any, Callable, Dict
+
+from payloads import search_payload
+
+from redgifs.hooks import _RequestTrace
+from redgifs.http import Route, _log, _log_response
+
+
+def before(trace: _RequestTrace, js: Dict[str, Any]) -> None:
+    _log.debug(f'{trace.method} {trace.url} returned code: {trace.status}')
+    _log.debug(f'{trace.method} {trace.url} received: {js}')
+
+
+def after(trace: _RequestTrace, js: Dict[str, Any]) -> None:
+    _log_response(trace, js)
+
+
+def bench(func: Callable[[], None]) -> float:
+    number, _ = timeit.Timer(func).autorange()
+    return min(timeit.repeat(func, number=number, repeat=5)) / number
+
+
+def main() -> None:
+    trace = _RequestTrace(Route('GET', '/v2/gifs/search?search_text={tag}', tag='Ass'), [])
+    trace.status = 200
+    js = search_payload(80)
+
+    _log.addHandler(logging.NullHandler())
+    _log.propagate = False
+    for level in (logging.WARNING, logging.DEBUG):
+        _log.setLevel(level)
+        old, new = bench(lambda: before(trace, js)), bench(lambda: after(trace, js))
+        print(f'{logging.getLevelName(level)}:')
+        print(f'  before {old * 1e6:9.2f} us/request')
+        print(f'  after  {new * 1e6:9.2f} us/request  {old / new:8.1f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,76 @@
+"""
+Measures how much a download of :class:`aio.API <redgifs.aio.API>` delays the other
+tasks of the event loop.
+
+Run it with ``python benchmarks/bench_loop_lag.py``. A ticker task sleeps for 1ms
+in a loop while the media is downloaded and records by how much every wake-up was
+late. This is compared with reading the whole response and writing it to disk on
+the event loop, which is how ``download`` worked before it was streamed.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+import asyncio
+import tempfile
+import statistics
+from typing import Awaitable, Callable, List
+
+from redgifs import AsyncReplayTransport, aio
+
+MEDIA_URL = 'https://media.redgifs.com/BoldHappyFox.mp4'
+MEDIA_SIZE = 64 * 1024 * 1024
+TICK = 0.001
+
+
+async def ticker(lags: List[float], done: asyncio.Event) -> None:
+    while not done.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(TICK)
+        lags.append(time.perf_counter() - start - TICK)
+
+
+async def measure(download: Callable[[], Awaitable[object]]) -> List[float]:
+    lags: List[float] = []
+    done = asyncio.Event()
+    task = asyncio.ensure_future(ticker(lags, done))
+    await asyncio.sleep(0)
+    try:
+        await download()
+    finally:
+        done.set()
+        await task
+    return lags
+
+
+def report(name: str, lags: List[float]) -> None:
+    lags = sorted(lags)
+    p99 = lags[min(len(lags) - 1, int(len(lags) * 0.99))]
+    print(f'{name:<24} {statistics.median(lags) * 1000:10.2f} {p99 * 1000:10.2f} {lags[-1] * 1000:10.2f}')
+
+
+async def run(path: str) -> None:
+    transport = AsyncReplayTransport()
+    transport.add('GET', MEDIA_URL, os.urandom(MEDIA_SIZE), headers={'Content-Type': 'video/mp4'})
+    api = aio.API(transport=transport)
+
+    async def buffered() -> int:
+        async with transport.request('GET', MEDIA_URL) as r:
+            data = await r.read()
+        with open(path, 'wb') as f:
+            return f.write(data)
+
+    print(f'{"lag (ms)":<24} {"median":>10} {"p99":>10} {"max":>10}')
+    report('read() + write()', await measure(buffered))
+    report('aio.API.download()', await measure(lambda: api.download(MEDIA_URL, path)))
+    await api.close()
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        asyncio.run(run(os.path.join(tmp, 'media.mp4')))
+
+
+if __name__ == '__main__':
+    main()
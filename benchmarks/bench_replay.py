@@ -0,0 +1,89 @@
+"""
+Benchmarks whole API calls and downloads without a network, using the replay transports.
+
+Run it with ``python benchmarks/bench_replay.py``. Every request is answered from
+synthesized fixtures, so the numbers only include the client's own overhead:
+routing, decoding, parsing and writing the media to disk.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+import asyncio
+import tempfile
+from typing import Callable
+
+from payloads import creator_payload, search_payload
+
+from redgifs import API, AsyncReplayTransport, Order, ReplayTransport, Tags, aio
+from redgifs.http import Route
+
+MEDIA_URL = 'https://media.redgifs.com/BoldHappyFox.mp4'
+MEDIA_SIZE = 32 * 1024 * 1024
+
+
+def add_fixtures(transport: ReplayTransport | AsyncReplayTransport) -> None:
+    tag = Tags().search('amateur')[0]
+    search = Route(
+        'GET',
+        '/v2/gifs/search?type=g&order={order}&count={count}&page={page}&tags={search_text}',
+        search_text=tag,
+        order=Order.TRENDING.value,
+        count=80,
+        page=1,
+    )
+    creator = Route(
+        'GET',
+        '/v2/users/{username}/search?page={page}&count={count}&order={order}&type={type}',
+        username='someone',
+        page=1,
+        count=80,
+        order=Order.RECENT.value,
+        type='g',
+    )
+    transport.add('GET', search.url, search_payload(80))
+    transport.add('GET', creator.url, creator_payload(80))
+    transport.add('GET', MEDIA_URL, os.urandom(MEDIA_SIZE), headers={'Content-Type': 'video/mp4', 'Accept-Ranges': 'bytes'})
+
+
+def report(name: str, func: Callable[[], object], number: int) -> None:
+    start = time.perf_counter()
+    for _ in range(number):
+        func()
+    elapsed = time.perf_counter() - start
+    print(f'{name:<32} {number / elapsed:10.1f} ops/s')
+
+
+def main() -> None:
+    transport = ReplayTransport()
+    add_fixtures(transport)
+    api = API(transport=transport)
+    report('API.search(count=80)', lambda: api.search('amateur', count=80), 200)
+    report('API.search_creator(count=80)', lambda: api.search_creator('someone', count=80), 200)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'media.mp4')
+        for segments in (1, 4):
+            start = time.perf_counter()
+            api.download(MEDIA_URL, path, segments=segments)
+            elapsed = time.perf_counter() - start
+            print(f'{f"API.download(segments={segments})":<32} {MEDIA_SIZE / elapsed / 1024**2:10.1f} MiB/s')
+
+        async def run() -> None:
+            transport = AsyncReplayTransport()
+            add_fixtures(transport)
+            api = aio.API(transport=transport)
+            start = time.perf_counter()
+            await asyncio.gather(*(api.search('amateur', count=80) for _ in range(200)))
+            print(f'{"aio.API.search(count=80) x200":<32} {200 / (time.perf_counter() - start):10.1f} ops/s')
+            start = time.perf_counter()
+            await api.download(MEDIA_URL, path)
+            print(f'{"aio.API.download()":<32} {MEDIA_SIZE / (time.perf_counter() - start) / 1024**2:10.1f} MiB/s')
+            await api.close()
+
+        asyncio.run(run())
+
+
+if __name__ == '__main__':
+    main()
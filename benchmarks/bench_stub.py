@@ -0,0 +1,76 @@
+"""
+Load tests the async client against the local stub server.
+
+Run it with ``python benchmarks/bench_stub.py [--requests N] [--concurrency N] [--latency S]``.
+Requests go through the real network stack (aiohttp, the connection pool, retries
+and rate limit handling), only RedGifs is replaced by :class:`redgifs.stub.StubServer`.
+"""
+
+from __future__ import annotations
+
+import time
+import asyncio
+import argparse
+import tempfile
+
+from redgifs import RequestStats, RetryPolicy, aio
+from redgifs.http import Route
+from redgifs.stub import StubServer
+
+
+async def main(requests: int, concurrency: int, latency: float, error_rate: float, downloads: int) -> None:
+    async with StubServer(
+        latency=latency, error_rate=error_rate, rate_limit_rate=error_rate / 2, retry_after=0.01
+    ) as server:
+        Route.BASE = server.url
+        stats = RequestStats()
+        api = aio.API(hooks=[stats], retry=RetryPolicy(max_retries=10, backoff_base=0.01, backoff_max=0.1))
+        await api.login()
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def call(i: int) -> None:
+            async with semaphore:
+                # Distinct pages so that requests are not coalesced
+                await api.search_creator(f'user{i % 100}', page=i // 100 + 1, count=80)
+
+        start = time.perf_counter()
+        await asyncio.gather(*(call(i) for i in range(requests)))
+        elapsed = time.perf_counter() - start
+        print(f'{requests} API calls, concurrency {concurrency}: {requests / elapsed:.1f} req/s')
+
+        for route, route_stats in stats.routes.items():
+            print(
+                f'  {route}: count={route_stats.count} mean={route_stats.mean * 1000:.1f}ms '
+                f'p50<={route_stats.percentile(50) * 1000:.0f}ms p99<={route_stats.percentile(99) * 1000:.0f}ms '
+                f'retries={route_stats.retries} errors={dict(route_stats.errors)}'
+            )
+
+        # A whole creator export, with the pages after the first one requested one by one or concurrently
+        for prefetch, ordered in ((0, True), (1, True), (10, True), (10, False)):
+            start = time.perf_counter()
+            gifs = [gif async for gif in api.iter_creator('export', count=80, prefetch=prefetch, ordered=ordered)]
+            elapsed = time.perf_counter() - start
+            print(f'iter_creator(prefetch={prefetch}, ordered={ordered}): {len(gifs)} GIFs in {elapsed * 1000:.0f}ms')
+
+        with tempfile.TemporaryDirectory() as tmp:
+            start = time.perf_counter()
+            sizes = await asyncio.gather(
+                *(api.download(f'{server.url}/media/File{i}.mp4', f'{tmp}/{i}.mp4') for i in range(downloads))
+            )
+            elapsed = time.perf_counter() - start
+            print(f'{downloads} downloads: {sum(sizes) / elapsed / 1024**2:.1f} MiB/s')
+
+        await api.close()
+        print(f'Stub server received: {sum(server.requests.values())} requests')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--requests', type=int, default=2000)
+    parser.add_argument('--concurrency', type=int, default=100)
+    parser.add_argument('--latency', type=float, default=0.02)
+    parser.add_argument('--error-rate', type=float, default=0.02)
+    parser.add_argument('--downloads', type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.concurrency, args.latency, args.error_rate, args.downloads))
@@ -0,0 +1,17 @@
+"""
+Synthesized RedGifs API payloads for the benchmarks.
+
+The payloads follow the shape of the real responses (see ``redgifs/types``)
+and are deterministic, so every run benchmarks the same data. They are the
+same payloads that the stub server (``redgifs.stub``) answers with.
+"""
+
+from redgifs.stub import (  # noqa: F401
+    creator_payload,
+    creators_payload,
+    make_gif,
+    make_niche,
+    make_user,
+    niches_payload,
+    search_payload,
+)
@@ -0,0 +1,31 @@
+"""
+Runs every benchmark in this directory, one after another.
+
+Run it with ``python benchmarks/run.py``. Pass the names of some benchmarks to
+only run those, e.g. ``python benchmarks/run.py core json``.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import subprocess
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def main(names: list[str]) -> int:
+    scripts = sorted(f for f in os.listdir(HERE) if f.startswith('bench_') and f.endswith('.py'))
+    if names:
+        scripts = [s for s in scripts if s[len('bench_') : -len('.py')] in names]
+
+    failed = 0
+    for script in scripts:
+        print(f'== {script} ==', flush=True)
+        failed += subprocess.call([sys.executable, os.path.join(HERE, script)], cwd=HERE) != 0
+        print(flush=True)
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
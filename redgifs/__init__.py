@@ -32,6 +32,12 @@ from typing import Literal, NamedTuple
 
 from .api import *
 from .http import *
+from .auth import *
+from .ratelimit import *
+from .cache import *
+from .hooks import *
+from .transport import *
+from .iterators import *
 from .enums import *
 from .tags import *
 from .errors import *
@@ -29,7 +29,7 @@ import sys
 import platform
 import itertools
 from pathlib import Path
-from typing import Iterable, Optional, TYPE_CHECKING
+from typing import Iterable, List, Optional, TYPE_CHECKING
 
 import click
 import yarl
@@ -42,21 +42,21 @@ if TYPE_CHECKING:
     from redgifs.models import GIF, Image
 
 
-def download_gif(client: API, url: yarl.URL, quality: str, folder: Optional[Path], *, skip_check: bool = False):
+def _gif_id(url: yarl.URL, *, skip_check: bool = False) -> str:
     # If skip_check is true then this will be the GIF's ID and splitting the URL is not required
-    id = str(url).lower() if skip_check else url.path.split('/')[-1]
-    click.echo(f'Downloading {id}...')
-    gif = client.get_gif(id)
-    gif_url = gif.urls.sd if quality == 'sd' else (gif.urls.hd or gif.urls.sd)
+    return str(url).lower() if skip_check else url.path.split('/')[-1]
 
-    if gif_url is None:  # guard clause
-        click.echo(f'No URL available for GIF {id}, skipping.')
-        return
 
-    filename = f'{gif_url.split("/")[3].split(".")[0]}.mp4'
-    dir_ = f'{folder}/{filename}' if folder else filename
-    client.download(gif_url, dir_)
-    click.echo('Download complete.')
+def download_gifs(client: API, ids: List[str], quality: str, folder: Optional[Path]):
+    # All the GIFs are looked up at once, a hundred per request
+    for id, gif in client.get_gifs(ids).items():
+        if gif is None:
+            click.echo(f'GIF {id} was not found, skipping.')
+            continue
+
+        click.echo(f'Downloading {id}...')
+        _dl_with_args(client, gif, quality, folder, False)
+        click.echo('Download complete.')
 
 
 def _dl_with_args(client: API, gif: GIF | Image, quality: str, folder: Optional[Path], is_image: bool):
@@ -87,36 +87,24 @@ def download_users_gifs(client: API, url: yarl.URL, quality: str, folder: Option
     user = match.groupdict()['username']
 
     media_type = MediaType.IMAGE if is_image else MediaType.GIF
-    data = client.search_creator(user, type=media_type)
-
-    curr_page = data.page
-    total_pages = data.pages
-    media_items = data.images if is_image else data.gifs
-    total = data.total
+    # The next page is requested in the background while the current one is downloaded
+    items = client.iter_creator(user, type=media_type)
     done = 0
 
     spinner = itertools.cycle(['-', '\\', '|', '/'])
 
-    while curr_page <= total_pages:
-        for item in media_items:
-            try:
-                _dl_with_args(client, item, quality, folder, is_image)
-                done += 1
-                click.echo(f'\r{next(spinner)} Downloading {done}/{total} {"images" if is_image else "GIFs"}...', nl=False)
-            except Exception as e:
-                click.echo(f'[!] An error occurred when downloading {url}: {e}\nContinuing...')
-                continue
-
-        if curr_page == total_pages:
-            break
-
-        curr_page += 1
-        data = client.search_creator(user, page=curr_page, type=media_type)
-        media_items = data.images if is_image else data.gifs
+    for item in items:
+        try:
+            _dl_with_args(client, item, quality, folder, is_image)
+            done += 1
+            click.echo(f'\r{next(spinner)} Downloading {done}/{items.total} {"images" if is_image else "GIFs"}...', nl=False)
+        except Exception as e:
+            click.echo(f'[!] An error occurred when downloading {url}: {e}\nContinuing...')
+            continue
 
     folder_info = f"to folder '{folder}'" if folder else ''
     click.echo(
-        f'\r[-] Downloaded {done}/{total} {"images" if is_image else "GIFs"} of user {user} {folder_info} successfully!'
+        f'\r[-] Downloaded {done}/{items.total} {"images" if is_image else "GIFs"} of user {user} {folder_info} successfully!'
     )
 
 
@@ -171,17 +159,26 @@ def cli(
 
     if file:
         with open(file) as f:
-            [download_gif(client, url, quality, folder) for url in [yarl.URL(line) for line in f.readlines()]]
+            lines = [line.strip() for line in f]
+        download_gifs(client, [_gif_id(yarl.URL(line)) for line in lines if line], quality, folder)
 
+    ids: List[str] = []
+    users: List[yarl.URL] = []
     for url in urls:
         url = yarl.URL(url)
         if 'redgifs' not in str(url.host):
-            download_gif(client, url, quality, folder, skip_check=True)
+            ids.append(_gif_id(url, skip_check=True))
 
         # Handle 'normal' URLs, i.e, a direct link (eg: "https://redgifs.com/watch/deeznuts")
         if '/watch/' in url.path:
-            download_gif(client, url, quality, folder)
+            ids.append(_gif_id(url))
 
         # Handle /users/ URLs (eg: https://redgifs.com/users/redgifs)
         if '/users/' in url.path:
-            download_users_gifs(client, url, quality, folder, images)
+            users.append(url)
+
+    if ids:
+        download_gifs(client, ids, quality, folder)
+
+    for url in users:
+        download_users_gifs(client, url, quality, folder, images)
@@ -26,21 +26,112 @@ from __future__ import annotations
 
 import io
 import os
+import asyncio
 from datetime import datetime, timezone
-from typing import TYPE_CHECKING, Any, List, Optional, Union
+from collections import deque
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    List,
+    Literal,
+    Optional,
+    Sequence,
+    TypeVar,
+    Union,
+)
 
 import aiohttp
 
-from .http import AsyncHttp, ProxyAuth
+from .http import AsyncHttp, ProxyAuth, PoolLimits, RetryPolicy
+from .auth import TokenStore
+from .cache import BaseCache
+from .hooks import RequestHook
+from .transport import AsyncTransport
+from .ratelimit import RateLimiter
+from .iterators import AsyncPageIterator
+from .const import DOWNLOAD_CHUNK_SIZE, GIFS_CHUNK_SIZE
 from .tags import Tags
 from .enums import Order, MediaType, NicheOrder, NicheGifOrder
 from .utils import _async_read_tags_json, build_file_url, _gifs_iter, _images_iter, to_embed_url, to_web_url
 from .parser import parse_search, parse_creator, parse_creators, parse_search_image, parse_search_niche
-from .models import GIF, URL, CreatorResult, Image, SearchResult, CreatorsResult, TagSuggestion, User, NicheResult
+from .parser import (
+    gif_record,
+    image_record,
+    user_record,
+    parse_lightweight,
+    parse_search_records,
+    parse_search_image_records,
+    parse_creator_records,
+    parse_creators_records,
+)
+from .models import (
+    GIF,
+    URL,
+    BulkResult,
+    CreatorResult,
+    Image,
+    SearchResult,
+    CreatorsResult,
+    TagSuggestion,
+    User,
+    NicheResult,
+)
 
 if TYPE_CHECKING:
+    from redgifs.types.gif import GifInfo
     from redgifs.types.tags import TagInfo
 
+T = TypeVar('T')
+
+_MISSING: Any = object()
+
+
+async def _bulk(
+    keys: Iterable[Any], func: Callable[[Any], Awaitable[T]], concurrency: int, ordered: bool
+) -> AsyncIterator[BulkResult[T]]:
+    async def run(key: Any) -> BulkResult[T]:
+        try:
+            return BulkResult(key, await func(key), None)
+        except Exception as e:
+            return BulkResult(key, None, e)
+
+    # At most `concurrency` items are requested at once, the next one starts when one of them is done
+    keys = iter(keys)
+    pending: Deque[asyncio.Task[BulkResult[T]]] = deque()
+
+    def fill() -> None:
+        while len(pending) < max(1, concurrency):
+            key = next(keys, _MISSING)
+            if key is _MISSING:
+                return
+            pending.append(asyncio.ensure_future(run(key)))
+
+    try:
+        fill()
+        while pending:
+            if ordered:
+                result = await pending.popleft()
+                fill()
+                yield result
+            else:
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    pending.remove(task)
+                fill()
+                for task in done:
+                    yield task.result()
+    finally:
+        for task in pending:
+            task.cancel()
+        # Wait for the cancelled requests so that no task is destroyed while it's pending
+        await asyncio.gather(*pending, return_exceptions=True)
+
 
 class API:
     """The API Instance to get information from the RedGifs API.
@@ -54,6 +145,45 @@ class API:
         A valid proxy URL.
     proxy_auth: Optional[:class:`.ProxyAuth`]
         The proxy auth to provide if the proxy requires it.
+    limits: Optional[:class:`.PoolLimits`]
+        The connection pool limits for API calls to ``api.redgifs.com``.
+        It can't be used with ``session``, which keeps the limits of its own connector.
+    media_limits: Optional[:class:`.PoolLimits`]
+        The connection pool limits for media downloads from the ``thumbs*.redgifs.com`` hosts.
+        These are kept separate from ``limits`` so that downloads never starve API calls.
+        When ``session`` is given, media is downloaded with it unless this is given too.
+    token_store: Optional[:class:`.TokenStore`]
+        Where to save the temporary token from :py:meth:`login`. A saved token that is
+        still valid is reused instead of requesting a new one, even by other processes.
+    rate_limiter: Optional[:class:`.RateLimiter`]
+        Paces all the requests made by this client so it's not rate limited by RedGifs.
+    retry: Optional[:class:`.RetryPolicy`]
+        How to retry requests that failed because of a connection error, a timeout,
+        a 429 or a 5xx status. Pass ``None`` to never retry.
+    cache: Optional[Union[:class:`.ResponseCache`, :class:`.SQLiteCache`]]
+        A cache for the API responses. Repeated calls with the same arguments are
+        served from it until the cached response expires.
+    hooks: Sequence[:class:`.RequestHook`]
+        Hooks that are called when a request starts, ends or fails, e.g. a :class:`.RequestStats`
+        to keep latency histograms and error counts per route.
+    json_loads: Optional[Callable[[:class:`bytes`], Any]]
+        The function used to decode the API responses from their raw bytes.
+        Defaults to ``orjson.loads`` or ``msgspec.json.decode`` when one of them is
+        installed, otherwise :func:`json.loads`.
+    transport: Optional[:class:`.AsyncTransport`]
+        The transport that sends the requests, e.g. a :class:`.AsyncReplayTransport`
+        to answer them with canned responses. ``session``, ``limits`` and
+        ``media_limits`` are ignored when it's given.
+    lazy: :class:`bool`
+        Whether the search methods return :class:`.LazyGIF` and :class:`.LazyImage` objects,
+        which only compute their ``create_date`` and ``urls`` when they're accessed.
+        This makes parsing large pages faster when only some attributes are used. Defaults to ``False``.
+    result_format: :class:`str`
+        The form of the results returned by the API methods. ``'model'`` returns the usual
+        models, ``'tuple'`` returns :class:`.GIFRecord`, :class:`.ImageRecord` and :class:`.UserRecord`
+        named tuples in the usual result containers, and ``'raw'`` returns the decoded JSON as is.
+        The results of :meth:`search_niches` and :meth:`fetch_tag_suggestions` are dicts already,
+        so they ignore ``'tuple'``. ``lazy`` only applies to ``'model'``. Defaults to ``'model'``.
     """
 
     def __init__(
@@ -62,9 +192,38 @@ class API:
         *,
         proxy: Optional[str] = None,
         proxy_auth: Optional[ProxyAuth] = None,
+        limits: Optional[PoolLimits] = None,
+        media_limits: Optional[PoolLimits] = None,
+        token_store: Optional[TokenStore] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry: Optional[RetryPolicy] = RetryPolicy(),
+        cache: Optional[BaseCache] = None,
+        hooks: Sequence[RequestHook] = (),
+        json_loads: Optional[Callable[[bytes], Any]] = None,
+        transport: Optional[AsyncTransport] = None,
+        lazy: bool = False,
+        result_format: Literal['model', 'tuple', 'raw'] = 'model',
     ) -> None:
-        self.http: AsyncHttp = AsyncHttp(session, proxy=proxy, proxy_auth=proxy_auth)
+        if result_format not in ('model', 'tuple', 'raw'):
+            raise ValueError(f"result_format must be 'model', 'tuple' or 'raw', not {result_format!r}")
+
+        self.http: AsyncHttp = AsyncHttp(
+            session,
+            proxy=proxy,
+            proxy_auth=proxy_auth,
+            limits=limits,
+            media_limits=media_limits,
+            token_store=token_store,
+            rate_limiter=rate_limiter,
+            retry=retry,
+            cache=cache,
+            hooks=hooks,
+            json_loads=json_loads,
+            transport=transport,
+        )
         self._tags = Tags()
+        self.lazy: bool = lazy
+        self.result_format: str = result_format
 
     async def login(self) -> 'API':
         """
@@ -89,7 +248,7 @@ class API:
         resp = await self.http.get_tags()
         return resp['tags']
 
-    async def get_gif(self, id: str) -> GIF:
+    async def get_gif(self, id: str) -> Union[GIF, Any]:
         """
         Get details of a single GIF using its ID.
 
@@ -102,9 +261,14 @@ class API:
 
         Returns
         -------
-        :class:`.GIF` - The GIF's info.
+        Union[:class:`.GIF`, :class:`.GIFRecord`] - The GIF's info.
+        With ``result_format='raw'`` this is the decoded JSON instead.
         """
-        json = (await self.http.get_gif(id))['gif']
+        resp = await self.http.get_gif(id)
+        if self.result_format != 'model':
+            return parse_lightweight(self.result_format, resp, lambda json: gif_record(json['gif']))
+
+        json = resp['gif']
         urls = json['urls']
         return GIF(
             id=json['id'],
@@ -133,32 +297,80 @@ class API:
             avg_color=json['avgColor'],
         )
 
-    async def get_trending_gifs(self) -> List[GIF]:
+    async def get_gifs(
+        self, ids: Iterable[str], *, chunk_size: int = GIFS_CHUNK_SIZE, concurrency: int = 4
+    ) -> Dict[str, Optional[Union[GIF, Any]]]:
+        """
+        Get details of multiple GIFs using their IDs.
+
+        This looks up ``chunk_size`` GIFs per request instead of making a request
+        for every GIF like :meth:`get_gif` does. The chunks are requested concurrently.
+
+        Parameters
+        ----------
+        ids: Iterable[:class:`str`]
+            The IDs of the GIFs. Duplicate IDs are only looked up once.
+        chunk_size: :class:`int`
+            The amount of GIFs to look up per request. Defaults to 100.
+        concurrency: :class:`int`
+            The maximum amount of requests to make at once. Defaults to 4.
+
+        Returns
+        -------
+        Dict[:class:`str`, Optional[:class:`.GIF`]] - The GIFs by their ID, in the order of ``ids``.
+        The value is ``None`` if the GIF was not found. Depending on ``result_format``,
+        the values are :class:`.GIFRecord` objects or the decoded JSON of each GIF.
+        """
+
+        ids = list(dict.fromkeys(ids))
+        unique = list(dict.fromkeys(id.lower() for id in ids))
+        chunks = [unique[i : i + chunk_size] for i in range(0, len(unique), chunk_size)]
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def fetch(chunk: List[str]) -> List[GifInfo]:
+            async with semaphore:
+                return (await self.http.get_gifs(chunk))['gifs']
+
+        results = await asyncio.gather(*(fetch(chunk) for chunk in chunks))
+        found: Dict[str, Any] = {gif['id'].lower(): gif for gifs in results for gif in gifs}
+        if self.result_format == 'tuple':
+            found = {id: gif_record(gif) for id, gif in found.items()}
+        elif self.result_format == 'model':
+            found = dict(zip(found, _gifs_iter(list(found.values()), self.lazy)))
+        return {id: found.get(id.lower()) for id in ids}
+
+    async def get_trending_gifs(self) -> Union[List[GIF], Any]:
         """
         Get the top 10 trending GIFs on RedGifs.
 
         Returns
         -------
-        List[:class:`.GIF`]
+        Union[List[:class:`.GIF`], List[:class:`.GIFRecord`]]
+        With ``result_format='raw'`` this is the decoded JSON instead.
         
         .. deprecated:: 2.5.0
             This method will be removed in the next version.
         """
         import warnings
         warnings.warn("This method will be removed in the next version.", DeprecationWarning, stacklevel=2)
-        r = (await self.http.get_trending_gifs())['gifs']
-        return _gifs_iter(r)
+        resp = await self.http.get_trending_gifs()
+        if self.result_format != 'model':
+            return parse_lightweight(self.result_format, resp, lambda json: [gif_record(gif) for gif in json['gifs']])
+        return _gifs_iter(resp['gifs'], self.lazy)
 
-    async def get_trending_images(self) -> List[Image]:
+    async def get_trending_images(self) -> Union[List[Image], Any]:
         """
         Get the top 10 trending images on RedGifs.
 
         Returns
         -------
-        List[:class:`.Image`]
+        Union[List[:class:`.Image`], List[:class:`.ImageRecord`]]
+        With ``result_format='raw'`` this is the decoded JSON instead.
         """
-        r = (await self.http.get_trending_images())['gifs']
-        return _images_iter(r)
+        resp = await self.http.get_trending_images()
+        if self.result_format != 'model':
+            return parse_lightweight(self.result_format, resp, lambda json: [image_record(img) for img in json['gifs']])
+        return _images_iter(resp['gifs'], self.lazy)
 
     async def get_trending_tags(self) -> List[TagInfo]:
         """Get the trending searches on RedGifs.
@@ -183,7 +395,9 @@ class API:
         result = (await self.http.get_trending_tags())['tags']
         return result
 
-    async def get_top_this_week(self, count: int = 30, page: int = 1, type: MediaType = MediaType.GIF) -> SearchResult:
+    async def get_top_this_week(
+        self, count: int = 30, page: int = 1, type: MediaType = MediaType.GIF
+    ) -> Union[SearchResult, Any]:
         """Get media from "Top This Week" section.
 
         Parameters
@@ -197,12 +411,15 @@ class API:
 
         Returns
         -------
-        :class:`.SearchResult` - Top this week results.
+        :class:`.SearchResult` - Top this week results. Its items are records with ``result_format='tuple'``.
+        With ``result_format='raw'`` this is the decoded JSON instead.
         """
         resp = await self.http.get_top_this_week(count, page, type)
-        return parse_search('TopThisWeek', resp, type)
+        if self.result_format != 'model':
+            return parse_lightweight(self.result_format, resp, lambda json: parse_search_records('TopThisWeek', json, type))
+        return parse_search('TopThisWeek', resp, type, self.lazy)
 
-    async def fetch_tag_suggestions(self, query: str) -> List[TagSuggestion]:
+    async def fetch_tag_suggestions(self, query: str) -> Union[List[TagSuggestion], Any]:
         """Get tag suggestions from RedGifs.
 
         .. note::
@@ -217,10 +434,14 @@ class API:
         Returns
         -------
         List[:class:`.TagSuggestion`] - A list of ``TagSuggestion`` with tag name and count.
+        These are dicts already, so ``result_format='tuple'`` is ignored.
+        With ``result_format='raw'`` this is the decoded JSON instead.
         """
 
         result = await self.http.get_tag_suggestions(query)
-        return [TagSuggestion(name=d['text'], count=d['gifs']) for d in result]
+        return parse_lightweight(
+            self.result_format, result, lambda json: [TagSuggestion(name=d['text'], count=d['gifs']) for d in json]
+        )
 
     async def search(
         self,
@@ -229,7 +450,7 @@ class API:
         order: Order = Order.TRENDING,
         count: int = 40,
         page: int = 1,
-    ) -> SearchResult:
+    ) -> Union[SearchResult, Any]:
         """
         Search for GIFs.
 
@@ -246,7 +467,8 @@ class API:
 
         Returns
         -------
-        :class:`.SearchResult` - The search result.
+        :class:`.SearchResult` - The search result. Its items are records with ``result_format='tuple'``.
+        With ``result_format='raw'`` this is the decoded JSON instead.
         """
         if len(self._tags.tags_mapping) == 0:
             tags = await _async_read_tags_json()
@@ -256,7 +478,9 @@ class API:
 
         st = '+'.join(new_tags)
         resp = await self.http.search(st, order, count, page)
-        return parse_search(st, resp, MediaType.GIF)
+        if self.result_format != 'model':
+            return parse_lightweight(self.result_format, resp, lambda json: parse_search_records(st, json, MediaType.GIF))
+        return parse_search(st, resp, MediaType.GIF, self.lazy)
 
     search_gif = search
 
@@ -267,7 +491,7 @@ class API:
         order: Order = Order.RECENT,
         verified: bool = False,
         tags: Optional[List[str]] = None,
-    ) -> CreatorsResult:
+    ) -> Union[CreatorsResult, Any]:
         """
         Search for some RedGifs Creators.
 
@@ -285,9 +509,12 @@ class API:
 
         Returns
         -------
-        :class:`.CreatorsResult` - The search result.
+        :class:`.CreatorsResult` - The search result. Its items are records with ``result_format='tuple'``.
+        With ``result_format='raw'`` this is the decoded JSON instead.
         """
         resp = await self.http.search_creators(page=page, order=order, verified=verified, tags=tags)
+        if self.result_format != 'model':
+            return parse_lightweight(self.result_format, resp, lambda json: parse_creators_records(json))
         return parse_creators(resp)
 
     async def search_creator(
@@ -298,7 +525,7 @@ class API:
         count: int = 80,
         order: Order = Order.RECENT,
         type: MediaType = MediaType.GIF,
-    ) -> CreatorResult:
+    ) -> Union[CreatorResult, Any]:
         """
         Search for a single RedGifs creator/user by username.
 
@@ -317,14 +544,17 @@ class API:
 
         Returns
         -------
-        :class:`.CreatorResult` - The creator/user searched for.
+        :class:`.CreatorResult` - The creator/user searched for. Its items are records with ``result_format='tuple'``.
+        With ``result_format='raw'`` this is the decoded JSON instead.
         """
         resp = await self.http.search_creator(username=username, page=page, count=count, order=order, type=type)
-        return parse_creator(resp, type)
+        if self.result_format != 'model':
+            return parse_lightweight(self.result_format, resp, lambda json: parse_creator_records(json, type))
+        return parse_creator(resp, type, self.lazy)
 
     search_user = search_creator
 
-    async def get_user(self, username: str):
+    async def get_user(self, username: str) -> Union[User, Any]:
         """
         Get details of a user on RedGifs.
 
@@ -335,9 +565,12 @@ class API:
 
         Returns
         -------
-        :class:`.User` - The user's details
+        Union[:class:`.User`, :class:`.UserRecord`] - The user's details.
+        With ``result_format='raw'`` this is the decoded JSON instead.
         """
         resp = await self.http.get_user(username)
+        if self.result_format != 'model':
+            return parse_lightweight(self.result_format, resp, lambda json: user_record(json))
         return User(
             creation_time=datetime.fromtimestamp(resp['creationtime'], tz=timezone.utc),
             description=resp.get('description'),
@@ -368,7 +601,7 @@ class API:
         order: Order = Order.TRENDING,
         count: int = 40,
         page: int = 1,
-    ) -> SearchResult:
+    ) -> Union[SearchResult, Any]:
         """
         Search for images.
 
@@ -385,14 +618,25 @@ class API:
 
         Returns
         -------
-        :class:`.SearchResult` - The search result.
+        :class:`.SearchResult` - The search result. Its items are records with ``result_format='tuple'``.
+        With ``result_format='raw'`` this is the decoded JSON instead.
         """
         # We are not going to use Tags.search() here because it doesn't matter
         # whatever the search_text is, this API endpoints provides images nonetheless.
         resp = await self.http.search_image(search_text, order, count, page)
-        return parse_search_image(search_text, resp)
+        if self.result_format != 'model':
+            return parse_lightweight(self.result_format, resp, lambda json: parse_search_image_records(search_text, json))
+        return parse_search_image(search_text, resp, self.lazy)
 
-    async def download(self, url: str, fp: Union[str, bytes, os.PathLike[Any], io.BufferedIOBase]) -> int:
+    async def download(
+        self,
+        url: str,
+        fp: Union[str, bytes, os.PathLike[Any], io.BufferedIOBase],
+        *,
+        chunk_size: int = DOWNLOAD_CHUNK_SIZE,
+        resume: bool = False,
+        segments: int = 1,
+    ) -> int:
         """
         A friendly method to download a RedGifs media.
 
@@ -421,10 +665,37 @@ class API:
             The file-like object to save this asset to or the filename
             to use. If a filename is passed then a file is created with that
             filename and used instead.
+        chunk_size: Optional[:class:`int`]
+            The amount of bytes to read from the response before writing them to ``fp``.
+            Writes are done in a separate thread so the event loop is not blocked
+            while the media is saved. Defaults to 64 KiB.
+
+        resume: Optional[:class:`bool`]
+            Whether to make the download resumable. The media is first written to
+            a ``<fp>.part`` file which is renamed to ``fp`` once it's complete. If the
+            download is interrupted, calling this method again continues from where it
+            stopped instead of downloading the whole media again. ``fp`` must be a filename.
+        segments: Optional[:class:`int`]
+            The number of byte ranges to split the media into and download concurrently.
+            Each range is written at its own offset of ``fp``, which must be a filename.
+            If RedGifs does not allow range requests for the media, it's downloaded with
+            a single stream instead. Cannot be used with ``resume``. Defaults to 1.
+
+        Returns
+        -------
+        :class:`int` - The amount of bytes written. When resuming, this is the size of the complete media.
+
+        Raises
+        ------
+        :class:`.RedGifsError`
+            The resumed download did not match the size sent by RedGifs.
+            The ``.part`` file is kept so the download can be resumed again.
         """
-        return await self.http.download(url, fp)
+        return await self.http.download(url, fp, chunk_size=chunk_size, resume=resume, segments=segments)
 
-    async def search_niches(self, query: str, *, order: NicheOrder = NicheOrder.BEST_MATCH, count: int = 40, page: int = 1) -> NicheResult:
+    async def search_niches(
+        self, query: str, *, order: NicheOrder = NicheOrder.BEST_MATCH, count: int = 40, page: int = 1
+    ) -> Union[NicheResult, Any]:
         """
         Search for niches.
 
@@ -441,12 +712,15 @@ class API:
 
         Returns
         -------
-        :class:`.NicheResult` - The search result.
+        :class:`.NicheResult` - The search result. The niches are dicts already,
+        so ``result_format='tuple'`` is ignored. With ``result_format='raw'`` this is the decoded JSON instead.
         """
         resp = await self.http.search_niches(query, order, count, page)
-        return parse_search_niche(query, resp)
+        return parse_lightweight(self.result_format, resp, lambda json: parse_search_niche(query, json))
 
-    async def get_niche(self, niche_id: str, *, order: NicheGifOrder = NicheGifOrder.TRENDING, count: int = 40, page: int = 1) -> SearchResult:
+    async def get_niche(
+        self, niche_id: str, *, order: NicheGifOrder = NicheGifOrder.TRENDING, count: int = 40, page: int = 1
+    ) -> Union[SearchResult, Any]:
         """
         Search for a single niche's GIFs
 
@@ -463,10 +737,304 @@ class API:
 
         Returns
         -------
-        :class:`.SearchResult` - The search result.
+        :class:`.SearchResult` - The search result. Its items are records with ``result_format='tuple'``.
+        With ``result_format='raw'`` this is the decoded JSON instead.
         """
         resp = await self.http.get_niche(niche_id, order, count, page)
-        return parse_search(niche_id, resp, MediaType.GIF)
+        if self.result_format != 'model':
+            return parse_lightweight(
+                self.result_format, resp, lambda json: parse_search_records(niche_id, json, MediaType.GIF)
+            )
+        return parse_search(niche_id, resp, MediaType.GIF, self.lazy)
+
+    def get_users(
+        self, usernames: Iterable[str], *, concurrency: int = 8, ordered: bool = True
+    ) -> AsyncIterator[BulkResult[Union[User, Any]]]:
+        """
+        Get details of multiple users on RedGifs.
+
+        This is an async iterator, use it with ``async for``:
+
+        .. code-block:: python3
+
+            async for item in api.get_users(['user1', 'user2']):
+                if item.ok:
+                    print(item.key, item.result.followers)
+                else:
+                    print(f'{item.key} failed: {item.error}')
+
+        Parameters
+        ----------
+        usernames: Iterable[:class:`str`]
+            The usernames of the users.
+        concurrency: :class:`int`
+            The maximum amount of users to request at once. Defaults to 8.
+        ordered: :class:`bool`
+            Whether to yield the results in the order of ``usernames``. If ``False``,
+            they're yielded as soon as they're done. Defaults to ``True``.
+
+        Yields
+        ------
+        :class:`.BulkResult` - The :class:`.User` of every username, or the error raised for it.
+        Each result follows ``result_format`` like the method it comes from.
+        """
+        return _bulk(usernames, self.get_user, concurrency, ordered)
+
+    def search_many(
+        self,
+        search_texts: Iterable[Union[str, List[str]]],
+        *,
+        order: Order = Order.TRENDING,
+        count: int = 40,
+        page: int = 1,
+        concurrency: int = 8,
+        ordered: bool = True,
+    ) -> AsyncIterator[BulkResult[Union[SearchResult, Any]]]:
+        """
+        Search for GIFs with multiple searches.
+
+        This is an async iterator, see :meth:`get_users` for an example.
+
+        Parameters
+        ----------
+        search_texts: Iterable[Union[:class:`str`, List[:class:`str`]]]
+            The searches to do. Each one is passed to :meth:`search`.
+        order: Optional[:class:`.Order`]
+            The order of the GIFs to return.
+        count: Optional[:class:`int`]
+            The amount of GIFs to return per search.
+        page: Optional[:class:`int`]
+            The page number of the GIFs to return.
+        concurrency: :class:`int`
+            The maximum amount of searches to do at once. Defaults to 8.
+        ordered: :class:`bool`
+            Whether to yield the results in the order of ``search_texts``. If ``False``,
+            they're yielded as soon as they're done. Defaults to ``True``.
+
+        Yields
+        ------
+        :class:`.BulkResult` - The :class:`.SearchResult` of every search, or the error raised for it.
+        Each result follows ``result_format`` like the method it comes from.
+        """
+
+        def search(search_text: Union[str, List[str]]) -> Awaitable[Union[SearchResult, Any]]:
+            return self.search(search_text, order=order, count=count, page=page)
+
+        return _bulk(search_texts, search, concurrency, ordered)
+
+    def get_niches(
+        self,
+        niche_ids: Iterable[str],
+        *,
+        order: NicheGifOrder = NicheGifOrder.TRENDING,
+        count: int = 40,
+        page: int = 1,
+        concurrency: int = 8,
+        ordered: bool = True,
+    ) -> AsyncIterator[BulkResult[Union[SearchResult, Any]]]:
+        """
+        Search for the GIFs of multiple niches.
+
+        This is an async iterator, see :meth:`get_users` for an example.
+
+        Parameters
+        ----------
+        niche_ids: Iterable[:class:`str`]
+            The IDs of the niches. Each one is passed to :meth:`get_niche`.
+        order: Optional[:class:`.NicheGifOrder`]
+            The order of the GIFs to return.
+        count: Optional[:class:`int`]
+            The amount of GIFs to return per niche.
+        page: Optional[:class:`int`]
+            The page number of the GIFs to return.
+        concurrency: :class:`int`
+            The maximum amount of niches to request at once. Defaults to 8.
+        ordered: :class:`bool`
+            Whether to yield the results in the order of ``niche_ids``. If ``False``,
+            they're yielded as soon as they're done. Defaults to ``True``.
+
+        Yields
+        ------
+        :class:`.BulkResult` - The :class:`.SearchResult` of every niche, or the error raised for it.
+        Each result follows ``result_format`` like the method it comes from.
+        """
+
+        def get_niche(niche_id: str) -> Awaitable[Union[SearchResult, Any]]:
+            return self.get_niche(niche_id, order=order, count=count, page=page)
+
+        return _bulk(niche_ids, get_niche, concurrency, ordered)
+
+    def iter_search(
+        self,
+        search_text: Union[str, List[str]],
+        *,
+        order: Order = Order.TRENDING,
+        count: int = 40,
+        page: int = 1,
+        prefetch: int = 1,
+        ordered: bool = True,
+        dedupe: Union[bool, int] = False,
+    ) -> AsyncPageIterator[Union[GIF, Any]]:
+        """
+        Iterate over the GIFs of every page of a search.
+
+        The next ``prefetch`` pages are requested in the background while the
+        GIFs of the current page are consumed.
+
+        .. code-block:: python3
+
+            async for gif in api.iter_search('amateur'):
+                print(gif.id)
+
+        Parameters
+        ----------
+        search_text: Union[:class:`str`, List[:class:`str`]]
+            The type of GIFs to search for. Can be a string or a list of strings.
+        order: Optional[:class:`.Order`]
+            The order of the GIFs to return.
+        count: Optional[:class:`int`]
+            The amount of GIFs to request per page.
+        page: Optional[:class:`int`]
+            The page number to start from.
+        prefetch: :class:`int`
+            The amount of pages to request ahead. ``0`` requests every page only when it's needed.
+            Use a large value to request all the remaining pages concurrently once the first one is received.
+            Defaults to 1.
+        ordered: :class:`bool`
+            Whether to yield the items in the order of the pages. If ``False``, the items of a page
+            are yielded as soon as it's received, which is faster when many pages are prefetched.
+            Defaults to ``True``.
+        dedupe: Union[:class:`bool`, :class:`int`]
+            Whether to skip the items that were already yielded, e.g. because they moved to another
+            page while paginating. ``True`` remembers every ID. An :class:`int` remembers about that
+            many IDs in a fixed amount of memory, but may rarely skip a new item. Defaults to ``False``.
+
+        Returns
+        -------
+        :class:`.AsyncPageIterator` - An iterator over the GIFs.
+        They're models, records or the decoded JSON of each item, depending on ``result_format``.
+        """
+
+        def fetch(page: int) -> Awaitable[Union[SearchResult, Any]]:
+            return self.search(search_text, order=order, count=count, page=page)
+
+        def items(result: Union[SearchResult, Any]) -> List[Union[GIF, Any]]:
+            return result['gifs'] if isinstance(result, dict) else result.gifs or []
+
+        return AsyncPageIterator(fetch, items, page=page, prefetch=prefetch, ordered=ordered, dedupe=dedupe)
+
+    def iter_creator(
+        self,
+        username: str,
+        *,
+        count: int = 80,
+        order: Order = Order.RECENT,
+        type: MediaType = MediaType.GIF,
+        page: int = 1,
+        prefetch: int = 1,
+        ordered: bool = True,
+        dedupe: Union[bool, int] = False,
+    ) -> AsyncPageIterator[Union[GIF, Image, Any]]:
+        """
+        Iterate over the GIFs or images of every page of a creator/user's profile.
+
+        The next ``prefetch`` pages are requested in the background while the
+        items of the current page are consumed.
+
+        Parameters
+        ----------
+        username: :class:`str`
+            The username of the creator/user.
+        count: :class:`int`
+            The amount of GIFs to request per page.
+        order: :class:`.Order`
+            The order to return creator/user's GIFs.
+        type: :class:`.MediaType`
+            Whether to return image or GIF results. By default returns GIFs.
+        page: :class:`int`
+            The page number to start from.
+        prefetch: :class:`int`
+            The amount of pages to request ahead. ``0`` requests every page only when it's needed.
+            Use a large value to request all the remaining pages concurrently once the first one is received.
+            Defaults to 1.
+        ordered: :class:`bool`
+            Whether to yield the items in the order of the pages. If ``False``, the items of a page
+            are yielded as soon as it's received, which is faster when many pages are prefetched.
+            Defaults to ``True``.
+        dedupe: Union[:class:`bool`, :class:`int`]
+            Whether to skip the items that were already yielded, e.g. because they moved to another
+            page while paginating. ``True`` remembers every ID. An :class:`int` remembers about that
+            many IDs in a fixed amount of memory, but may rarely skip a new item. Defaults to ``False``.
+
+        Returns
+        -------
+        :class:`.AsyncPageIterator` - An iterator over the GIFs or images.
+        They're models, records or the decoded JSON of each item, depending on ``result_format``.
+        """
+
+        def fetch(page: int) -> Awaitable[Union[CreatorResult, Any]]:
+            return self.search_creator(username, page=page, count=count, order=order, type=type)
+
+        def items(result: Union[CreatorResult, Any]) -> List[Union[GIF, Image, Any]]:
+            if isinstance(result, dict):
+                return result['gifs']
+            return list(result.images if type == MediaType.IMAGE else result.gifs)
+
+        return AsyncPageIterator(fetch, items, page=page, prefetch=prefetch, ordered=ordered, dedupe=dedupe)
+
+    def iter_niche(
+        self,
+        niche_id: str,
+        *,
+        order: NicheGifOrder = NicheGifOrder.TRENDING,
+        count: int = 40,
+        page: int = 1,
+        prefetch: int = 1,
+        ordered: bool = True,
+        dedupe: Union[bool, int] = False,
+    ) -> AsyncPageIterator[Union[GIF, Any]]:
+        """
+        Iterate over the GIFs of every page of a niche.
+
+        The next ``prefetch`` pages are requested in the background while the
+        GIFs of the current page are consumed.
+
+        Parameters
+        ----------
+        niche_id: :class:`str`
+            The ID of the niche. If the URL is ``https://redgifs.com/niches/abcxyz`` then the ID is ``abcxyz``.
+        order: Optional[:class:`.NicheGifOrder`]
+            The order of the GIFs to return.
+        count: Optional[:class:`int`]
+            The amount of GIFs to request per page.
+        page: Optional[:class:`int`]
+            The page number to start from.
+        prefetch: :class:`int`
+            The amount of pages to request ahead. ``0`` requests every page only when it's needed.
+            Use a large value to request all the remaining pages concurrently once the first one is received.
+            Defaults to 1.
+        ordered: :class:`bool`
+            Whether to yield the items in the order of the pages. If ``False``, the items of a page
+            are yielded as soon as it's received, which is faster when many pages are prefetched.
+            Defaults to ``True``.
+        dedupe: Union[:class:`bool`, :class:`int`]
+            Whether to skip the items that were already yielded, e.g. because they moved to another
+            page while paginating. ``True`` remembers every ID. An :class:`int` remembers about that
+            many IDs in a fixed amount of memory, but may rarely skip a new item. Defaults to ``False``.
+
+        Returns
+        -------
+        :class:`.AsyncPageIterator` - An iterator over the GIFs.
+        They're models, records or the decoded JSON of each item, depending on ``result_format``.
+        """
+
+        def fetch(page: int) -> Awaitable[Union[SearchResult, Any]]:
+            return self.get_niche(niche_id, order=order, count=count, page=page)
+
+        def items(result: Union[SearchResult, Any]) -> List[Union[GIF, Any]]:
+            return result['gifs'] if isinstance(result, dict) else result.gifs or []
+
+        return AsyncPageIterator(fetch, items, page=page, prefetch=prefetch, ordered=ordered, dedupe=dedupe)
 
     async def close(self) -> None:
         """Closes the API session."""
@@ -0,0 +1,137 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2022-present scrazzz
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import json
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional, Union
+
+from .const import TOKEN_EXPIRY_MARGIN
+from .utils import _token_expiry
+
+if sys.platform == 'win32':
+    import msvcrt
+else:
+    import fcntl
+
+__all__ = ('TokenStore',)
+
+
+def _user_cache_dir() -> str:
+    if sys.platform == 'win32':
+        base = os.environ.get('LOCALAPPDATA') or os.path.expanduser('~\\AppData\\Local')
+    elif sys.platform == 'darwin':
+        base = os.path.expanduser('~/Library/Caches')
+    else:
+        base = os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache')
+    return os.path.join(base, 'redgifs')
+
+
+class TokenStore:
+    """Saves the temporary tokens from :py:meth:`API.login() <redgifs.API.login>` on disk.
+
+    A token that is still valid is reused by :py:meth:`API.login() <redgifs.API.login>`
+    instead of requesting a new one from RedGifs. The file is locked while a token is
+    read or requested, so multiple processes using the same store share a single token.
+
+    Parameters
+    ----------
+    path: Optional[:class:`str`]
+        The file to save the tokens in. Defaults to ``token.json`` in the
+        user's cache directory (e.g. ``~/.cache/redgifs/token.json``).
+    """
+
+    def __init__(self, path: Optional[Union[str, os.PathLike[str]]] = None) -> None:
+        self.path: str = os.fspath(path) if path is not None else os.path.join(_user_cache_dir(), 'token.json')
+
+    def _read(self) -> Dict[str, str]:
+        try:
+            with open(self.path, 'r') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def get(self, key: str) -> Optional[str]:
+        """Returns the saved token for ``key`` if it's not about to expire."""
+        token = self._read().get(key)
+        if token is None:
+            return None
+
+        expires_at = _token_expiry(token)
+        if expires_at is not None and expires_at - TOKEN_EXPIRY_MARGIN <= time.time():
+            return None
+        return token
+
+    def set(self, key: str, token: str) -> None:
+        """Saves the token for ``key``, expired tokens of other keys are removed."""
+        now = time.time()
+        data = {k: v for k, v in self._read().items() if (_token_expiry(v) or now) > now}
+        data[key] = token
+
+        # Write to a temporary file first so other processes never read a partial file
+        tmp = f'{self.path}.{os.getpid()}.tmp'
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'w') as f:
+            json.dump(data, f)
+        os.replace(tmp, self.path)
+
+    def _acquire(self) -> int:
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        fd = os.open(f'{self.path}.lock', os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            if sys.platform == 'win32':
+                msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+            else:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+        except BaseException:
+            os.close(fd)
+            raise
+        return fd
+
+    def _release(self, fd: int) -> None:
+        try:
+            if sys.platform == 'win32':
+                os.lseek(fd, 0, os.SEEK_SET)
+                msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+            else:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+        finally:
+            os.close(fd)
+
+    @contextmanager
+    def lock(self) -> Iterator[None]:
+        """Locks the store across processes until the ``with`` block exits."""
+        fd = self._acquire()
+        try:
+            yield
+        finally:
+            self._release(fd)
+
+    def __repr__(self) -> str:
+        return f'<TokenStore path={self.path!r}>'
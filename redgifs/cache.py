@@ -0,0 +1,330 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2022-present scrazzz
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import os
+import json
+import time
+import sqlite3
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Dict, Mapping, NamedTuple, Optional, Union
+
+from .auth import _user_cache_dir
+from .const import TEMP_TOKEN_PATH
+
+if TYPE_CHECKING:
+    from .http import Route
+
+__all__ = ('BaseCache', 'ResponseCache', 'SQLiteCache')
+
+# The amount of seconds a response is cached for, by route path
+DEFAULT_TTLS: Dict[str, float] = {
+    '/v1/tags': 24 * 60 * 60,
+    '/v2/gifs/{id}': 60 * 60,
+    '/v2/search/suggest?query={query}': 60 * 60,
+    '/v2/search/trending': 5 * 60,
+    '/v2/explore/trending-gifs': 5 * 60,
+    '/v2/explore/trending-images': 5 * 60,
+}
+
+
+class CacheEntry(NamedTuple):
+    data: Any
+    expires_at: float
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+    @property
+    def fresh(self) -> bool:
+        return self.expires_at > time.time()
+
+    @property
+    def revalidatable(self) -> bool:
+        return self.etag is not None or self.last_modified is not None
+
+    def conditional_headers(self) -> Dict[str, str]:
+        headers = {}
+        if self.etag is not None:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified is not None:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+
+class BaseCache:
+    """The base class of the response caches.
+
+    Responses are cached by their method and URL for a time that depends on the
+    route they came from. For example, the info of a GIF from
+    :py:meth:`API.get_gif() <redgifs.API.get_gif>` is cached for an hour while
+    the trending tags are only cached for 5 minutes.
+
+    Once a response expires, it's revalidated with RedGifs if it was sent with an
+    ``ETag`` or ``Last-Modified`` header. If it did not change, the cached response
+    is used again without downloading it.
+
+    Attributes
+    ----------
+    hits: :class:`int`
+        The amount of requests that were served from the cache.
+    misses: :class:`int`
+        The amount of requests that were not in the cache, or had expired.
+    revalidations: :class:`int`
+        The amount of expired responses that RedGifs confirmed did not change.
+    """
+
+    def __init__(self, ttls: Optional[Mapping[str, float]] = None, *, default_ttl: float = 60.0) -> None:
+        self.ttls: Dict[str, float] = {**DEFAULT_TTLS, **(ttls or {})}
+        self.default_ttl: float = default_ttl
+        self.hits: int = 0
+        self.misses: int = 0
+        self.revalidations: int = 0
+
+    def _ttl(self, route: Route) -> float:
+        if route.method != 'GET' or route.path == TEMP_TOKEN_PATH:
+            return 0.0
+        return self.ttls.get(route.path, self.default_ttl)
+
+    def _get(self, key: str) -> Optional[CacheEntry]:
+        raise NotImplementedError
+
+    def _set(self, key: str, entry: CacheEntry) -> None:
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        """Removes every cached response."""
+        raise NotImplementedError
+
+    def lookup(self, route: Route) -> Optional[CacheEntry]:
+        """Returns the cached entry of a route, even if it has expired."""
+        if self._ttl(route) <= 0:
+            return None
+
+        entry = self._get(f'{route.method} {route.url}')
+        if entry is not None and entry.fresh:
+            self.hits += 1
+        else:
+            self.misses += 1
+        return entry
+
+    def get(self, route: Route) -> Optional[Any]:
+        """Returns the cached response of a route, if it has not expired."""
+        entry = self.lookup(route)
+        return entry.data if entry is not None and entry.fresh else None
+
+    def set(self, route: Route, data: Any, headers: Optional[Mapping[str, str]] = None) -> None:
+        """Caches the response of a route along with its validators from ``headers``."""
+        ttl = self._ttl(route)
+        if ttl <= 0:
+            return
+
+        headers = headers or {}
+        entry = CacheEntry(data, time.time() + ttl, headers.get('ETag'), headers.get('Last-Modified'))
+        self._set(f'{route.method} {route.url}', entry)
+
+    def revalidated(self, route: Route, entry: CacheEntry) -> None:
+        """Marks an expired entry as fresh again after RedGifs answered with a 304."""
+        self.revalidations += 1
+        self._set(f'{route.method} {route.url}', entry._replace(expires_at=time.time() + self._ttl(route)))
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__} hits={self.hits} misses={self.misses} revalidations={self.revalidations}>'
+
+
+class ResponseCache(BaseCache):
+    """An in-memory cache for the responses of the RedGifs API.
+
+    See :class:`BaseCache` for how responses are cached.
+    Once the cache is full, the least recently used response is removed.
+
+    .. note::
+
+        The cached responses are shared, they must not be modified.
+
+    Parameters
+    ----------
+    ttls: Optional[Mapping[:class:`str`, :class:`float`]]
+        The amount of seconds to cache the responses of a route for, by route path
+        (e.g. ``'/v2/gifs/{id}'``). These are merged with the default TTLs.
+        A TTL of ``0`` disables caching for that route.
+    default_ttl: :class:`float`
+        The amount of seconds to cache the responses of other routes for. Defaults to 60 seconds.
+    max_size: :class:`int`
+        The maximum amount of responses to keep. Defaults to 1024.
+    """
+
+    def __init__(
+        self, ttls: Optional[Mapping[str, float]] = None, *, default_ttl: float = 60.0, max_size: int = 1024
+    ) -> None:
+        super().__init__(ttls, default_ttl=default_ttl)
+        self.max_size: int = max_size
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._lock: threading.Lock = threading.Lock()
+
+    def _get(self, key: str) -> Optional[CacheEntry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            # Expired entries are kept until they're evicted only if they can be revalidated
+            if not entry.fresh and not entry.revalidatable:
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return entry
+
+    def _set(self, key: str, entry: CacheEntry) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SQLiteCache(BaseCache):
+    """A cache for the responses of the RedGifs API that is saved in an SQLite database.
+
+    The cache outlives the process and can be shared by multiple processes at once.
+    See :class:`BaseCache` for how responses are cached.
+
+    .. note::
+
+        The database is accessed synchronously, which blocks the event loop
+        for a short time when used by the async client.
+
+    Parameters
+    ----------
+    path: Optional[:class:`str`]
+        The path of the database file. Defaults to ``responses.sqlite`` in the
+        user's cache directory (e.g. ``~/.cache/redgifs/responses.sqlite``).
+    ttls: Optional[Mapping[:class:`str`, :class:`float`]]
+        The amount of seconds to cache the responses of a route for, by route path
+        (e.g. ``'/v2/gifs/{id}'``). These are merged with the default TTLs.
+        A TTL of ``0`` disables caching for that route.
+    default_ttl: :class:`float`
+        The amount of seconds to cache the responses of other routes for. Defaults to 60 seconds.
+    max_size: :class:`int`
+        The maximum total size of the cached responses in bytes. Once it's reached,
+        the least recently used responses are removed. Defaults to 64 MiB.
+    max_age: :class:`float`
+        The amount of seconds after which a response is removed, even if it could
+        still be revalidated. Defaults to 7 days.
+    """
+
+    def __init__(
+        self,
+        path: Optional[Union[str, os.PathLike[str]]] = None,
+        ttls: Optional[Mapping[str, float]] = None,
+        *,
+        default_ttl: float = 60.0,
+        max_size: int = 64 * 1024 * 1024,
+        max_age: float = 7 * 24 * 60 * 60,
+    ) -> None:
+        super().__init__(ttls, default_ttl=default_ttl)
+        self.max_size: int = max_size
+        self.max_age: float = max_age
+        self.path: str = os.fspath(path) if path is not None else os.path.join(_user_cache_dir(), 'responses.sqlite')
+        self._lock: threading.Lock = threading.Lock()
+
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self._db: sqlite3.Connection = sqlite3.connect(
+            self.path, timeout=30.0, check_same_thread=False, isolation_level=None
+        )
+        # WAL lets other processes read the cache while one of them writes to it
+        self._db.execute('PRAGMA journal_mode=WAL')
+        self._db.execute('PRAGMA synchronous=NORMAL')
+        self._db.execute(
+            'CREATE TABLE IF NOT EXISTS responses ('
+            'key TEXT PRIMARY KEY, body BLOB NOT NULL, etag TEXT, last_modified TEXT, '
+            'expires_at REAL NOT NULL, stored_at REAL NOT NULL, accessed_at REAL NOT NULL, size INTEGER NOT NULL)'
+        )
+        self._db.execute('CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at)')
+
+    def _get(self, key: str) -> Optional[CacheEntry]:
+        now = time.time()
+        with self._lock:
+            row = self._db.execute(
+                'SELECT body, expires_at, etag, last_modified FROM responses WHERE key = ? AND stored_at > ?',
+                (key, now - self.max_age),
+            ).fetchone()
+            if row is None:
+                return None
+
+            body, expires_at, etag, last_modified = row
+            if expires_at <= now and etag is None and last_modified is None:
+                self._db.execute('DELETE FROM responses WHERE key = ?', (key,))
+                return None
+
+            self._db.execute('UPDATE responses SET accessed_at = ? WHERE key = ?', (now, key))
+        return CacheEntry(json.loads(body), expires_at, etag, last_modified)
+
+    def _set(self, key: str, entry: CacheEntry) -> None:
+        now = time.time()
+        body = json.dumps(entry.data, separators=(',', ':')).encode()
+        with self._lock:
+            self._db.execute(
+                'INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                (key, body, entry.etag, entry.last_modified, entry.expires_at, now, now, len(body)),
+            )
+            self._evict(now)
+
+    def _evict(self, now: float) -> None:
+        self._db.execute('DELETE FROM responses WHERE stored_at <= ?', (now - self.max_age,))
+
+        (total,) = self._db.execute('SELECT COALESCE(SUM(size), 0) FROM responses').fetchone()
+        if total <= self.max_size:
+            return
+
+        # Remove the least recently used responses until the cache fits again
+        keys = []
+        for key, size in self._db.execute('SELECT key, size FROM responses ORDER BY accessed_at'):
+            if total <= self.max_size:
+                break
+            keys.append((key,))
+            total -= size
+        self._db.executemany('DELETE FROM responses WHERE key = ?', keys)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._db.execute('DELETE FROM responses')
+
+    def close(self) -> None:
+        """Closes the database."""
+        with self._lock:
+            self._db.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._db.execute('SELECT COUNT(*) FROM responses').fetchone()[0]
@@ -27,3 +27,21 @@ import re
 REDGIFS_THUMBS_RE = re.compile(r'https://thumbs\d+?\.redgifs\.com/(?P<id>\w+)(?P<type>-\w+)?\.(?P<ext>\w+)(\?.+(\d|\w))?')
 
 REDGIFS_ID_RE = re.compile(r'https://(thumbs(\d+)|api)\.redgifs\.com/(?P<id>[a-zA-Z]+)')
+
+CONTENT_RANGE_RE = re.compile(r'bytes\s+(?:(?P<start>\d+)-(?P<end>\d+)|\*)/(?:(?P<total>\d+)|\*)')
+
+RANGE_RE = re.compile(r'bytes=(?P<start>\d+)-(?P<end>\d*)')
+
+# The default amount of bytes read from a media response before it is written to disk
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+TEMP_TOKEN_PATH = '/v2/auth/temporary'
+
+# A temporary token is refreshed this many seconds before it expires
+TOKEN_EXPIRY_MARGIN = 60
+
+# The maximum amount of characters of a response body written to the debug logs
+LOG_BODY_LIMIT = 1000
+
+# The maximum amount of GIF IDs looked up in a single request
+GIFS_CHUNK_SIZE = 100
@@ -30,7 +30,7 @@ import aiohttp
 from typing import Any, Dict, Optional, Union
 
 
-class RedGifsError(BaseException):
+class RedGifsError(Exception):
     """Base class for all redgifs errors."""
 
     pass
@@ -69,12 +69,13 @@ class HTTPException(RedGifsError):
         self.response: Any = response
         self.reason: Optional[str] = response.reason
         self.status: int
-        self.code: str
-        self.message: str
+        self.code: str = ''
+        self.message: str = ''
 
         if isinstance(response, requests.Response):
             self.status = response.status_code
-        elif isinstance(response, aiohttp.ClientResponse):
+        else:
+            # aiohttp.ClientResponse, or the response of an async transport
             self.status = response.status
 
         if isinstance(json, dict):
@@ -82,5 +83,7 @@ class HTTPException(RedGifsError):
             if error:
                 self.code = error.get('code', '')
                 self.message = error.get('message', '')
+        elif json:
+            self.message = json
 
         super().__init__(f'{self.status} {self.reason} ({self.code}: {self.message})')
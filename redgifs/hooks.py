@@ -0,0 +1,351 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2022-present scrazzz
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import time
+import bisect
+import logging
+import threading
+from collections import Counter
+from typing import TYPE_CHECKING, Any, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+import aiohttp
+
+if TYPE_CHECKING:
+    from types import SimpleNamespace
+
+    from .http import Route
+
+__all__ = ('RequestEvent', 'RequestHook', 'RouteStats', 'RequestStats')
+
+_log = logging.getLogger(__name__)
+
+# The upper bounds (in seconds) of the latency histogram buckets
+DEFAULT_BUCKETS: Tuple[float, ...] = (0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+class RequestEvent(NamedTuple):
+    """
+    method: :class:`str`
+        The HTTP method of the request.
+    route: :class:`str`
+        The route path the request was made to, e.g. ``'/v2/gifs/{id}'``.
+    url: :class:`str`
+        The full URL of the request.
+    status: Optional[:class:`int`]
+        The status code of the response. ``None`` if no response was received.
+    bytes: :class:`int`
+        The size of the response body.
+    retries: :class:`int`
+        The amount of times the request was retried.
+    dns: Optional[:class:`float`]
+        The seconds spent resolving the host name of the last attempt.
+        Only measured by the async client using its own session.
+    connect: Optional[:class:`float`]
+        The seconds spent opening a connection for the last attempt, ``0`` if one was reused.
+        Only measured by the async client using its own session.
+    ttfb: Optional[:class:`float`]
+        The seconds from sending the last attempt until its response headers were received.
+    total: Optional[:class:`float`]
+        The seconds the whole request took, including retries. ``None`` when the request starts.
+    error: Optional[:class:`BaseException`]
+        The exception the request failed with, if any.
+    """
+
+    method: str
+    route: str
+    url: str
+    status: Optional[int] = None
+    bytes: int = 0
+    retries: int = 0
+    dns: Optional[float] = None
+    connect: Optional[float] = None
+    ttfb: Optional[float] = None
+    total: Optional[float] = None
+    error: Optional[BaseException] = None
+
+
+class RequestHook:
+    """The base class of the hooks that are called for every API request.
+
+    Subclass it and override the methods you need, then pass an instance
+    in the ``hooks`` kwarg of :class:`API <redgifs.API>`. Responses served from
+    the cache do not call the hooks.
+
+    Exceptions raised by a hook are logged and ignored.
+    """
+
+    def on_request_start(self, event: RequestEvent) -> None:
+        """Called before a request is sent."""
+        pass
+
+    def on_request_end(self, event: RequestEvent) -> None:
+        """Called after a request succeeded."""
+        pass
+
+    def on_request_error(self, event: RequestEvent) -> None:
+        """Called after a request failed, :attr:`RequestEvent.error` is the exception it raised."""
+        pass
+
+
+class RouteStats:
+    """The statistics of the requests made to a route.
+
+    Attributes
+    ----------
+    count: :class:`int`
+        The amount of requests.
+    errors: :class:`collections.Counter`
+        The amount of failed requests by status code, or by exception name
+        when no response was received.
+    retries: :class:`int`
+        The total amount of retries.
+    bytes: :class:`int`
+        The total size of the response bodies.
+    buckets: Tuple[:class:`float`, ...]
+        The upper bounds of the latency histogram buckets in seconds.
+    histogram: List[:class:`int`]
+        The amount of requests in each bucket. The last item counts
+        the requests that took longer than the last bucket.
+    total_time: :class:`float`
+        The sum of the latencies of every request.
+    max_time: :class:`float`
+        The highest latency.
+    """
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS) -> None:
+        self.count: int = 0
+        self.errors: Counter[Any] = Counter()
+        self.retries: int = 0
+        self.bytes: int = 0
+        self.buckets: Tuple[float, ...] = buckets
+        self.histogram: List[int] = [0] * (len(buckets) + 1)
+        self.total_time: float = 0.0
+        self.max_time: float = 0.0
+
+    def _add(self, event: RequestEvent) -> None:
+        total = event.total or 0.0
+        self.count += 1
+        self.retries += event.retries
+        self.bytes += event.bytes
+        self.histogram[bisect.bisect_left(self.buckets, total)] += 1
+        self.total_time += total
+        self.max_time = max(self.max_time, total)
+        if event.error is not None:
+            self.errors[event.status or event.error.__class__.__name__] += 1
+
+    @property
+    def mean(self) -> float:
+        """:class:`float`: The average latency."""
+        return self.total_time / self.count if self.count else 0.0
+
+    def percentile(self, q: float) -> float:
+        """Returns an estimate of a latency percentile from the histogram.
+
+        Parameters
+        ----------
+        q: :class:`float`
+            The percentile, between ``0`` and ``100``.
+
+        Returns
+        -------
+        :class:`float`
+            The upper bound of the bucket the percentile falls in.
+        """
+        rank = self.count * q / 100
+        seen = 0
+        for bound, n in zip(self.buckets, self.histogram):
+            seen += n
+            if seen >= rank:
+                return bound
+        return self.max_time
+
+    def __repr__(self) -> str:
+        return f'<RouteStats count={self.count} errors={sum(self.errors.values())} mean={self.mean:.3f}s>'
+
+
+class RequestStats(RequestHook):
+    """A hook that keeps latency histograms and error counts for every route.
+
+    Parameters
+    ----------
+    buckets: Tuple[:class:`float`, ...]
+        The upper bounds of the latency histogram buckets in seconds.
+
+    Attributes
+    ----------
+    routes: Dict[:class:`str`, :class:`RouteStats`]
+        The statistics of every route, by method and route path (e.g. ``'GET /v2/gifs/{id}'``).
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        self.buckets: Tuple[float, ...] = tuple(sorted(buckets))
+        self.routes: Dict[str, RouteStats] = {}
+        self._lock: threading.Lock = threading.Lock()
+
+    def _add(self, event: RequestEvent) -> None:
+        key = f'{event.method} {event.route}'
+        with self._lock:
+            stats = self.routes.get(key)
+            if stats is None:
+                stats = self.routes[key] = RouteStats(self.buckets)
+            stats._add(event)
+
+    def on_request_end(self, event: RequestEvent) -> None:
+        self._add(event)
+
+    def on_request_error(self, event: RequestEvent) -> None:
+        self._add(event)
+
+    def clear(self) -> None:
+        """Resets every statistic."""
+        with self._lock:
+            self.routes.clear()
+
+    def __repr__(self) -> str:
+        return f'<RequestStats routes={len(self.routes)}>'
+
+
+class _RequestTrace:
+    # Collects what the hooks are told about one request
+
+    __slots__ = (
+        'hooks',
+        'method',
+        'route',
+        'url',
+        'status',
+        'bytes',
+        'retries',
+        'dns',
+        'connect',
+        'ttfb',
+        'started',
+        '_attempt',
+        '_step',
+    )
+
+    def __init__(self, route: Route, hooks: Sequence[RequestHook]) -> None:
+        self.hooks: Sequence[RequestHook] = hooks
+        self.method: str = route.method
+        self.route: str = route.path
+        self.url: str = route.url
+        self.status: Optional[int] = None
+        self.bytes: int = 0
+        self.retries: int = 0
+        self.dns: Optional[float] = None
+        self.connect: Optional[float] = None
+        self.ttfb: Optional[float] = None
+        self.started: float = time.perf_counter()
+        self._attempt: float = self.started
+        self._step: float = self.started
+
+    def _event(self, total: Optional[float], error: Optional[BaseException] = None) -> RequestEvent:
+        return RequestEvent(
+            self.method,
+            self.route,
+            self.url,
+            self.status,
+            self.bytes,
+            self.retries,
+            self.dns,
+            self.connect,
+            self.ttfb,
+            total,
+            error,
+        )
+
+    def _dispatch(self, name: str, event: RequestEvent) -> None:
+        for hook in self.hooks:
+            try:
+                getattr(hook, name)(event)
+            except Exception:
+                _log.exception(f'Ignoring exception in {hook.__class__.__name__}.{name}')
+
+    def start(self) -> None:
+        if self.hooks:
+            self._dispatch('on_request_start', self._event(None))
+
+    def end(self) -> None:
+        if self.hooks:
+            self._dispatch('on_request_end', self._event(time.perf_counter() - self.started))
+
+    def error(self, error: BaseException) -> None:
+        if self.hooks:
+            self._dispatch('on_request_error', self._event(time.perf_counter() - self.started, error))
+
+
+def _trace(params: SimpleNamespace) -> Optional[_RequestTrace]:
+    trace = params.trace_request_ctx
+    return trace if isinstance(trace, _RequestTrace) else None
+
+
+def _trace_config() -> aiohttp.TraceConfig:
+    async def on_request_start(session: Any, ctx: SimpleNamespace, params: Any) -> None:
+        trace = _trace(ctx)
+        if trace is not None:
+            trace._attempt = trace._step = time.perf_counter()
+            trace.dns = trace.connect = trace.ttfb = None
+
+    async def on_step_start(session: Any, ctx: SimpleNamespace, params: Any) -> None:
+        trace = _trace(ctx)
+        if trace is not None:
+            trace._step = time.perf_counter()
+
+    async def on_dns_end(session: Any, ctx: SimpleNamespace, params: Any) -> None:
+        trace = _trace(ctx)
+        if trace is not None:
+            trace.dns = time.perf_counter() - trace._step
+
+    async def on_dns_cache_hit(session: Any, ctx: SimpleNamespace, params: Any) -> None:
+        trace = _trace(ctx)
+        if trace is not None:
+            trace.dns = 0.0
+
+    async def on_connection_create_end(session: Any, ctx: SimpleNamespace, params: Any) -> None:
+        trace = _trace(ctx)
+        if trace is not None:
+            # Connecting includes resolving the host name
+            trace.connect = time.perf_counter() - trace._step - (trace.dns or 0.0)
+
+    async def on_connection_reuseconn(session: Any, ctx: SimpleNamespace, params: Any) -> None:
+        trace = _trace(ctx)
+        if trace is not None:
+            trace.connect = 0.0
+
+    async def on_request_end(session: Any, ctx: SimpleNamespace, params: Any) -> None:
+        trace = _trace(ctx)
+        if trace is not None:
+            trace.ttfb = time.perf_counter() - trace._attempt
+
+    config = aiohttp.TraceConfig()
+    config.on_request_start.append(on_request_start)
+    config.on_connection_create_start.append(on_step_start)
+    config.on_dns_resolvehost_end.append(on_dns_end)
+    config.on_dns_cache_hit.append(on_dns_cache_hit)
+    config.on_connection_create_end.append(on_connection_create_end)
+    config.on_connection_reuseconn.append(on_connection_reuseconn)
+    config.on_request_end.append(on_request_end)
+    return config
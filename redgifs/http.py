@@ -27,25 +27,53 @@ from __future__ import annotations
 import io
 import os
 import sys
+import json
+import time
+import random
+import asyncio
+import reprlib
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from urllib.parse import quote
-from typing import TYPE_CHECKING, Any, ClassVar, Coroutine, Dict, List, NamedTuple, Optional, TypeVar, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    ClassVar,
+    Coroutine,
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
 import requests
 import aiohttp
+from requests.adapters import HTTPAdapter
 import yarl
 
 from . import __version__
-from .errors import HTTPException
+from .auth import TokenStore
+from .cache import BaseCache, CacheEntry
+from .hooks import RequestHook, _RequestTrace, _trace_config
+from .transport import AiohttpTransport, AsyncTransport, RequestsTransport, Transport
+from .ratelimit import RateLimiter, _route_family
+from .errors import HTTPException, RedGifsError
 from .enums import Order, MediaType, NicheOrder, NicheGifOrder
-from .utils import strip_ip
+from .utils import strip_ip, _json_loads, _parse_content_range, _parse_retry_after, _token_expiry
+from .const import DOWNLOAD_CHUNK_SIZE, LOG_BODY_LIMIT, TEMP_TOKEN_PATH, TOKEN_EXPIRY_MARGIN
 
-__all__ = ('ProxyAuth',)
+__all__ = ('ProxyAuth', 'PoolLimits', 'RetryPolicy')
 
 _log = logging.getLogger(__name__)
 
 if TYPE_CHECKING:
-    from redgifs.types.gif import GetGifResponse, GifResponse
+    from redgifs.types.gif import GetGifResponse, GetGifsResponse, GifResponse
     from redgifs.types.image import ImageResponse, TrendingImagesResponse
     from redgifs.types.niches import NicheResponse
     from redgifs.types.tags import TagsResponse, TagSuggestion
@@ -55,6 +83,38 @@ if TYPE_CHECKING:
     Response = Coroutine[Any, Any, T]
 
 
+# Formats the response bodies written to the debug logs without going through the whole body
+_body_repr = reprlib.Repr()
+_body_repr.maxlevel = 4
+_body_repr.maxdict = 8
+_body_repr.maxlist = 3
+_body_repr.maxstring = _body_repr.maxother = 80
+
+
+def _log_response(trace: _RequestTrace, data: Any = None) -> None:
+    # Nothing is formatted unless debug logging is enabled. The request is passed
+    # as ``record.request`` (a RequestEvent) for handlers that want structured logs.
+    if not _log.isEnabledFor(logging.DEBUG):
+        return
+
+    total = time.perf_counter() - trace.started
+    extra = {'request': trace._event(total)}
+    if data is None:
+        args = (trace.method, trace.url, trace.status, trace.bytes, total)
+        _log.debug('%s %s returned code: %s (%d bytes in %.3fs)', *args, extra=extra)
+    else:
+        body = _body_repr.repr(data)
+        if len(body) > LOG_BODY_LIMIT:
+            body = f'{body[:LOG_BODY_LIMIT]}...'
+        args = (trace.method, trace.url, trace.status, trace.bytes, total, body)
+        _log.debug('%s %s returned code: %s (%d bytes in %.3fs), received: %s', *args, extra=extra)
+
+
+def _is_redgifs_host(host: Optional[str]) -> bool:
+    # The host of Route.BASE is allowed too, e.g. when it points to a stub server
+    return host is not None and ('redgifs.com' in host or host == yarl.URL(Route.BASE).host)
+
+
 class Route:
     BASE: ClassVar[str] = 'https://api.redgifs.com'
 
@@ -79,6 +139,78 @@ class ProxyAuth(NamedTuple):
     password: str
 
 
+class PoolLimits(NamedTuple):
+    """
+    max_connections: :class:`int`
+        The maximum number of connections to open. Defaults to 100.
+    max_connections_per_host: :class:`int`
+        The maximum number of connections to open to a single host.
+        ``0`` means there is no limit per host. Defaults to 0.
+
+        .. note::
+
+            The sync client can only limit the connections per host: every host gets at most
+            ``max_connections_per_host`` connections, or ``max_connections`` if it's ``0``.
+            Requests over that limit wait for a connection to be freed.
+    keepalive_timeout: :class:`float`
+        The amount of seconds an idle connection is kept open for reuse.
+        Only used by the async client. Defaults to 15 seconds.
+    dns_cache_ttl: Optional[:class:`int`]
+        The amount of seconds resolved host names are cached for.
+        ``None`` caches them forever. Only used by the async client. Defaults to 10 seconds.
+    """
+
+    max_connections: int = 100
+    max_connections_per_host: int = 0
+    keepalive_timeout: float = 15.0
+    dns_cache_ttl: Optional[int] = 10
+
+
+class RetryPolicy(NamedTuple):
+    """
+    max_retries: :class:`int`
+        The maximum amount of times a single request is retried. Defaults to 3.
+    backoff_base: :class:`float`
+        The amount of seconds to wait before the first retry. It's doubled
+        on every retry until it reaches ``backoff_max``. Defaults to 0.5 seconds.
+    backoff_max: :class:`float`
+        The maximum amount of seconds to wait between two retries. Defaults to 30 seconds.
+    jitter: :class:`bool`
+        Whether to wait a random amount of time between 0 and the backoff,
+        so that many clients don't retry at the same time. Defaults to ``True``.
+    max_wait: Optional[:class:`float`]
+        The maximum amount of seconds a single request can spend waiting between retries.
+        If a retry would go over it, the error is raised instead. Defaults to 120 seconds.
+    statuses: Tuple[:class:`int`, ...]
+        The HTTP status codes to retry.
+    """
+
+    max_retries: int = 3
+    backoff_base: float = 0.5
+    backoff_max: float = 30.0
+    jitter: bool = True
+    max_wait: Optional[float] = 120.0
+    statuses: Tuple[int, ...] = (429, 500, 502, 503, 504)
+
+    def _next_delay(self, retries: int, waited: float, retry_after: Optional[str] = None) -> Optional[float]:
+        # Returns how long to wait before retrying, or None if the retry budget is used up
+        if retries >= self.max_retries:
+            return None
+
+        delay = min(self.backoff_max, self.backoff_base * 2**retries)
+        if self.jitter:
+            delay = random.uniform(0, delay)
+
+        # RedGifs knows better when the request can be retried
+        hint = _parse_retry_after(retry_after)
+        if hint is not None:
+            delay = max(delay, hint)
+
+        if self.max_wait is not None and waited + delay > self.max_wait:
+            return None
+        return delay
+
+
 class HTTP:
     def __init__(
         self,
@@ -86,11 +218,31 @@ class HTTP:
         *,
         proxy: Optional[str] = None,
         proxy_auth: Optional[ProxyAuth] = None,
+        limits: Optional[PoolLimits] = None,
+        media_limits: Optional[PoolLimits] = None,
+        token_store: Optional[TokenStore] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry: Optional[RetryPolicy] = RetryPolicy(),
+        cache: Optional[BaseCache] = None,
+        hooks: Sequence[RequestHook] = (),
+        json_loads: Optional[Callable[[bytes], Any]] = None,
+        transport: Optional[Transport] = None,
     ) -> None:
-        if session is not None and session is not isinstance(session, requests.Session):
+        if session is not None and not isinstance(session, requests.Session):
             raise RuntimeError('session is not of type requests.Session')
 
-        self.__session: requests.Session = session or requests.Session()
+        if transport is None:
+            transport = RequestsTransport(session)
+            # API calls and media downloads use separate connection pools so that
+            # many large downloads can't use up the connections needed for API calls.
+            # A session that was passed in is left untouched unless limits were given.
+            if session is None or limits is not None:
+                limits = limits or PoolLimits()
+                transport.session.mount(Route.BASE, self._make_adapter(limits))
+            if session is None or media_limits is not None:
+                media_limits = media_limits or PoolLimits()
+                transport.session.mount('https://', self._make_adapter(media_limits))
+        self.transport: Transport = transport
         self.headers: Dict[str, str] = {
             'User-Agent': f'redgifs (https://github.com/scrazzz/redgifs {__version__}) Python/{sys.version[:3]}'
         }
@@ -109,33 +261,164 @@ class HTTP:
         else:
             self._proxy_auth = None
 
+        self._temporary_login: bool = False
+        self._token_expires_at: Optional[float] = None
+        self._token_lock: threading.Lock = threading.Lock()
+        self.token_store: Optional[TokenStore] = token_store
+        # Temporary tokens are tied to the User-Agent and IP address they were requested with
+        self._token_store_key: str = f'{self.headers["User-Agent"]} {self.proxy or ""}'
+        self.rate_limiter: Optional[RateLimiter] = rate_limiter
+        self.retry: Optional[RetryPolicy] = retry
+        self.cache: Optional[BaseCache] = cache
+        self.hooks: List[RequestHook] = list(hooks)
+        self.json_loads: Callable[[bytes], Any] = json_loads or _json_loads
+
+    @staticmethod
+    def _make_adapter(limits: PoolLimits) -> HTTPAdapter:
+        # requests keeps one pool per host and can't cap the connections across hosts,
+        # so the limit is the size of each pool. Blocking makes the pool wait for a free
+        # connection instead of opening more connections than that.
+        return HTTPAdapter(
+            pool_maxsize=limits.max_connections_per_host or limits.max_connections,
+            pool_block=True,
+        )
+
     def request(self, route: Route, **kwargs: Any) -> Any:
         url: str = route.url
         method: str = route.method
-        r: requests.Response = self.__session.request(
-            method, url, headers=self.headers, proxies=self._proxy, auth=self._proxy_auth, timeout=60.0, **kwargs
-        )
-        _log.debug(f'{method} {url} returned code: {r.status_code}')
-        js = r.json()
+
+        entry = self.cache.lookup(route) if self.cache is not None else None
+        if entry is not None and entry.fresh:
+            _log.debug('%s %s served from cache', method, url)
+            return entry.data
+
+        trace = _RequestTrace(route, self.hooks)
+        trace.start()
+        try:
+            data = self._send(route, entry, trace, **kwargs)
+        except BaseException as e:
+            trace.error(e)
+            raise
+        trace.end()
+        return data
+
+    def _send(self, route: Route, entry: Optional[CacheEntry], trace: _RequestTrace, **kwargs: Any) -> Any:
+        url: str = route.url
+        method: str = route.method
+        # Ask RedGifs to only send an expired response back if it changed
+        conditional = entry.conditional_headers() if entry is not None else {}
+
+        family = _route_family(route.path)
+
+        def send() -> requests.Response:
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire(family)
+            headers = {**self.headers, **conditional} if conditional else self.headers
+            r = self.transport.request(
+                method, url, headers=headers, proxies=self._proxy, auth=self._proxy_auth, timeout=60.0, **kwargs
+            )
+            if self.rate_limiter is not None:
+                self.rate_limiter.update(family, r.status_code, r.headers)
+            trace.status = r.status_code
+            trace.ttfb = r.elapsed.total_seconds()
+            return r
+
+        refreshable = self._temporary_login and route.path != TEMP_TOKEN_PATH
+        if refreshable and self._token_expiring():
+            self._refresh_token(self.headers.get('authorization'))
+
+        retries, waited, replayed = 0, 0.0, False
+        while True:
+            authorization = self.headers.get('authorization')
+            try:
+                r: requests.Response = send()
+            except (requests.ConnectionError, requests.Timeout) as e:
+                delay = self._retry_delay(retries, waited)
+                if delay is None:
+                    raise
+                _log.debug('%s %s raised %s, retrying in %.2fs', method, url, e.__class__.__name__, delay)
+            else:
+                if r.status_code == 401 and refreshable and not replayed:
+                    # The token expired earlier than expected, replay the request once with a new one
+                    _log.debug('%s %s returned code: 401, refreshing the temporary token', method, url)
+                    self._refresh_token(authorization)
+                    replayed = True
+                    continue
+
+                delay = None
+                if self.retry is not None and r.status_code in self.retry.statuses:
+                    delay = self._retry_delay(retries, waited, r.headers.get('Retry-After'))
+                if delay is None:
+                    break
+                _log.debug('%s %s returned code: %s, retrying in %.2fs', method, url, r.status_code, delay)
+
+            time.sleep(delay)
+            retries += 1
+            waited += delay
+            trace.retries = retries
+
+        trace.bytes = len(r.content)
+        if r.status_code == 304 and entry is not None and self.cache is not None:
+            _log_response(trace)
+            _log.debug('%s %s not modified, served from cache', method, url)
+            self.cache.revalidated(route, entry)
+            return entry.data
         if r.status_code == 200:
-            _log.debug(f'{method} {url} received: {js}')
+            js = self.json_loads(r.content)
+            _log_response(trace, js)
+            if self.cache is not None:
+                self.cache.set(route, js, r.headers)
             return js
         else:
-            raise HTTPException(r, js)
+            # Error pages are not always JSON, e.g. a 502 from the load balancer
+            try:
+                error = r.json()
+            except ValueError:
+                error = r.text
+            _log_response(trace)
+            raise HTTPException(r, error)
+
+    def _retry_delay(self, retries: int, waited: float, retry_after: Optional[str] = None) -> Optional[float]:
+        if self.retry is None:
+            return None
+        return self.retry._next_delay(retries, waited, retry_after)
 
     def close(self) -> None:
-        self.__session.close()
+        self.transport.close()
 
     # TODO: Implement OAuth login support
     def login(self, username: Optional[str] = None, password: Optional[str] = None) -> None:
         if (username and password) is None:
-            temp_token = self.get_temp_token()['token']
-            self.headers['authorization'] = f'Bearer {temp_token}'
+            self._temporary_login = True
+            self._refresh_token()
         else:
             raise NotImplementedError
 
     def get_temp_token(self):
-        return self.request(Route('GET', '/v2/auth/temporary'))
+        return self.request(Route('GET', TEMP_TOKEN_PATH))
+
+    def _token_expiring(self) -> bool:
+        return self._token_expires_at is not None and self._token_expires_at - TOKEN_EXPIRY_MARGIN <= time.time()
+
+    def _refresh_token(self, stale: Optional[str] = None) -> None:
+        # Only a single thread fetches a new token. The threads that were waiting on the
+        # lock see that the token they used was already replaced and just reuse the new one.
+        with self._token_lock:
+            if stale is not None and self.headers.get('authorization') != stale:
+                return
+
+            if self.token_store is None:
+                token = self.get_temp_token()['token']
+            else:
+                # Reuse the token saved by another process (or an earlier run) if it's still valid
+                with self.token_store.lock():
+                    token = self.token_store.get(self._token_store_key)
+                    if token is None or f'Bearer {token}' == stale:
+                        token = self.get_temp_token()['token']
+                        self.token_store.set(self._token_store_key, token)
+
+            self.headers['authorization'] = f'Bearer {token}'
+            self._token_expires_at = _token_expiry(token)
 
     # GIF methods
 
@@ -145,6 +428,9 @@ class HTTP:
     def get_gif(self, id: str, **params: Any) -> GetGifResponse:
         return self.request(Route('GET', '/v2/gifs/{id}', id=id), **params)
 
+    def get_gifs(self, ids: List[str], **params: Any) -> GetGifsResponse:
+        return self.request(Route('GET', '/v2/gifs?ids={ids}', ids=','.join(ids)), **params)
+
     def search(self, search_text: str, order: Order, count: int, page: int, **params: Any) -> GifResponse:
         r = Route(
             'GET',
@@ -263,34 +549,173 @@ class HTTP:
 
     # download
 
-    def download(
-        self, url: str, fp: Union[str, bytes, os.PathLike[Any], io.BufferedIOBase]
-    ) -> Union[Coroutine[Any, Any, int], int]:
-        """A friendly method to download a RedGifs media."""
+    def _acquire_media(self) -> None:
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire('media')
 
-        yarl_url = yarl.URL(url)
-        str_url = str(yarl_url)
+    def _check_media_response(self, r: requests.Response, url: str) -> None:
+        _log.debug('GET %s returned code: %s', url, r.status_code)
 
-        def dl(url: str) -> int:
-            r = self.__session.get(url, headers=self.headers)
-            _log.debug(f'GET {url} returned code: {r.status_code}')
+        if r.status_code == 404:
+            raise HTTPException(r, r.json())
+
+        content_type = r.headers['Content-Type']
+        if content_type not in ['video/mp4', 'image/jpeg']:
+            _log.error(f'GET {url} returned improper content-type: {content_type}')
+            raise TypeError(f'"{url}" returned invalid content type for downloading: {content_type}')
 
-            if r.status_code == 404:
-                raise HTTPException(r, r.json())
+    def _write_chunks(self, r: requests.Response, f: Any, chunk_size: int, stop: Optional[threading.Event] = None) -> int:
+        # Only ``chunk_size`` bytes of the media are held in memory at any time.
+        # ``stop`` ends the download early, the caller discards what was written.
+        written = 0
+        for chunk in r.iter_content(chunk_size):
+            if stop is not None and stop.is_set():
+                break
+            written += f.write(chunk)
+        return written
 
-            content_type = r.headers['Content-Type']
-            if content_type not in ['video/mp4', 'image/jpeg']:
-                _log.error(f'GET {url} returned improper content-type: {content_type}')
-                raise TypeError(f'"{url}" returned invalid content type for downloading: {content_type}')
+    def _download(self, url: str, fp: Union[str, bytes, os.PathLike[Any], io.BufferedIOBase], chunk_size: int) -> int:
+        self._acquire_media()
+        with self.transport.request('GET', url, headers=self.headers, stream=True) as r:
+            self._check_media_response(r, url)
 
-            data = r.content
             if isinstance(fp, io.BufferedIOBase):
-                return fp.write(data)
+                return self._write_chunks(r, fp, chunk_size)
             else:
                 with open(fp, 'wb') as f:
-                    return f.write(data)
+                    return self._write_chunks(r, f, chunk_size)
+
+    def _download_resumable(self, url: str, fp: Union[str, bytes, os.PathLike[Any]], chunk_size: int) -> int:
+        path = os.fsdecode(fp)
+        part = path + '.part'
+        offset = os.path.getsize(part) if os.path.exists(part) else 0
+
+        headers = self.headers
+        if offset:
+            headers = {**self.headers, 'Range': f'bytes={offset}-'}
+
+        self._acquire_media()
+        with self.transport.request('GET', url, headers=headers, stream=True) as r:
+            if r.status_code == 416:
+                # The .part file is either already complete or larger than the media itself
+                _, _, total = _parse_content_range(r.headers.get('Content-Range', ''))
+                if total != offset:
+                    os.remove(part)
+                    return self._download_resumable(url, fp, chunk_size)
+                os.replace(part, path)
+                return offset
+
+            self._check_media_response(r, url)
+
+            if r.status_code == 206:
+                start, _, total = _parse_content_range(r.headers.get('Content-Range', ''))
+                if start != offset:
+                    raise RedGifsError(f'"{strip_ip(url)}" resumed at byte {start} instead of byte {offset}')
+                mode = 'ab'
+            else:
+                # The server ignored the Range header and is sending the whole media again
+                offset, mode = 0, 'wb'
+                total = int(r.headers['Content-Length']) if 'Content-Length' in r.headers else None
+
+            with open(part, mode) as f:
+                size = offset + self._write_chunks(r, f, chunk_size)
+
+        if total is not None and size != total:
+            raise RedGifsError(f'"{strip_ip(url)}" ended after {size} of {total} bytes, download it again to resume')
+
+        os.replace(part, path)
+        return size
+
+    def _download_segment(self, url: str, part: str, start: int, end: int, chunk_size: int, stop: threading.Event) -> int:
+        headers = {**self.headers, 'Range': f'bytes={start}-{end}'}
+        self._acquire_media()
+        if stop.is_set():
+            return 0
+        with self.transport.request('GET', url, headers=headers, stream=True) as r:
+            self._check_media_response(r, url)
+            if r.status_code != 206:
+                raise RedGifsError(f'"{strip_ip(url)}" did not return the requested range {start}-{end}')
+
+            with open(part, 'r+b') as f:
+                f.seek(start)
+                written = self._write_chunks(r, f, chunk_size, stop)
+
+        if stop.is_set():
+            return written
+        if written != end - start + 1:
+            raise RedGifsError(f'"{strip_ip(url)}" sent {written} bytes for the range {start}-{end}')
+        return written
+
+    def _download_segmented(self, url: str, fp: Union[str, bytes, os.PathLike[Any]], chunk_size: int, segments: int) -> int:
+        self._acquire_media()
+        r = self.transport.request('HEAD', url, headers=self.headers, allow_redirects=True)
+        size = int(r.headers.get('Content-Length', 0))
+        if r.status_code != 200 or r.headers.get('Accept-Ranges') != 'bytes' or size <= chunk_size:
+            # Ranges are not supported (or not worth it), fallback to a single stream
+            _log.debug('HEAD %s does not allow a segmented download, using a single stream', url)
+            return self._download(url, fp, chunk_size)
+
+        path = os.fsdecode(fp)
+        part = path + '.part'
+        segments = min(segments, size // chunk_size)
+        bounds = [(size * i // segments, size * (i + 1) // segments - 1) for i in range(segments)]
+
+        # Preallocate the file so every segment can be written at its own offset
+        with open(part, 'wb') as f:
+            f.truncate(size)
+
+        stop = threading.Event()
+        try:
+            with ThreadPoolExecutor(max_workers=segments) as pool:
+                futures = [
+                    pool.submit(self._download_segment, url, part, start, end, chunk_size, stop) for start, end in bounds
+                ]
+                try:
+                    written = sum(future.result() for future in as_completed(futures))
+                except BaseException:
+                    # Fail at the first failed segment: the segments that haven't started are cancelled and the
+                    # running ones stop at their next chunk, so the pool doesn't wait for them to finish
+                    stop.set()
+                    if sys.version_info >= (3, 9):
+                        pool.shutdown(wait=False, cancel_futures=True)
+                    else:
+                        for future in futures:
+                            future.cancel()
+                    raise
+        except BaseException:
+            os.remove(part)
+            raise
+
+        os.replace(part, path)
+        return written
+
+    def download(
+        self,
+        url: str,
+        fp: Union[str, bytes, os.PathLike[Any], io.BufferedIOBase],
+        *,
+        chunk_size: int = DOWNLOAD_CHUNK_SIZE,
+        resume: bool = False,
+        segments: int = 1,
+    ) -> int:
+        """A friendly method to download a RedGifs media."""
+
+        yarl_url = yarl.URL(url)
+        str_url = str(yarl_url)
+
+        if resume and isinstance(fp, io.BufferedIOBase):
+            raise TypeError('resume is only supported when fp is a filename')
+        if resume and segments > 1:
+            raise ValueError('resume cannot be used with a segmented download')
 
-        if yarl_url.host is not None and 'redgifs.com' in yarl_url.host:
+        def dl(url: str) -> int:
+            if resume:
+                return self._download_resumable(url, fp, chunk_size)  # type: ignore - fp is not a BufferedIOBase here
+            if segments > 1 and not isinstance(fp, io.BufferedIOBase):
+                return self._download_segmented(url, fp, chunk_size, segments)
+            return self._download(url, fp, chunk_size)
+
+        if _is_redgifs_host(yarl_url.host):
             if 'watch' in yarl_url.path:
                 id = yarl_url.path.strip('/watch/')
                 hd_url = self.get_gif(id)['gif']['urls'].get('hd') or self.get_gif(id)['gif']['urls'].get('sd')
@@ -301,6 +726,14 @@ class HTTP:
         raise TypeError(f'"{strip_ip(str_url)}" is not a valid RedGifs URL')
 
 
+class _Flight:
+    __slots__ = ('task', 'waiters')
+
+    def __init__(self, task: asyncio.Future[Any]) -> None:
+        self.task: asyncio.Future[Any] = task
+        self.waiters: int = 0
+
+
 class AsyncHttp:
     def __init__(
         self,
@@ -308,11 +741,38 @@ class AsyncHttp:
         *,
         proxy: Optional[str] = None,
         proxy_auth: Optional[ProxyAuth] = None,
+        limits: Optional[PoolLimits] = None,
+        media_limits: Optional[PoolLimits] = None,
+        token_store: Optional[TokenStore] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry: Optional[RetryPolicy] = RetryPolicy(),
+        cache: Optional[BaseCache] = None,
+        hooks: Sequence[RequestHook] = (),
+        json_loads: Optional[Callable[[bytes], Any]] = None,
+        transport: Optional[AsyncTransport] = None,
     ) -> None:
-        if session is not None and session is not isinstance(session, aiohttp.ClientSession):
+        if session is not None and not isinstance(session, aiohttp.ClientSession):
             raise RuntimeError('session is not of type aiohttp.ClientSession')
+        if transport is None and session is not None and limits is not None:
+            # The connector of a session can't be replaced, so its limits can't be applied
+            raise TypeError('limits cannot be used with session, set them on the connector of the session instead')
 
-        self.__session: aiohttp.ClientSession = session or aiohttp.ClientSession()
+        if transport is not None:
+            self.transport: AsyncTransport = transport
+            self.media_transport: AsyncTransport = transport
+        else:
+            # API calls and media downloads use separate sessions (and connectors) so that
+            # many large downloads can't use up the connections needed for API calls.
+            api_session = session or aiohttp.ClientSession(
+                connector=self._make_connector(limits or PoolLimits()), trace_configs=[_trace_config()]
+            )
+            self.transport = AiohttpTransport(api_session)
+            if session is None or media_limits is not None:
+                self.media_transport = AiohttpTransport(
+                    aiohttp.ClientSession(connector=self._make_connector(media_limits or PoolLimits()))
+                )
+            else:
+                self.media_transport = self.transport
         self.headers: Dict[str, str] = {
             'User-Agent': f'redgifs (https://github.com/scrazzz/redgifs {__version__}) Python/{sys.version[:3]}'
         }
@@ -325,39 +785,206 @@ class AsyncHttp:
         else:
             self._proxy_auth = None
 
+        self._temporary_login: bool = False
+        self._token_expires_at: Optional[float] = None
+        self._token_lock: asyncio.Lock = asyncio.Lock()
+        self.token_store: Optional[TokenStore] = token_store
+        # Temporary tokens are tied to the User-Agent and IP address they were requested with
+        self._token_store_key: str = f'{self.headers["User-Agent"]} {self.proxy or ""}'
+        self.rate_limiter: Optional[RateLimiter] = rate_limiter
+        self.retry: Optional[RetryPolicy] = retry
+        self.cache: Optional[BaseCache] = cache
+        self.hooks: List[RequestHook] = list(hooks)
+        self.json_loads: Callable[[bytes], Any] = json_loads or _json_loads
+        self._inflight: Dict[str, _Flight] = {}
+
+    @staticmethod
+    def _make_connector(limits: PoolLimits) -> aiohttp.TCPConnector:
+        return aiohttp.TCPConnector(
+            limit=limits.max_connections,
+            limit_per_host=limits.max_connections_per_host,
+            keepalive_timeout=limits.keepalive_timeout,
+            ttl_dns_cache=limits.dns_cache_ttl,
+            use_dns_cache=True,
+        )
+
     async def request(self, route: Route, **kwargs: Any) -> Any:
+        # Only GET requests without a body can be shared
+        if route.method != 'GET' or kwargs:
+            return await self._request(route, **kwargs)
+
+        # Identical requests that are in flight share a single underlying request
+        key = f'{route.method} {route.url}'
+        flight = self._inflight.get(key)
+        if flight is None:
+            flight = _Flight(asyncio.ensure_future(self._request(route)))
+            self._inflight[key] = flight
+            flight.task.add_done_callback(lambda _: self._land(key, flight))
+        else:
+            _log.debug('%s is already in flight, waiting for it', key)
+
+        flight.waiters += 1
+        try:
+            # The request is shielded so that one caller being cancelled doesn't cancel it for the others
+            return await asyncio.shield(flight.task)
+        finally:
+            flight.waiters -= 1
+            if flight.waiters == 0 and not flight.task.done():
+                # Every caller was cancelled, nobody needs the response anymore
+                self._land(key, flight)
+                flight.task.cancel()
+
+    def _land(self, key: str, flight: _Flight) -> None:
+        if self._inflight.get(key) is flight:
+            del self._inflight[key]
+
+    async def _request(self, route: Route, **kwargs: Any) -> Any:
         url: str = route.url
         method: str = route.method
-        async with self.__session.request(
-            method,
-            url,
-            headers=self.headers,
-            proxy=str(self.proxy) if self.proxy else None,
-            proxy_auth=self._proxy_auth,
-            **kwargs,
-        ) as resp:
-            _log.debug(f'{method} {url} returned code: {resp.status}')
-            js = await resp.json()
-            if resp.status == 200:
-                _log.debug(f'{method} {url} received: {js}')
-                return js
-            else:
-                raise HTTPException(resp, js)
+
+        entry = self.cache.lookup(route) if self.cache is not None else None
+        if entry is not None and entry.fresh:
+            _log.debug('%s %s served from cache', method, url)
+            return entry.data
+
+        trace = _RequestTrace(route, self.hooks)
+        trace.start()
+        try:
+            data = await self._send(route, entry, trace, **kwargs)
+        except BaseException as e:
+            trace.error(e)
+            raise
+        trace.end()
+        return data
+
+    async def _send(self, route: Route, entry: Optional[CacheEntry], trace: _RequestTrace, **kwargs: Any) -> Any:
+        url: str = route.url
+        method: str = route.method
+        # Ask RedGifs to only send an expired response back if it changed
+        conditional = entry.conditional_headers() if entry is not None else {}
+
+        refreshable = self._temporary_login and route.path != TEMP_TOKEN_PATH
+        if refreshable and self._token_expiring():
+            await self._refresh_token(self.headers.get('authorization'))
+
+        family = _route_family(route.path)
+        retries, waited, replayed = 0, 0.0, False
+        while True:
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire_async(family)
+
+            authorization = self.headers.get('authorization')
+            headers = {**self.headers, **conditional} if conditional else self.headers
+            try:
+                async with self.transport.request(
+                    method,
+                    url,
+                    headers=headers,
+                    proxy=str(self.proxy) if self.proxy else None,
+                    proxy_auth=self._proxy_auth,
+                    trace_request_ctx=trace,
+                    **kwargs,
+                ) as resp:
+                    if self.rate_limiter is not None:
+                        self.rate_limiter.update(family, resp.status, resp.headers)
+                    trace.status = resp.status
+
+                    if resp.status == 401 and refreshable and not replayed:
+                        # The token expired earlier than expected, replay the request once with a new one
+                        _log.debug('%s %s returned code: 401, refreshing the temporary token', method, url)
+                        await self._refresh_token(authorization)
+                        replayed = True
+                        continue
+
+                    delay = None
+                    if self.retry is not None and resp.status in self.retry.statuses:
+                        delay = self._retry_delay(retries, waited, resp.headers.get('Retry-After'))
+
+                    if delay is None:
+                        body = await resp.read()
+                        trace.bytes = len(body)
+                        if resp.status == 304 and entry is not None and self.cache is not None:
+                            _log_response(trace)
+                            _log.debug('%s %s not modified, served from cache', method, url)
+                            self.cache.revalidated(route, entry)
+                            return entry.data
+                        if resp.status == 200:
+                            js = self.json_loads(body)
+                            _log_response(trace, js)
+                            if self.cache is not None:
+                                self.cache.set(route, js, resp.headers)
+                            return js
+                        else:
+                            # Error pages are not always JSON, e.g. a 502 from the load balancer
+                            text = await resp.text()
+                            try:
+                                error = json.loads(text)
+                            except ValueError:
+                                error = text
+                            _log_response(trace)
+                            raise HTTPException(resp, error)
+
+                    _log.debug('%s %s returned code: %s, retrying in %.2fs', method, url, resp.status, delay)
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                delay = self._retry_delay(retries, waited)
+                if delay is None:
+                    raise
+                _log.debug('%s %s raised %s, retrying in %.2fs', method, url, e.__class__.__name__, delay)
+
+            await asyncio.sleep(delay)
+            retries += 1
+            waited += delay
+            trace.retries = retries
+
+    def _retry_delay(self, retries: int, waited: float, retry_after: Optional[str] = None) -> Optional[float]:
+        if self.retry is None:
+            return None
+        return self.retry._next_delay(retries, waited, retry_after)
 
     async def close(self) -> None:
-        await self.__session.close()
+        await self.transport.close()
+        if self.media_transport is not self.transport:
+            await self.media_transport.close()
 
     async def get_temp_token(self):
-        return await self.request(Route('GET', '/v2/auth/temporary'))
+        return await self.request(Route('GET', TEMP_TOKEN_PATH))
 
     # TODO: Implement OAuth login support
     async def login(self, username: Optional[str] = None, password: Optional[str] = None) -> None:
         if (username and password) is None:
-            temp_token = await self.get_temp_token()
-            self.headers['authorization'] = f'Bearer {temp_token["token"]}'
+            self._temporary_login = True
+            await self._refresh_token()
         else:
             raise NotImplementedError
 
+    def _token_expiring(self) -> bool:
+        return self._token_expires_at is not None and self._token_expires_at - TOKEN_EXPIRY_MARGIN <= time.time()
+
+    async def _refresh_token(self, stale: Optional[str] = None) -> None:
+        # Only a single task fetches a new token. The tasks that were waiting on the
+        # lock see that the token they used was already replaced and just reuse the new one.
+        async with self._token_lock:
+            if stale is not None and self.headers.get('authorization') != stale:
+                return
+
+            if self.token_store is None:
+                token = (await self.get_temp_token())['token']
+            else:
+                # Reuse the token saved by another process (or an earlier run) if it's still valid.
+                # The file lock is blocking, so it's acquired and released in the executor.
+                loop = asyncio.get_running_loop()
+                fd = await loop.run_in_executor(None, self.token_store._acquire)
+                try:
+                    token = await loop.run_in_executor(None, self.token_store.get, self._token_store_key)
+                    if token is None or f'Bearer {token}' == stale:
+                        token = (await self.get_temp_token())['token']
+                        await loop.run_in_executor(None, self.token_store.set, self._token_store_key, token)
+                finally:
+                    await loop.run_in_executor(None, self.token_store._release, fd)
+
+            self.headers['authorization'] = f'Bearer {token}'
+            self._token_expires_at = _token_expiry(token)
+
     # GIF methods
 
     def get_tags(self, **params: Any) -> Response[TagsResponse]:
@@ -366,6 +993,9 @@ class AsyncHttp:
     def get_gif(self, id: str, **params: Any) -> Response[GetGifResponse]:
         return self.request(Route('GET', '/v2/gifs/{id}', id=id), **params)
 
+    def get_gifs(self, ids: List[str], **params: Any) -> Response[GetGifsResponse]:
+        return self.request(Route('GET', '/v2/gifs?ids={ids}', ids=','.join(ids)), **params)
+
     def search(self, search_text: str, order: Order, count: int, page: int, **params: Any) -> Response[GifResponse]:
         r = Route(
             'GET',
@@ -484,27 +1114,176 @@ class AsyncHttp:
 
     # download
 
-    async def download(self, url: str, fp: Union[str, bytes, os.PathLike[Any], io.BufferedIOBase]) -> int:
+    async def _acquire_media(self) -> None:
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire_async('media')
+
+    def _check_media_response(self, r: aiohttp.ClientResponse, url: str) -> None:
+        _log.debug('GET %s returned code: %s', url, r.status)
+
+        content_type = r.headers['Content-Type']
+        if content_type not in ['video/mp4', 'image/jpeg']:
+            _log.error(f'GET {url} returned improper content-type: {content_type}')
+            raise TypeError(f'"{url}" returned invalid content type for downloading: {content_type}')
+
+    async def _write_chunks(self, r: aiohttp.ClientResponse, f: Any, chunk_size: int) -> int:
+        # Disk writes are done in the default executor so that they never block the event loop.
+        # The next chunk is read from the socket while the previous one is being written,
+        # so at most two chunks are held in memory at any time.
+        loop = asyncio.get_running_loop()
+        written = 0
+        pending: Optional[asyncio.Future[int]] = None
+        async for chunk in r.content.iter_chunked(chunk_size):
+            if pending is not None:
+                written += await pending
+            pending = loop.run_in_executor(None, f.write, chunk)
+        if pending is not None:
+            written += await pending
+        return written
+
+    async def _download(self, url: str, fp: Union[str, bytes, os.PathLike[Any], io.BufferedIOBase], chunk_size: int) -> int:
+        loop = asyncio.get_running_loop()
+        await self._acquire_media()
+        async with self.media_transport.request('GET', url, headers=self.headers) as r:
+            self._check_media_response(r, url)
+
+            if isinstance(fp, io.BufferedIOBase):
+                return await self._write_chunks(r, fp, chunk_size)
+
+            f = await loop.run_in_executor(None, open, fp, 'wb')
+            try:
+                return await self._write_chunks(r, f, chunk_size)
+            finally:
+                await loop.run_in_executor(None, f.close)
+
+    async def _download_resumable(self, url: str, fp: Union[str, bytes, os.PathLike[Any]], chunk_size: int) -> int:
+        loop = asyncio.get_running_loop()
+        path = os.fsdecode(fp)
+        part = path + '.part'
+        offset = os.path.getsize(part) if os.path.exists(part) else 0
+
+        headers = self.headers
+        if offset:
+            headers = {**self.headers, 'Range': f'bytes={offset}-'}
+
+        await self._acquire_media()
+        async with self.media_transport.request('GET', url, headers=headers) as r:
+            if r.status == 416:
+                # The .part file is either already complete or larger than the media itself
+                _, _, total = _parse_content_range(r.headers.get('Content-Range', ''))
+                if total != offset:
+                    await loop.run_in_executor(None, os.remove, part)
+                    return await self._download_resumable(url, fp, chunk_size)
+                await loop.run_in_executor(None, os.replace, part, path)
+                return offset
+
+            self._check_media_response(r, url)
+
+            if r.status == 206:
+                start, _, total = _parse_content_range(r.headers.get('Content-Range', ''))
+                if start != offset:
+                    raise RedGifsError(f'"{strip_ip(url)}" resumed at byte {start} instead of byte {offset}')
+                mode = 'ab'
+            else:
+                # The server ignored the Range header and is sending the whole media again
+                offset, mode = 0, 'wb'
+                total = r.content_length
+
+            f = await loop.run_in_executor(None, open, part, mode)
+            try:
+                size = offset + await self._write_chunks(r, f, chunk_size)
+            finally:
+                await loop.run_in_executor(None, f.close)
+
+        if total is not None and size != total:
+            raise RedGifsError(f'"{strip_ip(url)}" ended after {size} of {total} bytes, download it again to resume')
+
+        await loop.run_in_executor(None, os.replace, part, path)
+        return size
+
+    async def _download_segment(self, url: str, part: str, start: int, end: int, chunk_size: int) -> int:
+        loop = asyncio.get_running_loop()
+        headers = {**self.headers, 'Range': f'bytes={start}-{end}'}
+        await self._acquire_media()
+        async with self.media_transport.request('GET', url, headers=headers) as r:
+            self._check_media_response(r, url)
+            if r.status != 206:
+                raise RedGifsError(f'"{strip_ip(url)}" did not return the requested range {start}-{end}')
+
+            f = await loop.run_in_executor(None, open, part, 'r+b')
+            try:
+                await loop.run_in_executor(None, f.seek, start)
+                written = await self._write_chunks(r, f, chunk_size)
+            finally:
+                await loop.run_in_executor(None, f.close)
+
+        if written != end - start + 1:
+            raise RedGifsError(f'"{strip_ip(url)}" sent {written} bytes for the range {start}-{end}')
+        return written
+
+    async def _download_segmented(
+        self, url: str, fp: Union[str, bytes, os.PathLike[Any]], chunk_size: int, segments: int
+    ) -> int:
+        loop = asyncio.get_running_loop()
+        await self._acquire_media()
+        async with self.media_transport.request('HEAD', url, headers=self.headers, allow_redirects=True) as r:
+            status, headers = r.status, r.headers
+        size = int(headers.get('Content-Length', 0))
+        if status != 200 or headers.get('Accept-Ranges') != 'bytes' or size <= chunk_size:
+            # Ranges are not supported (or not worth it), fallback to a single stream
+            _log.debug('HEAD %s does not allow a segmented download, using a single stream', url)
+            return await self._download(url, fp, chunk_size)
+
+        path = os.fsdecode(fp)
+        part = path + '.part'
+        segments = min(segments, size // chunk_size)
+        bounds = [(size * i // segments, size * (i + 1) // segments - 1) for i in range(segments)]
+
+        def preallocate() -> None:
+            # Every segment is written at its own offset of this file
+            with open(part, 'wb') as f:
+                f.truncate(size)
+
+        await loop.run_in_executor(None, preallocate)
+
+        tasks = [asyncio.ensure_future(self._download_segment(url, part, start, end, chunk_size)) for start, end in bounds]
+        try:
+            written = sum(await asyncio.gather(*tasks))
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            await loop.run_in_executor(None, os.remove, part)
+            raise
+
+        await loop.run_in_executor(None, os.replace, part, path)
+        return written
+
+    async def download(
+        self,
+        url: str,
+        fp: Union[str, bytes, os.PathLike[Any], io.BufferedIOBase],
+        *,
+        chunk_size: int = DOWNLOAD_CHUNK_SIZE,
+        resume: bool = False,
+        segments: int = 1,
+    ) -> int:
         yarl_url = yarl.URL(url)
         str_url = str(yarl_url)
 
+        if resume and isinstance(fp, io.BufferedIOBase):
+            raise TypeError('resume is only supported when fp is a filename')
+        if resume and segments > 1:
+            raise ValueError('resume cannot be used with a segmented download')
+
         async def dl(url: str) -> int:
-            async with self.__session.get(url, headers=self.headers) as r:
-                _log.debug(f'GET {str_url} returned code: {r.status}')
-
-                content_type = r.headers['Content-Type']
-                if content_type not in ['video/mp4', 'image/jpeg']:
-                    _log.error(f'GET {url} returned improper content-type: {content_type}')
-                    raise TypeError(f'"{url}" returned invalid content type for downloading: {content_type}')
-
-                data = await r.read()
-                if isinstance(fp, io.BufferedIOBase):
-                    return fp.write(data)
-                else:
-                    with open(fp, 'wb') as f:
-                        return f.write(data)
-
-        if yarl_url.host is not None and 'redgifs.com' in yarl_url.host:
+            if resume:
+                return await self._download_resumable(url, fp, chunk_size)  # type: ignore - fp is not a BufferedIOBase here
+            if segments > 1 and not isinstance(fp, io.BufferedIOBase):
+                return await self._download_segmented(url, fp, chunk_size, segments)
+            return await self._download(url, fp, chunk_size)
+
+        if _is_redgifs_host(yarl_url.host):
             if 'watch' in yarl_url.path:
                 id = yarl_url.path.strip('/watch/')
                 hd_url = (await self.get_gif(id))['gif']['urls'].get('hd') or (await self.get_gif(id))['gif']['urls'].get(
@@ -0,0 +1,323 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2022-present scrazzz
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import math
+import asyncio
+import hashlib
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Deque,
+    Generic,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    TypeVar,
+    Union,
+)
+
+__all__ = ('PageIterator', 'AsyncPageIterator')
+
+T = TypeVar('T')
+
+
+class _SeenIds:
+    __slots__ = ('_ids',)
+
+    def __init__(self) -> None:
+        self._ids: Set[str] = set()
+
+    def add(self, id: str) -> bool:
+        """Adds an ID and returns whether it was already seen."""
+        if id in self._ids:
+            return True
+        self._ids.add(id)
+        return False
+
+
+class _BloomFilter:
+    # Remembers IDs in a fixed amount of memory (about 1.8 bytes per ID), but it
+    # may wrongly report a new ID as seen with a probability of `error_rate`
+    __slots__ = ('_size', '_hashes', '_bits')
+
+    def __init__(self, capacity: int, error_rate: float = 0.001) -> None:
+        self._size: int = max(64, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self._hashes: int = max(1, round(self._size / max(1, capacity) * math.log(2)))
+        self._bits: bytearray = bytearray((self._size + 7) // 8)
+
+    def _bits_of(self, id: str) -> Iterator[int]:
+        # Double hashing, the bits are derived from two halves of a single digest
+        digest = hashlib.blake2b(id.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        return ((h1 + i * h2) % self._size for i in range(self._hashes))
+
+    def add(self, id: str) -> bool:
+        """Adds an ID and returns whether it was probably already seen."""
+        seen = True
+        for bit in self._bits_of(id):
+            mask = 1 << (bit & 7)
+            if not self._bits[bit >> 3] & mask:
+                self._bits[bit >> 3] |= mask
+                seen = False
+        return seen
+
+
+def _seen_ids(dedupe: Union[bool, int]) -> Optional[Union[_SeenIds, _BloomFilter]]:
+    if dedupe is True:
+        return _SeenIds()
+    if dedupe:
+        return _BloomFilter(dedupe)
+    return None
+
+
+def _attr(result: Any, name: str) -> Any:
+    # Pages are dicts when the client returns raw results
+    return result[name] if isinstance(result, dict) else getattr(result, name)
+
+
+def _id(item: Any) -> str:
+    return item['id'] if isinstance(item, dict) else item.id
+
+
+def _unseen(iterator: Union[PageIterator[T], AsyncPageIterator[T]], result: Any) -> List[T]:
+    items = iterator._items(result)
+    if iterator._seen is None:
+        return items
+
+    unseen = [item for item in items if not iterator._seen.add(_id(item))]
+    iterator.duplicates += len(items) - len(unseen)
+    return unseen
+
+
+class PageIterator(Generic[T]):
+    """An iterator over the GIFs or images of every page of a search.
+
+    This is returned by :meth:`API.iter_search`, :meth:`API.iter_creator` and :meth:`API.iter_niche`.
+    While the items of a page are being consumed, the next pages are requested in the background.
+
+    Once the first page is received, up to ``prefetch`` of the remaining pages are requested
+    concurrently. With a large ``prefetch`` every page is fetched at once, and unless the
+    iterator is ``ordered`` the items of each page are handed out as soon as it's received.
+
+    With an order like :attr:`Order.TRENDING <redgifs.Order.TRENDING>`, items can move between
+    pages while they're requested, so the same item may be seen twice. The iterator can
+    ``dedupe`` the items by their ID: ``True`` remembers every ID, while an :class:`int` remembers
+    about that many IDs in a fixed amount of memory, at the cost of rarely skipping a new item.
+
+    Attributes
+    ----------
+    page: :class:`int`
+        The page that the current items are from.
+    prefetch: :class:`int`
+        The maximum amount of pages requested in the background at once.
+    ordered: :class:`bool`
+        Whether the pages are handed out in order.
+    pages: Optional[:class:`int`]
+        The total number of pages, or ``None`` if the first page was not received yet.
+    total: Optional[:class:`int`]
+        The total number of items, or ``None`` if the first page was not received yet.
+    duplicates: :class:`int`
+        The amount of items that were skipped because they were already seen.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[int], Any],
+        items: Callable[[Any], List[T]],
+        *,
+        page: int = 1,
+        prefetch: int = 1,
+        ordered: bool = True,
+        dedupe: Union[bool, int] = False,
+    ) -> None:
+        self._fetch: Callable[[int], Any] = fetch
+        self._items: Callable[[Any], List[T]] = items
+        self.prefetch: int = prefetch
+        self.ordered: bool = ordered
+        self.page: int = page
+        self.pages: Optional[int] = None
+        self.total: Optional[int] = None
+        self.duplicates: int = 0
+        self._seen: Optional[Union[_SeenIds, _BloomFilter]] = _seen_ids(dedupe)
+        self._iterator: Iterator[T] = self._iterate()
+
+    def _iterate(self) -> Iterator[T]:
+        result = self._fetch(self.page)
+        pending: Deque[Future[Any]] = deque()
+        next_page = self.page + 1
+        pool = ThreadPoolExecutor(max_workers=self.prefetch) if self.prefetch > 0 else None
+        try:
+            while True:
+                pages: int = _attr(result, 'pages')
+                self.pages, self.total = pages, _attr(result, 'total')
+                # Request the next pages before handing out the items of this one
+                while pool is not None and len(pending) < self.prefetch and next_page <= pages:
+                    pending.append(pool.submit(self._fetch, next_page))
+                    next_page += 1
+
+                yield from _unseen(self, result)
+
+                if pending:
+                    if self.ordered:
+                        future = pending.popleft()
+                    else:
+                        future = next(iter(wait(pending, return_when=FIRST_COMPLETED).done))
+                        pending.remove(future)
+                    result = future.result()
+                elif next_page <= pages:
+                    result = self._fetch(next_page)
+                    next_page += 1
+                else:
+                    return
+                self.page = _attr(result, 'page')
+        finally:
+            for future in pending:
+                future.cancel()
+            if pool is not None:
+                pool.shutdown(wait=False)
+
+    def __iter__(self) -> PageIterator[T]:
+        return self
+
+    def __next__(self) -> T:
+        return next(self._iterator)
+
+    def close(self) -> None:
+        """Stops the iteration and cancels the pages that were not requested yet."""
+        self._iterator.close()  # type: ignore - this is a generator
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__} page={self.page} pages={self.pages} total={self.total}>'
+
+
+class AsyncPageIterator(Generic[T]):
+    """An async iterator over the GIFs or images of every page of a search.
+
+    This is returned by :meth:`aio.API.iter_search() <redgifs.aio.API.iter_search>`,
+    :meth:`aio.API.iter_creator() <redgifs.aio.API.iter_creator>` and
+    :meth:`aio.API.iter_niche() <redgifs.aio.API.iter_niche>`.
+    While the items of a page are being consumed, the next pages are requested in the background.
+
+    Once the first page is received, up to ``prefetch`` of the remaining pages are requested
+    concurrently. With a large ``prefetch`` every page is fetched at once, and unless the
+    iterator is ``ordered`` the items of each page are handed out as soon as it's received.
+
+    With an order like :attr:`Order.TRENDING <redgifs.Order.TRENDING>`, items can move between
+    pages while they're requested, so the same item may be seen twice. The iterator can
+    ``dedupe`` the items by their ID: ``True`` remembers every ID, while an :class:`int` remembers
+    about that many IDs in a fixed amount of memory, at the cost of rarely skipping a new item.
+
+    Attributes
+    ----------
+    page: :class:`int`
+        The page that the current items are from.
+    prefetch: :class:`int`
+        The maximum amount of pages requested in the background at once.
+    ordered: :class:`bool`
+        Whether the pages are handed out in order.
+    pages: Optional[:class:`int`]
+        The total number of pages, or ``None`` if the first page was not received yet.
+    total: Optional[:class:`int`]
+        The total number of items, or ``None`` if the first page was not received yet.
+    duplicates: :class:`int`
+        The amount of items that were skipped because they were already seen.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[int], Awaitable[Any]],
+        items: Callable[[Any], List[T]],
+        *,
+        page: int = 1,
+        prefetch: int = 1,
+        ordered: bool = True,
+        dedupe: Union[bool, int] = False,
+    ) -> None:
+        self._fetch: Callable[[int], Awaitable[Any]] = fetch
+        self._items: Callable[[Any], List[T]] = items
+        self.prefetch: int = prefetch
+        self.ordered: bool = ordered
+        self.page: int = page
+        self.pages: Optional[int] = None
+        self.total: Optional[int] = None
+        self.duplicates: int = 0
+        self._seen: Optional[Union[_SeenIds, _BloomFilter]] = _seen_ids(dedupe)
+        self._iterator: AsyncIterator[T] = self._iterate()
+
+    async def _iterate(self) -> AsyncIterator[T]:
+        result = await self._fetch(self.page)
+        pending: Deque[asyncio.Future[Any]] = deque()
+        next_page = self.page + 1
+        try:
+            while True:
+                pages: int = _attr(result, 'pages')
+                self.pages, self.total = pages, _attr(result, 'total')
+                # Request the next pages before handing out the items of this one
+                while len(pending) < self.prefetch and next_page <= pages:
+                    pending.append(asyncio.ensure_future(self._fetch(next_page)))
+                    next_page += 1
+
+                for item in _unseen(self, result):
+                    yield item
+
+                if pending:
+                    if self.ordered:
+                        future = pending.popleft()
+                    else:
+                        done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                        future = next(iter(done))
+                        pending.remove(future)
+                    result = await future
+                elif next_page <= pages:
+                    result = await self._fetch(next_page)
+                    next_page += 1
+                else:
+                    return
+                self.page = _attr(result, 'page')
+        finally:
+            for future in pending:
+                future.cancel()
+            # Wait for the cancelled requests so that no task is destroyed while it's pending
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    def __aiter__(self) -> AsyncPageIterator[T]:
+        return self
+
+    async def __anext__(self) -> T:
+        return await self._iterator.__anext__()
+
+    async def aclose(self) -> None:
+        """Stops the iteration and cancels the pages that are being requested."""
+        await self._iterator.aclose()  # type: ignore - this is an async generator
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__} page={self.page} pages={self.pages} total={self.total}>'
@@ -23,8 +23,25 @@ DEALINGS IN THE SOFTWARE.
 """
 
 import datetime
-from dataclasses import dataclass
-from typing import Dict, List, Optional, TypedDict
+from dataclasses import dataclass, fields
+from typing import TYPE_CHECKING, Any, Callable, Dict, Generic, List, NamedTuple, Optional, Tuple, TypeVar, TypedDict, Union
+
+if TYPE_CHECKING:
+    from .types.gif import GifInfo, MediaInfo
+    from .types.image import ImageInfo
+
+T = TypeVar('T')
+
+_MISSING: Any = object()
+
+
+def _hd_url(urls: 'MediaInfo') -> Optional[str]:
+    return urls.get('hd')
+
+
+def _field_values(obj: Any, cls: type) -> Tuple[Any, ...]:
+    # The values of the dataclass fields of `cls`, used to compare lazy and eager models
+    return tuple(getattr(obj, field.name) for field in fields(cls))
 
 
 @dataclass
@@ -209,6 +226,263 @@ class Image:
     avg_color: str
 
 
+class LazyGIF(GIF):
+    """A :class:`GIF` that only computes its :attr:`~GIF.create_date` and
+    :attr:`~GIF.urls` when they're first accessed.
+
+    This is returned instead of :class:`GIF` by the search methods of the
+    API clients created with ``lazy=True``.
+
+    .. note::
+
+        It compares equal to a :class:`GIF` with the same values, but it can't be
+        copied with :func:`dataclasses.replace`.
+    """
+
+    __slots__ = ('_data', '_create_date', '_urls')
+
+    def __init__(self, data: 'GifInfo', *, int_duration: bool = False) -> None:
+        self._data: GifInfo = data
+        self._create_date: Optional[datetime.datetime] = _MISSING
+        self._urls: URL = _MISSING
+        self.id = data['id']
+        self.has_audio = data['hasAudio']
+        self.width = data['width']
+        self.height = data['height']
+        self.likes = data['likes']
+        self.tags = data['tags']
+        self.verified = data['verified']
+        self.views = data['views']
+        # Some of the eager parsers truncate the duration, `int_duration` does the same
+        duration = data['duration']
+        self.duration = int(duration) if int_duration and duration is not None else duration
+        self.published = data['published']
+        self.username = data['userName']
+        self.type = data['type']
+        self.avg_color = data['avgColor']
+
+    @property
+    def create_date(self) -> Optional[datetime.datetime]:
+        if self._create_date is _MISSING:
+            self._create_date = datetime.datetime.fromtimestamp(self._data['createDate'], tz=datetime.timezone.utc)
+        return self._create_date
+
+    @create_date.setter
+    def create_date(self, value: Optional[datetime.datetime]) -> None:
+        self._create_date = value
+
+    @property
+    def urls(self) -> URL:
+        if self._urls is _MISSING:
+            from .utils import build_file_url, to_embed_url, to_web_url
+
+            urls = self._data['urls']
+            self._urls = URL(
+                sd=urls['sd'],
+                hd=urls.get('hd'),
+                poster=urls.get('poster'),
+                thumbnail=urls.get('thumbnail'),
+                vthumbnail=urls.get('vthumbnail'),
+                web_url=to_web_url(self.id),
+                file_url=build_file_url(urls['sd']),
+                embed_url=to_embed_url(urls['sd']),
+            )
+        return self._urls
+
+    @urls.setter
+    def urls(self, value: URL) -> None:
+        self._urls = value
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, GIF):
+            return _field_values(self, GIF) == _field_values(other, GIF)
+        return NotImplemented
+
+
+class LazyImage(Image):
+    """An :class:`Image` that only computes its :attr:`~Image.create_date` and
+    :attr:`~Image.urls` when they're first accessed.
+
+    This is returned instead of :class:`Image` by the search methods of the
+    API clients created with ``lazy=True``.
+
+    .. note::
+
+        It compares equal to an :class:`Image` with the same values, but it can't be
+        copied with :func:`dataclasses.replace`.
+    """
+
+    __slots__ = ('_data', '_create_date', '_urls', '_embed_url')
+
+    def __init__(
+        self,
+        data: Union['GifInfo', 'ImageInfo'],
+        *,
+        embed_url: Callable[['MediaInfo'], Optional[str]] = _hd_url,
+    ) -> None:
+        # The parsers derive the embed URL of images differently, `embed_url` is the one to use
+        self._data: Union[GifInfo, ImageInfo] = data
+        self._create_date: Optional[datetime.datetime] = _MISSING
+        self._urls: URL = _MISSING
+        self._embed_url: Callable[[MediaInfo], Optional[str]] = embed_url
+        self.id = data['id']
+        self.width = data['width']
+        self.height = data['height']
+        self.likes = data['likes']
+        self.tags = data['tags']
+        self.verified = data['verified']
+        self.views = data['views']
+        self.published = data['published']
+        self.username = data['userName']
+        self.type = data['type']
+        self.avg_color = data['avgColor']
+
+    @property
+    def create_date(self) -> Optional[datetime.datetime]:
+        if self._create_date is _MISSING:
+            self._create_date = datetime.datetime.fromtimestamp(self._data['createDate'], tz=datetime.timezone.utc)
+        return self._create_date
+
+    @create_date.setter
+    def create_date(self, value: Optional[datetime.datetime]) -> None:
+        self._create_date = value
+
+    @property
+    def urls(self) -> URL:
+        if self._urls is _MISSING:
+            from .utils import to_web_url
+
+            urls = self._data['urls']
+            self._urls = URL(
+                sd=urls.get('sd'),
+                hd=urls.get('hd'),
+                poster=urls.get('poster'),
+                thumbnail=urls.get('thumbnail'),
+                vthumbnail=urls.get('vthumbnail'),
+                web_url=to_web_url(self.id),
+                file_url=None,
+                embed_url=self._embed_url(urls),
+            )
+        return self._urls
+
+    @urls.setter
+    def urls(self, value: URL) -> None:
+        self._urls = value
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Image):
+            return _field_values(self, Image) == _field_values(other, Image)
+        return NotImplemented
+
+
+class GIFRecord(NamedTuple):
+    """A compact record of a GIF, returned instead of :class:`GIF` by the
+    API clients created with ``result_format='tuple'``.
+
+    Only the values sent by RedGifs are kept, nothing is derived from them.
+
+    Attributes
+    ----------
+    id: :class:`str`
+        The GIF's ID.
+    create_date: :class:`int`
+        The timestamp when the GIF was published.
+    has_audio: :class:`bool`
+        Wheather the GIF has sound.
+    width: :class:`int`
+        The GIF's width.
+    height: :class:`int`
+        The GIF's height.
+    likes: :class:`int`
+        The amount of likes for the GIF.
+    tags: List[:class:`str`]
+        A list of tags for the GIF.
+    verified: :class:`bool`
+        Wheather the publisher of the GIF is a verified creator.
+    views: Optional[:class:`int`]
+        The amount of views for the GIF.
+    duration: Optional[:class:`float`]
+        The GIF's duration in seconds.
+    published: :class:`bool`
+        Wheather the GIF is published.
+    urls: Dict[:class:`str`, Optional[:class:`str`]]
+        The URLs of the GIF as sent by RedGifs, e.g. ``urls['hd']``.
+    username: :class:`str`
+        The username of the publisher.
+    type: :class:`int`
+
+    avg_color: :class:`str`
+
+    """
+
+    id: str
+    create_date: int
+    has_audio: bool
+    width: int
+    height: int
+    likes: int
+    tags: List[str]
+    verified: bool
+    views: Optional[int]
+    duration: Optional[float]
+    published: bool
+    urls: Dict[str, Optional[str]]
+    username: str
+    type: int
+    avg_color: str
+
+
+class ImageRecord(NamedTuple):
+    """A compact record of an image, returned instead of :class:`Image` by the
+    API clients created with ``result_format='tuple'``.
+
+    Only the values sent by RedGifs are kept, nothing is derived from them.
+
+    Attributes
+    ----------
+    id: :class:`str`
+        The image ID.
+    create_date: :class:`int`
+        The timestamp when the image was published.
+    width: :class:`int`
+        The image width.
+    height: :class:`int`
+        The image height.
+    likes: :class:`int`
+        The amount of likes the image has.
+    tags: List[:class:`str`]
+        A list of tags for the image.
+    verified: :class:`bool`
+        Wheather the publisher of the image is a verified creator.
+    views: Optional[:class:`int`]
+        The amount of views the image has.
+    published: :class:`bool`
+        Wheather the image is published.
+    urls: Dict[:class:`str`, Optional[:class:`str`]]
+        The URLs of the image as sent by RedGifs, e.g. ``urls['hd']``.
+    username: :class:`str`
+        The username of the publisher.
+    type: :class:`int`
+
+    avg_color: :class:`str`
+
+    """
+
+    id: str
+    create_date: int
+    width: int
+    height: int
+    likes: int
+    tags: List[str]
+    verified: bool
+    views: Optional[int]
+    published: bool
+    urls: Dict[str, Optional[str]]
+    username: str
+    type: int
+    avg_color: str
+
+
 @dataclass
 class User:
     # TODO: Document "subscription"
@@ -304,6 +578,36 @@ class User:
     links: Optional[List[Dict[str, str]]]
 
 
+class UserRecord(NamedTuple):
+    """A compact record of a user, returned instead of :class:`User` by the
+    API clients created with ``result_format='tuple'``.
+
+    The attributes are the same as :class:`User`, except for ``creation_time``
+    which is kept as a timestamp.
+    """
+
+    creation_time: Optional[int]
+    description: Optional[str]
+    followers: int
+    following: int
+    gifs: int
+    name: Optional[str]
+    profile_image_url: Optional[str]
+    profile_url: Optional[str]
+    published_collections: Optional[int]
+    published_gifs: int
+    status: Optional[str]
+    subscription: int
+    url: str
+    username: str
+    verified: bool
+    views: int
+    poster: Optional[str]
+    preview: Optional[str]
+    thumbnail: Optional[str]
+    links: Optional[List[Dict[str, str]]]
+
+
 @dataclass
 class SearchResult:
     # TODO: Document "users"
@@ -406,6 +710,32 @@ class CreatorResult:
     images: List[Image]
 
 
+@dataclass
+class BulkResult(Generic[T]):
+    """The result of a single item of a bulk method, such as :meth:`aio.API.get_users() <redgifs.aio.API.get_users>`.
+
+    Attributes
+    ----------
+    key: Any
+        The item this is the result of, e.g. the username for :meth:`~redgifs.aio.API.get_users()`.
+    result: Optional[Any]
+        The result of the item, or ``None`` if it failed.
+    error: Optional[:class:`Exception`]
+        The error raised for the item, or ``None`` if it succeeded.
+    """
+
+    __slots__ = ('key', 'result', 'error')
+
+    key: Any
+    result: Optional[T]
+    error: Optional[Exception]
+
+    @property
+    def ok(self) -> bool:
+        """:class:`bool`: Whether the item succeeded."""
+        return self.error is None
+
+
 class TagSuggestion(TypedDict):
     """The tag suggestion results.
 
@@ -26,24 +26,44 @@ from __future__ import annotations
 
 import logging
 from datetime import datetime, timezone
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Callable, Optional
 
 from .enums import MediaType
 from .errors import RedGifsError
 from .utils import _users_iter, build_file_url, to_embed_url, to_web_url
-from .models import GIF, URL, CreatorResult, Image, User, SearchResult, CreatorsResult, NicheResult, Niche
+from .models import (
+    GIF,
+    URL,
+    CreatorResult,
+    GIFRecord,
+    Image,
+    ImageRecord,
+    LazyGIF,
+    LazyImage,
+    User,
+    UserRecord,
+    SearchResult,
+    CreatorsResult,
+    NicheResult,
+    Niche,
+)
 
 if TYPE_CHECKING:
-    from redgifs.types.gif import GifResponse
-    from redgifs.types.image import ImageResponse
+    from redgifs.types.gif import GifInfo, GifResponse, MediaInfo
+    from redgifs.types.image import ImageInfo, ImageResponse
     from redgifs.types.niches import NicheResponse
-    from redgifs.types.user import CreatorResponse, CreatorsResponse
+    from redgifs.types.user import CreatorResponse, CreatorsResponse, UserInfo
 
 _log = logging.getLogger(__name__)
 
 
+def _search_embed_url(urls: MediaInfo) -> Optional[str]:
+    # The embed URL of the images from parse_search, for LazyImage
+    return to_embed_url(urls.get('hd') or urls['sd'])
+
+
 # For GIFs
-def parse_search(searched_for: str, json: GifResponse, media_type: MediaType) -> SearchResult:
+def parse_search(searched_for: str, json: GifResponse, media_type: MediaType, lazy: bool = False) -> SearchResult:
     _log.debug('Using `parse_search` for: {searched_for}')
     json_gifs = json['gifs']
     users = json['users']
@@ -53,7 +73,9 @@ def parse_search(searched_for: str, json: GifResponse, media_type: MediaType) ->
         pages=json['pages'],
         total=json['total'],
         images=[
-            Image(
+            LazyImage(img, embed_url=_search_embed_url)
+            if lazy
+            else Image(
                 id=img['id'],
                 create_date=datetime.fromtimestamp(img['createDate'], tz=timezone.utc),
                 width=img['width'],
@@ -81,7 +103,9 @@ def parse_search(searched_for: str, json: GifResponse, media_type: MediaType) ->
             if media_type == MediaType.IMAGE
         ],
         gifs=[
-            GIF(
+            LazyGIF(gif, int_duration=True)
+            if lazy
+            else GIF(
                 id=gif['id'],
                 create_date=datetime.fromtimestamp(gif['createDate'], tz=timezone.utc),
                 has_audio=gif['hasAudio'],
@@ -142,7 +166,7 @@ def parse_search(searched_for: str, json: GifResponse, media_type: MediaType) ->
 
 
 # For images
-def parse_search_image(searched_for: str, json: ImageResponse) -> SearchResult:
+def parse_search_image(searched_for: str, json: ImageResponse, lazy: bool = False) -> SearchResult:
     _log.debug('Using `parse_search` for: {searched_for}')
     json_gifs = json['gifs']
     users = json['users']
@@ -153,7 +177,9 @@ def parse_search_image(searched_for: str, json: ImageResponse) -> SearchResult:
         total=json['total'],
         gifs=None,
         images=[
-            Image(
+            LazyImage(gif)
+            if lazy
+            else Image(
                 id=gif['id'],
                 create_date=datetime.fromtimestamp(gif['createDate'], tz=timezone.utc),
                 width=gif['width'],
@@ -195,7 +221,7 @@ def parse_creators(json: CreatorsResponse) -> CreatorsResult:
     )
 
 
-def parse_creator(json: CreatorResponse, media_type: MediaType) -> CreatorResult:
+def parse_creator(json: CreatorResponse, media_type: MediaType, lazy: bool = False) -> CreatorResult:
     _log.debug('Using `parse_creator`')
 
     # RedGifs API should actually throw a 404 HTTP response if the user is not found
@@ -231,7 +257,9 @@ def parse_creator(json: CreatorResponse, media_type: MediaType) -> CreatorResult
         pages=json['pages'],
         total=json['total'],
         gifs=[
-            GIF(
+            LazyGIF(gif)  # type: ignore - We aren't setting values for ImageInfo
+            if lazy
+            else GIF(
                 id=gif['id'],
                 create_date=datetime.fromtimestamp(gif['createDate'], tz=timezone.utc),
                 has_audio=gif['hasAudio'],  # type: ignore - We aren't setting values for ImageInfo
@@ -261,7 +289,9 @@ def parse_creator(json: CreatorResponse, media_type: MediaType) -> CreatorResult
             if media_type == MediaType.GIF
         ],
         images=[
-            Image(
+            LazyImage(img)
+            if lazy
+            else Image(
                 id=img['id'],
                 create_date=datetime.fromtimestamp(img['createDate'], tz=timezone.utc),
                 width=img['width'],
@@ -310,3 +340,130 @@ def parse_search_niche(query: str, json: NicheResponse) -> NicheResult:
             for niche in json['niches']
         ],
     )
+
+
+# For result_format='raw' and result_format='tuple'
+def parse_lightweight(result_format: str, json: Any, records: Callable[[Any], Any]) -> Any:
+    """Returns the response untouched for ``'raw'``, or turned into records for ``'tuple'``."""
+    if result_format == 'raw':
+        return json
+    return records(json)
+
+
+def gif_record(gif: GifInfo) -> GIFRecord:
+    return GIFRecord(
+        gif['id'],
+        gif['createDate'],
+        gif['hasAudio'],
+        gif['width'],
+        gif['height'],
+        gif['likes'],
+        gif['tags'],
+        gif['verified'],
+        gif['views'],
+        gif['duration'],
+        gif['published'],
+        gif['urls'],  # type: ignore - MediaInfo is a dict of URLs
+        gif['userName'],
+        gif['type'],
+        gif['avgColor'],
+    )
+
+
+def image_record(img: ImageInfo) -> ImageRecord:
+    return ImageRecord(
+        img['id'],
+        img['createDate'],
+        img['width'],
+        img['height'],
+        img['likes'],
+        img['tags'],
+        img['verified'],
+        img['views'],
+        img['published'],
+        img['urls'],  # type: ignore - MediaInfo is a dict of URLs
+        img['userName'],
+        img['type'],
+        img['avgColor'],
+    )
+
+
+def user_record(user: UserInfo) -> UserRecord:
+    get = user.get
+    return UserRecord(
+        get('creationtime'),
+        get('description'),
+        user['followers'],
+        user['following'],
+        user['gifs'],
+        get('name'),
+        get('profileImageUrl'),
+        get('profileUrl'),
+        get('publishedCollections'),
+        user['publishedGifs'],
+        get('status'),
+        user['subscription'],
+        user['url'],
+        user['username'],
+        user['verified'],
+        user['views'],
+        get('poster'),
+        get('preview'),
+        get('thumbnail'),
+        get('links'),
+    )
+
+
+def parse_search_records(searched_for: str, json: GifResponse, media_type: MediaType) -> SearchResult:
+    _log.debug('Using `parse_search_records`')
+    items = json['gifs']
+    return SearchResult(
+        searched_for=searched_for,
+        page=json['page'],
+        pages=json['pages'],
+        total=json['total'],
+        gifs=[gif_record(gif) for gif in items] if media_type == MediaType.GIF else [],  # type: ignore
+        images=[image_record(img) for img in items] if media_type == MediaType.IMAGE else [],  # type: ignore
+        users=[user_record(user) for user in json['users']],  # type: ignore
+        tags=json['tags'],
+    )
+
+
+def parse_search_image_records(searched_for: str, json: ImageResponse) -> SearchResult:
+    _log.debug('Using `parse_search_image_records`')
+    return SearchResult(
+        searched_for=searched_for,
+        page=json['page'],
+        pages=json['pages'],
+        total=json['total'],
+        gifs=None,
+        images=[image_record(img) for img in json['gifs']],  # type: ignore
+        users=[user_record(user) for user in json['users']],  # type: ignore
+        tags=json['tags'],
+    )
+
+
+def parse_creators_records(json: CreatorsResponse) -> CreatorsResult:
+    _log.debug('Using `parse_creators_records`')
+    return CreatorsResult(
+        items=[user_record(user) for user in json['items']],  # type: ignore
+        pages=json['pages'],
+        page=json['page'],
+        total=json['total'],
+    )
+
+
+def parse_creator_records(json: CreatorResponse, media_type: MediaType) -> CreatorResult:
+    _log.debug('Using `parse_creator_records`')
+    if len(json['users']) == 0:
+        raise RedGifsError('User not found')
+
+    items = json['gifs']
+    return CreatorResult(
+        creator=user_record(json['users'][0]),  # type: ignore
+        page=json['page'],
+        pages=json['pages'],
+        total=json['total'],
+        gifs=[gif_record(gif) for gif in items] if media_type == MediaType.GIF else [],  # type: ignore
+        images=[image_record(img) for img in items] if media_type == MediaType.IMAGE else [],  # type: ignore
+    )
@@ -0,0 +1,170 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2022-present scrazzz
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import time
+import asyncio
+import logging
+import threading
+from typing import Dict, Mapping, NamedTuple, Optional
+
+from .utils import _parse_retry_after
+
+__all__ = ('RateLimit', 'RateLimiter')
+
+_log = logging.getLogger(__name__)
+
+# The route family of a path is the first one whose prefix matches it
+_ROUTE_FAMILIES = (
+    ('/v2/auth', 'auth'),
+    ('/v2/gifs/search', 'search'),
+    ('/v2/search', 'search'),
+    ('/v2/niches/search', 'search'),
+    ('/v1/creators', 'users'),
+    ('/v1/users', 'users'),
+    ('/v2/users', 'users'),
+)
+
+
+def _route_family(path: str) -> str:
+    for prefix, family in _ROUTE_FAMILIES:
+        if path.startswith(prefix):
+            return family
+    return 'gifs'
+
+
+class RateLimit(NamedTuple):
+    """
+    rate: :class:`float`
+        The amount of requests allowed every ``per`` seconds.
+    per: :class:`float`
+        The length of the period in seconds. Defaults to 1 second.
+    burst: Optional[:class:`int`]
+        The amount of requests that can be sent at once after being idle.
+        Defaults to ``rate``.
+    """
+
+    rate: float
+    per: float = 1.0
+    burst: Optional[int] = None
+
+
+class _Bucket:
+    # A token bucket where every request reserves a token, even if it has to wait for it.
+    # This way the waiting is done outside of the lock and works for both threads and tasks.
+
+    def __init__(self, limit: RateLimit) -> None:
+        self.capacity: float = float(limit.burst or limit.rate)
+        self.fill_rate: float = limit.rate / limit.per
+        self.tokens: float = self.capacity
+        self.updated: float = time.monotonic()
+        self._lock: threading.Lock = threading.Lock()
+
+    def reserve(self) -> float:
+        with self._lock:
+            now = time.monotonic()
+            if now > self.updated:
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.fill_rate)
+                self.updated = now
+
+            self.tokens -= 1
+            # ``updated`` is in the future while the bucket is paused
+            return max(0.0, self.updated - now) + max(0.0, -self.tokens) / self.fill_rate
+
+    def pause(self, seconds: float) -> None:
+        with self._lock:
+            self.tokens = min(self.tokens, 0.0)
+            self.updated = max(self.updated, time.monotonic() + seconds)
+
+
+class RateLimiter:
+    """Paces the requests of a client so that it doesn't get rate limited by RedGifs.
+
+    Requests are grouped into route families, each with its own limit:
+
+    - ``search``: GIF, image, niche and tag searches.
+    - ``users``: creators and users.
+    - ``gifs``: every other API call, e.g. :py:meth:`API.get_gif() <redgifs.API.get_gif>`.
+    - ``media``: media downloads.
+    - ``auth``: temporary token requests.
+
+    All the calls made by one client share its limiter. It's safe to use from multiple
+    threads and never blocks the event loop when used by the async client.
+
+    When RedGifs responds with a 429 or says that no requests are remaining, every
+    request of that family is paused for the time RedGifs asks for.
+
+    Parameters
+    ----------
+    limits: Optional[Mapping[:class:`str`, :class:`.RateLimit`]]
+        The limit for each route family.
+    default: Optional[:class:`.RateLimit`]
+        The limit for the families not in ``limits``. If not given, those
+        families are only paused when RedGifs asks for it.
+    """
+
+    def __init__(self, limits: Optional[Mapping[str, RateLimit]] = None, *, default: Optional[RateLimit] = None) -> None:
+        self.limits: Dict[str, RateLimit] = dict(limits or {})
+        self.default: Optional[RateLimit] = default
+        self._buckets: Dict[str, _Bucket] = {}
+        self._lock: threading.Lock = threading.Lock()
+
+    def _bucket(self, family: str) -> _Bucket:
+        try:
+            return self._buckets[family]
+        except KeyError:
+            with self._lock:
+                if family not in self._buckets:
+                    # Families without a limit still get a bucket so they can be paused
+                    limit = self.limits.get(family) or self.default or RateLimit(rate=float('inf'))
+                    self._buckets[family] = _Bucket(limit)
+                return self._buckets[family]
+
+    def acquire(self, family: str) -> None:
+        """Blocks until a request of the given route family can be sent."""
+        delay = self._bucket(family).reserve()
+        if delay > 0:
+            _log.debug('Rate limited (%s), waiting %.2fs', family, delay)
+            time.sleep(delay)
+
+    async def acquire_async(self, family: str) -> None:
+        """Same as :meth:`acquire` but waits without blocking the event loop."""
+        delay = self._bucket(family).reserve()
+        if delay > 0:
+            _log.debug('Rate limited (%s), waiting %.2fs', family, delay)
+            await asyncio.sleep(delay)
+
+    def update(self, family: str, status: int, headers: Mapping[str, str]) -> None:
+        """Adapts to the rate limit information sent back by RedGifs."""
+        delay = None
+        if status == 429:
+            retry_after = headers.get('Retry-After') or headers.get('X-RateLimit-Reset')
+            delay = _parse_retry_after(retry_after) or 1.0
+        elif headers.get('X-RateLimit-Remaining') == '0':
+            delay = _parse_retry_after(headers.get('X-RateLimit-Reset'))
+
+        if delay:
+            _log.debug('RedGifs asked to pause requests (%s) for %.2fs', family, delay)
+            self._bucket(family).pause(delay)
@@ -0,0 +1,503 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2022-present scrazzz
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import json
+import time
+import uuid
+import zlib
+import base64
+import random
+import asyncio
+import logging
+import string
+from collections import Counter, OrderedDict
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, Optional, Tuple
+
+import click
+from aiohttp import web
+
+from .utils import _serve_range
+
+if TYPE_CHECKING:
+    from types import TracebackType
+    from typing import Type
+
+__all__ = ('StubServer',)
+
+_log = logging.getLogger(__name__)
+
+TAGS = ['Amateur', 'Ass', 'Big Tits', 'Blonde', 'Brunette', 'Cosplay', 'Homemade', 'Outdoor', 'Redhead', 'Teen (18+)']
+ADJECTIVES = ['able', 'bold', 'calm', 'dark', 'eager', 'fancy', 'giant', 'happy', 'icy', 'jolly', 'kind', 'lively']
+NOUNS = ['ant', 'bat', 'cod', 'doe', 'eel', 'fox', 'gnu', 'hen', 'ibis', 'jay', 'koi', 'lark', 'mole', 'newt']
+
+MEDIA_BASE = 'https://media.redgifs.com'
+
+
+# Payloads, these follow the shape of the real responses (see ``redgifs/types``)
+
+
+def make_id(rnd: random.Random) -> str:
+    # GIF ids are three lower-case words joined together, e.g. "boldhappyfox"
+    return ''.join((rnd.choice(ADJECTIVES), rnd.choice(ADJECTIVES), rnd.choice(NOUNS)))
+
+
+def make_username(rnd: random.Random) -> str:
+    return ''.join(rnd.choices(string.ascii_lowercase + string.digits + '_', k=rnd.randint(6, 16)))
+
+
+def make_gif(
+    rnd: random.Random, username: str = '', image: bool = False, *, id: str = '', media_base: str = MEDIA_BASE
+) -> Dict[str, Any]:
+    id = id or make_id(rnd)
+    pretty = id.title()
+    ext = 'jpg' if image else 'mp4'
+    return {
+        'id': id,
+        'client_id': None,
+        'createDate': rnd.randint(1_500_000_000, 1_700_000_000),
+        'hasAudio': rnd.random() < 0.3,
+        'width': rnd.choice((720, 1080, 1920)),
+        'height': rnd.choice((1280, 1920, 1080)),
+        'likes': rnd.randint(0, 50_000),
+        'tags': rnd.sample(TAGS, rnd.randint(2, 6)),
+        'verified': rnd.random() < 0.5,
+        'views': rnd.randint(100, 5_000_000),
+        'duration': 0 if image else round(rnd.uniform(3, 60), 3),
+        'published': True,
+        'type': 2 if image else 1,
+        'urls': {
+            'sd': f'{media_base}/{pretty}-mobile.{ext}',
+            'hd': f'{media_base}/{pretty}.{ext}',
+            'poster': f'{media_base}/{pretty}-poster.jpg',
+            'thumbnail': f'{media_base}/{pretty}-mobile.jpg',
+            'vthumbnail': None if image else f'{media_base}/{pretty}-mobile.mp4',
+            'html': f'https://www.redgifs.com/ifr/{id}',
+        },
+        'userName': username or make_username(rnd),
+        'avgColor': '#%06x' % rnd.randint(0, 0xFFFFFF),
+        'gallery': None,
+        'niches': [],
+        'sexuality': ['straight'],
+        'description': None,
+        'hideHome': False,
+        'hideTrending': False,
+        'hls': True,
+    }
+
+
+def make_user(rnd: random.Random, username: str = '') -> Dict[str, Any]:
+    username = username or make_username(rnd)
+    return {
+        'creationtime': rnd.randint(1_500_000_000, 1_700_000_000),
+        'description': ' '.join(rnd.choices(ADJECTIVES + NOUNS, k=rnd.randint(0, 30))) or None,
+        'followers': rnd.randint(0, 100_000),
+        'following': rnd.randint(0, 500),
+        'gifs': rnd.randint(1, 5_000),
+        'name': username.title(),
+        'profileImageUrl': f'https://userpic.redgifs.com/{username}.png',
+        'profileUrl': f'https://onlyfans.com/{username}',
+        'publishedCollections': rnd.randint(0, 20),
+        'publishedGifs': rnd.randint(1, 5_000),
+        'status': 'active',
+        'subscription': 0,
+        'url': f'https://www.redgifs.com/users/{username}',
+        'username': username,
+        'verified': rnd.random() < 0.5,
+        'views': rnd.randint(0, 10_000_000),
+        'poster': None,
+        'preview': None,
+        'thumbnail': None,
+        'likes': rnd.randint(0, 100_000),
+        'links': [{'url': f'https://twitter.com/{username}', 'position': 0}],
+    }
+
+
+def make_niche(rnd: random.Random, id: str = '') -> Dict[str, Any]:
+    id = id or '-'.join(rnd.sample(ADJECTIVES + NOUNS, 2))
+    return {
+        'id': id,
+        'name': id.replace('-', ' ').title(),
+        'gifs': rnd.randint(100, 100_000),
+        'subscribers': rnd.randint(0, 500_000),
+        'thumbnail': f'https://thumbs.redgifs.com/niches/{id}.jpg',
+        'tags': rnd.sample(TAGS, 3),
+        'preferences': ['straight'],
+    }
+
+
+def search_payload(
+    count: int, *, seed: int = 0, image: bool = False, page: int = 1, media_base: str = MEDIA_BASE
+) -> Dict[str, Any]:
+    """A page of :meth:`API.search` results with ``count`` GIFs."""
+    rnd = random.Random(seed)
+    users = [make_user(rnd) for _ in range(max(1, count // 4))]
+    return {
+        'page': page,
+        'pages': 250,
+        'total': 250 * count,
+        'gifs': [make_gif(rnd, rnd.choice(users)['username'], image, media_base=media_base) for _ in range(count)],
+        'users': users,
+        'niches': [],
+        'tags': TAGS,
+    }
+
+
+def creator_payload(
+    count: int,
+    *,
+    seed: int = 0,
+    image: bool = False,
+    page: int = 1,
+    username: str = '',
+    media_base: str = MEDIA_BASE,
+) -> Dict[str, Any]:
+    """A page of :meth:`API.search_creator` results with ``count`` GIFs."""
+    rnd = random.Random(seed)
+    user = make_user(rnd, username)
+    return {
+        'page': page,
+        'pages': 10,
+        'total': 10 * count,
+        'gifs': [make_gif(rnd, user['username'], image, media_base=media_base) for _ in range(count)],
+        'users': [user],
+        'niches': [],
+        'tags': TAGS,
+    }
+
+
+def creators_payload(count: int, *, seed: int = 0, page: int = 1) -> Dict[str, Any]:
+    """A page of :meth:`API.search_creators` results with ``count`` users."""
+    rnd = random.Random(seed)
+    return {'page': page, 'pages': 10, 'total': 10 * count, 'items': [make_user(rnd) for _ in range(count)]}
+
+
+def niches_payload(count: int, *, seed: int = 0, page: int = 1) -> Dict[str, Any]:
+    """A page of :meth:`API.search_niches` results with ``count`` niches."""
+    rnd = random.Random(seed)
+    return {'page': page, 'pages': 10, 'total': 10 * count, 'niches': [make_niche(rnd) for _ in range(count)]}
+
+
+def _temporary_token(ttl: float) -> str:
+    def encode(data: Dict[str, Any]) -> str:
+        return base64.urlsafe_b64encode(json.dumps(data).encode()).rstrip(b'=').decode()
+
+    payload = {'sub': 'stub', 'exp': int(time.time() + ttl), 'jti': uuid.uuid4().hex}
+    return f'{encode({"alg": "none", "typ": "JWT"})}.{encode(payload)}.stub'
+
+
+Handler = Callable[[web.Request], Awaitable[web.StreamResponse]]
+
+
+class StubServer:
+    """A local server that emulates the RedGifs API, to load test the clients without hitting RedGifs.
+
+    It answers the auth, search, GIF, user, creator, niche, tag and trending routes with
+    generated (but realistic) payloads, and serves media files with ``Range`` support.
+    The media URLs in the payloads point back to the server.
+
+    Point the clients at it by setting ``Route.BASE``:
+
+    .. code-block:: python3
+
+        from redgifs.http import Route
+        from redgifs.stub import StubServer
+
+        async with StubServer(latency=0.05, error_rate=0.01) as server:
+            Route.BASE = server.url
+            api = redgifs.aio.API()
+            ...
+
+    It can also be run on its own with ``python -m redgifs.stub``.
+
+    Parameters
+    ----------
+    host: :class:`str`
+        The host to listen on. Defaults to ``127.0.0.1``.
+    port: :class:`int`
+        The port to listen on. Defaults to a free port.
+    latency: :class:`float`
+        The seconds every response is delayed by.
+    jitter: :class:`float`
+        A random amount of seconds, up to this value, added to ``latency``.
+    error_rate: :class:`float`
+        The probability of an API call failing with a 500, 502 or 503.
+        Media downloads never fail.
+    rate_limit_rate: :class:`float`
+        The probability of an API call being rate limited with a 429.
+    retry_after: :class:`float`
+        The ``Retry-After`` of the 429 responses in seconds.
+    media_size: :class:`int`
+        The size of the media files in bytes. Defaults to 1 MiB.
+    token_ttl: :class:`float`
+        The seconds until a temporary token expires.
+    seed: :class:`int`
+        The seed of the injected failures.
+
+    Attributes
+    ----------
+    requests: :class:`collections.Counter`
+        The amount of requests received by route, e.g. ``'GET /v2/gifs/{id}'``.
+    """
+
+    def __init__(
+        self,
+        host: str = '127.0.0.1',
+        port: int = 0,
+        *,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        rate_limit_rate: float = 0.0,
+        retry_after: float = 1.0,
+        media_size: int = 1024 * 1024,
+        token_ttl: float = 3600.0,
+        seed: int = 0,
+    ) -> None:
+        self.host: str = host
+        self.port: int = port
+        self.latency: float = latency
+        self.jitter: float = jitter
+        self.error_rate: float = error_rate
+        self.rate_limit_rate: float = rate_limit_rate
+        self.retry_after: float = retry_after
+        self.media_size: int = media_size
+        self.token_ttl: float = token_ttl
+        self.requests: Counter[str] = Counter()
+        self._random: random.Random = random.Random(seed)
+        self._media: bytes = (bytes(range(256)) * (media_size // 256 + 1))[:media_size]
+        # Encoded payloads by URL, generating them is slower than sending them
+        self._payloads: OrderedDict[str, bytes] = OrderedDict()
+        self._runner: Optional[web.AppRunner] = None
+
+    @property
+    def url(self) -> str:
+        """:class:`str`: The base URL of the server, to be used as ``Route.BASE``."""
+        return f'http://{self.host}:{self.port}'
+
+    def _app(self) -> web.Application:
+        app = web.Application(middlewares=[self._middleware])
+        app.router.add_get('/v2/auth/temporary', self._auth)
+        app.router.add_get('/v1/tags', self._tags)
+        app.router.add_get('/v2/search/trending', self._tags)
+        app.router.add_get('/v2/search/suggest', self._suggest)
+        app.router.add_get('/v2/gifs/search', self._search)
+        app.router.add_get('/v2/explore/trending-gifs', self._search)
+        app.router.add_get('/v2/explore/trending-images', self._search)
+        app.router.add_get('/v2/gifs', self._gifs)
+        app.router.add_get('/v2/gifs/{id}', self._gif)
+        app.router.add_get('/v2/users/{username}/search', self._creator)
+        app.router.add_get('/v1/users/{username}', self._user)
+        app.router.add_get('/v1/creators/search', self._creators)
+        app.router.add_get('/v2/niches/search', self._niches)
+        app.router.add_get('/v2/niches/{niche_id}/gifs', self._search)
+        # add_get also answers HEAD requests
+        app.router.add_get('/media/{name}', self._media_file)
+        return app
+
+    @web.middleware
+    async def _middleware(self, request: web.Request, handler: Handler) -> web.StreamResponse:
+        route = request.match_info.route.resource
+        self.requests[f'{request.method} {route.canonical if route is not None else request.path}'] += 1
+
+        delay = self.latency + self._random.uniform(0, self.jitter)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        # Failures are only injected into API calls, downloads are not retried by the clients
+        if request.path.startswith('/media/'):
+            return await handler(request)
+
+        if self._random.random() < self.rate_limit_rate:
+            headers = {'Retry-After': str(self.retry_after), 'X-RateLimit-Remaining': '0'}
+            error = {'error': {'code': 'RateLimited', 'message': 'Too many requests'}}
+            return web.json_response(error, status=429, headers=headers)
+        if self._random.random() < self.error_rate:
+            return web.Response(status=self._random.choice((500, 502, 503)), text='Stub server error')
+        return await handler(request)
+
+    def _json(self, request: web.Request, make: Callable[[int], Any]) -> web.Response:
+        key = str(request.rel_url)
+        body = self._payloads.get(key)
+        if body is None:
+            # Payloads are seeded by their URL so the same page is always the same
+            body = json.dumps(make(zlib.crc32(key.encode()))).encode()
+            self._payloads[key] = body
+            if len(self._payloads) > 1024:
+                self._payloads.popitem(last=False)
+        return web.Response(body=body, content_type='application/json')
+
+    def _count(self, request: web.Request, default: int = 40) -> Tuple[int, int]:
+        return int(request.query.get('count', default)), int(request.query.get('page', 1))
+
+    async def _auth(self, request: web.Request) -> web.Response:
+        return web.json_response(
+            {
+                'token': _temporary_token(self.token_ttl),
+                'addr': request.remote,
+                'agent': request.headers.get('User-Agent', ''),
+                'session': uuid.uuid4().hex,
+                'rtfm': 'https://github.com/Redgifs/api/wiki/Temporary-tokens',
+            }
+        )
+
+    async def _tags(self, request: web.Request) -> web.Response:
+        tags = [{'name': tag, 'count': 1000 * (i + 1)} for i, tag in enumerate(TAGS)]
+        return self._json(request, lambda seed: {'tags': tags})
+
+    async def _suggest(self, request: web.Request) -> web.Response:
+        query = request.query.get('query', '').lower()
+        return self._json(
+            request, lambda seed: [{'gifs': 1000, 'text': tag, 'type': 'tag'} for tag in TAGS if query in tag.lower()]
+        )
+
+    async def _search(self, request: web.Request) -> web.Response:
+        count, page = self._count(request)
+        image = request.query.get('type') == 'i' or request.path.endswith('images')
+
+        def make(seed: int) -> Dict[str, Any]:
+            return search_payload(count, seed=seed, image=image, page=page, media_base=self._media_base)
+
+        return self._json(request, make)
+
+    async def _gif(self, request: web.Request) -> web.Response:
+        id = request.match_info['id']
+
+        def make(seed: int) -> Dict[str, Any]:
+            rnd = random.Random(seed)
+            user = make_user(rnd)
+            return {'gif': make_gif(rnd, user['username'], id=id, media_base=self._media_base), 'user': user}
+
+        return self._json(request, make)
+
+    async def _gifs(self, request: web.Request) -> web.Response:
+        ids = [id for id in request.query.get('ids', '').split(',') if id]
+
+        def make(seed: int) -> Dict[str, Any]:
+            rnd = random.Random(seed)
+            users = [make_user(rnd) for _ in range(max(1, len(ids) // 4))]
+            gifs = [make_gif(rnd, rnd.choice(users)['username'], id=id, media_base=self._media_base) for id in ids]
+            return {'gifs': gifs, 'users': users}
+
+        return self._json(request, make)
+
+    async def _creator(self, request: web.Request) -> web.Response:
+        count, page = self._count(request)
+        username = request.match_info['username']
+        image = request.query.get('type') == 'i'
+
+        def make(seed: int) -> Dict[str, Any]:
+            return creator_payload(count, seed=seed, image=image, page=page, username=username, media_base=self._media_base)
+
+        return self._json(request, make)
+
+    async def _user(self, request: web.Request) -> web.Response:
+        return self._json(request, lambda seed: make_user(random.Random(seed), request.match_info['username']))
+
+    async def _creators(self, request: web.Request) -> web.Response:
+        _, page = self._count(request)
+        return self._json(request, lambda seed: creators_payload(80, seed=seed, page=page))
+
+    async def _niches(self, request: web.Request) -> web.Response:
+        count, page = self._count(request)
+        return self._json(request, lambda seed: niches_payload(count, seed=seed, page=page))
+
+    async def _media_file(self, request: web.Request) -> web.Response:
+        content_type = 'image/jpeg' if request.match_info['name'].endswith('.jpg') else 'video/mp4'
+        status, headers, body = _serve_range(self._media, request.headers.get('Range'))
+        headers.update({'Content-Type': content_type, 'Accept-Ranges': 'bytes'})
+        if request.method == 'HEAD':
+            return web.Response(status=status, headers=headers)
+        return web.Response(status=status, headers=headers, body=body)
+
+    @property
+    def _media_base(self) -> str:
+        return f'{self.url}/media'
+
+    async def start(self) -> str:
+        """Starts the server, returns its :attr:`url`."""
+        self._runner = web.AppRunner(self._app(), access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, self.port)
+        await site.start()
+        if self.port == 0:
+            self.port = self._runner.addresses[0][1]
+        _log.info(f'Stub server listening on {self.url}')
+        return self.url
+
+    async def close(self) -> None:
+        """Stops the server."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def __aenter__(self) -> StubServer:
+        await self.start()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        await self.close()
+
+
+@click.command()
+@click.option('--host', default='127.0.0.1', show_default=True, help='The host to listen on.')
+@click.option('--port', default=8000, show_default=True, help='The port to listen on.')
+@click.option('--latency', default=0.0, show_default=True, help='Seconds every response is delayed by.')
+@click.option('--jitter', default=0.0, show_default=True, help='Random extra seconds added to the latency.')
+@click.option('--error-rate', default=0.0, show_default=True, help='Probability of a 5xx response.')
+@click.option('--rate-limit-rate', default=0.0, show_default=True, help='Probability of a 429 response.')
+@click.option('--media-size', default=1024 * 1024, show_default=True, help='Size of the media files in bytes.')
+def main(
+    host: str, port: int, latency: float, jitter: float, error_rate: float, rate_limit_rate: float, media_size: int
+) -> None:
+    """Runs a stub RedGifs API server."""
+
+    async def run() -> None:
+        server = StubServer(
+            host,
+            port,
+            latency=latency,
+            jitter=jitter,
+            error_rate=error_rate,
+            rate_limit_rate=rate_limit_rate,
+            media_size=media_size,
+        )
+        async with server:
+            click.echo(f'Listening on {server.url}, use it as Route.BASE. Press Ctrl+C to stop.')
+            await asyncio.Event().wait()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
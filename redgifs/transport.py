@@ -0,0 +1,393 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2022-present scrazzz
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import io
+import os
+import json
+import asyncio
+import base64
+import hashlib
+import threading
+from http import HTTPStatus
+from typing import TYPE_CHECKING, Any, Dict, Mapping, NamedTuple, Optional, Tuple, Union
+
+import aiohttp
+import requests
+import yarl
+from multidict import CIMultiDict, CIMultiDictProxy
+from requests.structures import CaseInsensitiveDict
+
+from .errors import RedGifsError
+from .utils import _serve_range
+
+if TYPE_CHECKING:
+    from types import TracebackType
+    from typing import AsyncIterator, Type
+
+__all__ = (
+    'Transport',
+    'RequestsTransport',
+    'ReplayTransport',
+    'AsyncTransport',
+    'AiohttpTransport',
+    'AsyncReplayTransport',
+)
+
+# These describe how the recorded body was sent, not the body itself
+_UNRECORDED_HEADERS = frozenset(('connection', 'content-encoding', 'content-length', 'keep-alive', 'transfer-encoding'))
+# The full response is recorded, these are applied by _ReplayStore._respond when it's replayed
+_UNFORWARDED_HEADERS = frozenset(('range', 'if-range'))
+
+
+class Transport:
+    """The base class of the transports that send the requests of :class:`API <redgifs.API>`.
+
+    A transport receives the same arguments as :meth:`requests.Session.request`
+    and must return a :class:`requests.Response`.
+    """
+
+    def request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        """Sends a request and returns its response."""
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """Closes the transport."""
+        pass
+
+
+class RequestsTransport(Transport):
+    """The default transport, sends the requests with a :class:`requests.Session`.
+
+    Parameters
+    ----------
+    session: Optional[:class:`requests.Session`]
+        The session to send the requests with.
+    """
+
+    def __init__(self, session: Optional[requests.Session] = None) -> None:
+        self.session: requests.Session = session or requests.Session()
+
+    def request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        return self.session.request(method, url, **kwargs)
+
+    def close(self) -> None:
+        self.session.close()
+
+
+class AsyncTransport:
+    """The base class of the transports that send the requests of :class:`aio.API <redgifs.aio.API>`.
+
+    A transport receives the same arguments as :meth:`aiohttp.ClientSession.request`
+    and must return an async context manager of a response that behaves like
+    :class:`aiohttp.ClientResponse`.
+    """
+
+    def request(self, method: str, url: str, **kwargs: Any) -> Any:
+        """Sends a request, returns an async context manager of its response."""
+        raise NotImplementedError
+
+    async def close(self) -> None:
+        """Closes the transport."""
+        pass
+
+
+class AiohttpTransport(AsyncTransport):
+    """The default async transport, sends the requests with an :class:`aiohttp.ClientSession`.
+
+    Parameters
+    ----------
+    session: :class:`aiohttp.ClientSession`
+        The session to send the requests with.
+    """
+
+    def __init__(self, session: aiohttp.ClientSession) -> None:
+        self.session: aiohttp.ClientSession = session
+
+    def request(self, method: str, url: str, **kwargs: Any) -> Any:
+        return self.session.request(method, url, **kwargs)
+
+    async def close(self) -> None:
+        await self.session.close()
+
+
+class _Fixture(NamedTuple):
+    status: int
+    headers: Dict[str, str]
+    body: bytes
+
+
+class _ReplayStore:
+    # The fixtures shared by the sync and async replay transports
+
+    def __init__(self, path: Optional[Union[str, os.PathLike[str]]]) -> None:
+        self.path: Optional[str] = os.fspath(path) if path is not None else None
+        self.fixtures: Dict[str, _Fixture] = {}
+        self._lock: threading.Lock = threading.Lock()
+        if self.path is not None and os.path.isdir(self.path):
+            for name in sorted(os.listdir(self.path)):
+                if name.endswith('.json'):
+                    self._load(os.path.join(self.path, name))
+
+    def _load(self, file: str) -> None:
+        with open(file, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if 'body_base64' in data:
+            body = base64.b64decode(data['body_base64'])
+        else:
+            body = data.get('body', '').encode()
+        self.fixtures[f'{data["method"]} {data["url"]}'] = _Fixture(data['status'], data.get('headers', {}), body)
+
+    def add(
+        self,
+        method: str,
+        url: str,
+        body: Any = b'',
+        *,
+        status: int = 200,
+        headers: Optional[Mapping[str, str]] = None,
+    ) -> None:
+        """Adds a canned response in memory.
+
+        Parameters
+        ----------
+        method: :class:`str`
+            The HTTP method of the request.
+        url: :class:`str`
+            The full URL of the request, including its query string.
+        body: Union[:class:`bytes`, :class:`str`, Any]
+            The response body. Anything else than :class:`bytes` or :class:`str`
+            is encoded as JSON.
+        status: :class:`int`
+            The status code of the response. Defaults to 200.
+        headers: Optional[Mapping[:class:`str`, :class:`str`]]
+            The headers of the response.
+        """
+        headers = dict(headers or {})
+        if isinstance(body, str):
+            body = body.encode()
+        elif not isinstance(body, bytes):
+            body = json.dumps(body).encode()
+            headers.setdefault('Content-Type', 'application/json')
+        self.fixtures[f'{method.upper()} {url}'] = _Fixture(status, headers, body)
+
+    def _record(self, method: str, url: str, status: int, headers: Mapping[str, str], body: bytes) -> _Fixture:
+        headers = {k: v for k, v in headers.items() if k.lower() not in _UNRECORDED_HEADERS}
+        fixture = _Fixture(status, headers, body)
+        with self._lock:
+            self.fixtures[f'{method} {url}'] = fixture
+            if self.path is not None:
+                data: Dict[str, Any] = {'method': method, 'url': url, 'status': status, 'headers': headers}
+                try:
+                    data['body'] = body.decode()
+                except UnicodeDecodeError:
+                    data['body_base64'] = base64.b64encode(body).decode()
+
+                os.makedirs(self.path, exist_ok=True)
+                name = f'{method.lower()}-{hashlib.sha1(url.encode()).hexdigest()[:16]}.json'
+                with open(os.path.join(self.path, name), 'w', encoding='utf-8') as f:
+                    json.dump(data, f, indent=2)
+        return fixture
+
+    def _find(self, method: str, url: str) -> Optional[_Fixture]:
+        fixture = self.fixtures.get(f'{method} {url}')
+        if fixture is None and method == 'HEAD':
+            # A HEAD request is answered from the GET fixture of the same URL
+            fixture = self.fixtures.get(f'GET {url}')
+        return fixture
+
+    def _respond(self, method: str, fixture: _Fixture, headers: Optional[Mapping[str, str]]) -> _Fixture:
+        status, response_headers, body = fixture.status, {'Content-Length': str(len(fixture.body))}, fixture.body
+        if status == 200:
+            status, response_headers, body = _serve_range(body, (headers or {}).get('Range'))
+
+        if method == 'HEAD':
+            body = b''
+        return _Fixture(status, {**fixture.headers, **response_headers}, body)
+
+    def _missing(self, method: str, url: str) -> RedGifsError:
+        return RedGifsError(f'No fixture for {method} {url}')
+
+    def _forward(self, method: str, kwargs: Dict[str, Any]) -> Tuple[str, Dict[str, Any]]:
+        # Returns the method and the arguments to send a request without a fixture with, so the
+        # recorded fixture holds the whole body: a HEAD is sent as a GET and the Range is dropped
+        kwargs = dict(kwargs)
+        if kwargs.get('headers') is not None:
+            kwargs['headers'] = {k: v for k, v in kwargs['headers'].items() if k.lower() not in _UNFORWARDED_HEADERS}
+        return 'GET' if method == 'HEAD' else method, kwargs
+
+
+class ReplayTransport(_ReplayStore, Transport):
+    """A transport that answers requests with canned responses instead of sending them.
+
+    The responses are loaded from the fixture files in ``path``, or added with :meth:`add`.
+    Media responses support ``Range`` requests, so downloads can be resumed and segmented.
+    Requests without a fixture raise :exc:`RedGifsError`, unless a ``fallback``
+    transport is given. In that case the request is sent with it and its response is
+    recorded in ``path`` to be replayed later. ``HEAD`` and ``Range`` requests are
+    recorded as a ``GET`` of the whole body, the range is applied when it's replayed.
+
+    Parameters
+    ----------
+    path: Optional[:class:`str`]
+        The directory of the fixture files.
+    fallback: Optional[:class:`Transport`]
+        The transport to send and record the requests that have no fixture with.
+    """
+
+    def __init__(self, path: Optional[Union[str, os.PathLike[str]]] = None, *, fallback: Optional[Transport] = None) -> None:
+        super().__init__(path)
+        self.fallback: Optional[Transport] = fallback
+
+    def request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        method = method.upper()
+        fixture = self._find(method, url)
+        if fixture is None:
+            if self.fallback is None:
+                raise self._missing(method, url)
+            forward_method, forward_kwargs = self._forward(method, kwargs)
+            forward_kwargs.pop('stream', None)
+            r = self.fallback.request(forward_method, url, **forward_kwargs)
+            fixture = self._record(forward_method, url, r.status_code, r.headers, r.content)
+
+        status, headers, body = self._respond(method, fixture, kwargs.get('headers'))
+        r = requests.Response()
+        r.status_code = status
+        r.reason = _reason(status)
+        r.headers = CaseInsensitiveDict(headers)
+        r.encoding = requests.utils.get_encoding_from_headers(r.headers)
+        r.raw = io.BytesIO(body)
+        r.url = url
+        r.request = requests.Request(method, url, headers=kwargs.get('headers')).prepare()
+        return r
+
+    def close(self) -> None:
+        if self.fallback is not None:
+            self.fallback.close()
+
+
+class _ReplayContent:
+    def __init__(self, body: bytes) -> None:
+        self._body: io.BytesIO = io.BytesIO(body)
+
+    async def read(self, n: int = -1) -> bytes:
+        return self._body.read(n)
+
+    async def iter_chunked(self, n: int) -> AsyncIterator[bytes]:
+        while True:
+            chunk = self._body.read(n)
+            if not chunk:
+                return
+            yield chunk
+
+
+class _ReplayResponse:
+    # Implements the parts of aiohttp.ClientResponse that the client uses
+
+    def __init__(self, method: str, url: str, fixture: _Fixture) -> None:
+        self.method: str = method
+        self.url: yarl.URL = yarl.URL(url)
+        self.status: int = fixture.status
+        self.reason: str = _reason(fixture.status)
+        self.headers: CIMultiDictProxy[str] = CIMultiDictProxy(CIMultiDict(fixture.headers))
+        self.content_length: Optional[int] = int(fixture.headers['Content-Length'])
+        self.content: _ReplayContent = _ReplayContent(fixture.body)
+        self._body: bytes = fixture.body
+
+    async def read(self) -> bytes:
+        return self._body
+
+    async def text(self, encoding: str = 'utf-8') -> str:
+        return self._body.decode(encoding)
+
+    async def json(self, *, loads: Any = json.loads, **kwargs: Any) -> Any:
+        return loads(self._body)
+
+    def release(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+class _ReplayRequest:
+    def __init__(self, transport: AsyncReplayTransport, method: str, url: str, kwargs: Dict[str, Any]) -> None:
+        self.transport: AsyncReplayTransport = transport
+        self.method: str = method
+        self.url: str = url
+        self.kwargs: Dict[str, Any] = kwargs
+
+    async def __aenter__(self) -> _ReplayResponse:
+        transport, method, url = self.transport, self.method, self.url
+        fixture = transport._find(method, url)
+        if fixture is None:
+            if transport.fallback is None:
+                raise transport._missing(method, url)
+            forward_method, forward_kwargs = transport._forward(method, self.kwargs)
+            async with transport.fallback.request(forward_method, url, **forward_kwargs) as resp:
+                status, headers, body = resp.status, resp.headers, await resp.read()
+            loop = asyncio.get_running_loop()
+            fixture = await loop.run_in_executor(None, transport._record, forward_method, url, status, headers, body)
+        return _ReplayResponse(method, url, transport._respond(method, fixture, self.kwargs.get('headers')))
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        pass
+
+
+class AsyncReplayTransport(_ReplayStore, AsyncTransport):
+    """Same as :class:`ReplayTransport` but for :class:`aio.API <redgifs.aio.API>`.
+
+    Parameters
+    ----------
+    path: Optional[:class:`str`]
+        The directory of the fixture files.
+    fallback: Optional[:class:`AsyncTransport`]
+        The transport to send and record the requests that have no fixture with.
+    """
+
+    def __init__(
+        self, path: Optional[Union[str, os.PathLike[str]]] = None, *, fallback: Optional[AsyncTransport] = None
+    ) -> None:
+        super().__init__(path)
+        self.fallback: Optional[AsyncTransport] = fallback
+
+    def request(self, method: str, url: str, **kwargs: Any) -> _ReplayRequest:
+        return _ReplayRequest(self, method.upper(), url, kwargs)
+
+    async def close(self) -> None:
+        if self.fallback is not None:
+            await self.fallback.close()
+
+
+def _reason(status: int) -> str:
+    try:
+        return HTTPStatus(status).phrase
+    except ValueError:
+        return ''
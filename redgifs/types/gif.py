@@ -38,6 +38,11 @@ class GetGifResponse(TypedDict):
     user: Optional[UserInfo]
 
 
+class GetGifsResponse(TypedDict):
+    gifs: List[GifInfo]
+    users: List[UserInfo]
+
+
 class BaseGifResponse(TypedDict):
     page: int
     pages: int
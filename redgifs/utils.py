@@ -26,20 +26,38 @@ from __future__ import annotations
 
 import re
 import json
+import time
+import base64
+import binascii
 import pkgutil
 import asyncio
 import yarl
 from datetime import datetime, timezone
-from typing import TYPE_CHECKING, Dict, List
+from email.utils import parsedate_to_datetime
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
 
-from .models import GIF, URL, Image, User
-from .const import REDGIFS_THUMBS_RE
+from .models import GIF, URL, Image, LazyGIF, LazyImage, User
+from .const import REDGIFS_THUMBS_RE, CONTENT_RANGE_RE, RANGE_RE
 
 if TYPE_CHECKING:
-    from redgifs.types.gif import GifInfo
+    from redgifs.types.gif import GifInfo, MediaInfo
     from redgifs.types.image import ImageInfo
     from redgifs.types.user import UserInfo
 
+# The fastest JSON decoder that is installed, used to decode the API responses
+_json_loads: Callable[[bytes], Any]
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    try:
+        import msgspec  # type: ignore - optional dependency, see the msgspec extra
+
+        _json_loads = msgspec.json.decode
+    except ImportError:
+        _json_loads = json.loads
+
 
 def to_web_url(id_or_url: str, use_regex: bool = False) -> str:
     if not use_regex:
@@ -76,6 +94,69 @@ def to_embed_url(sd_url: str) -> str:
     return f'https://api.redgifs.com/v2/embed/discord?name={filename}'
 
 
+def _parse_content_range(value: str) -> Tuple[Optional[int], Optional[int], Optional[int]]:
+    # Returns the (start, end, total) of a "Content-Range: bytes <start>-<end>/<total>" header.
+    # Any part that is unknown ("*") or missing is returned as None.
+    match = CONTENT_RANGE_RE.match(value)
+    if not match:
+        return None, None, None
+
+    start, end, total = match.group('start', 'end', 'total')
+    return (
+        int(start) if start is not None else None,
+        int(end) if end is not None else None,
+        int(total) if total is not None else None,
+    )
+
+
+def _serve_range(body: bytes, range: Optional[str]) -> Tuple[int, Dict[str, str], bytes]:
+    # Answers a single ``Range`` header for ``body`` like a server would,
+    # used by the replay transports and the stub server
+    size = len(body)
+    match = RANGE_RE.fullmatch(range) if range else None
+    if match is None:
+        return 200, {'Content-Length': str(size)}, body
+
+    start = int(match.group('start'))
+    end = min(int(match.group('end') or size - 1), size - 1)
+    if start >= size:
+        return 416, {'Content-Range': f'bytes */{size}', 'Content-Length': '0'}, b''
+
+    body = body[start : end + 1]
+    return 206, {'Content-Range': f'bytes {start}-{end}/{size}', 'Content-Length': str(len(body))}, body
+
+
+def _token_expiry(token: str) -> Optional[float]:
+    # The temporary token is a JWT, its "exp" claim is the UNIX time when it expires.
+    # None is returned if the token can't be decoded, it's then only refreshed on a 401.
+    try:
+        payload = token.split('.')[1]
+        claims = json.loads(base64.urlsafe_b64decode(payload + '=' * (-len(payload) % 4)))
+        return float(claims['exp'])
+    except (IndexError, KeyError, TypeError, ValueError, binascii.Error):
+        return None
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    # Returns the amount of seconds to wait from a "Retry-After" or "X-RateLimit-Reset" header.
+    # The value is either an amount of seconds, a UNIX timestamp or an HTTP date.
+    if value is None:
+        return None
+
+    try:
+        delay = float(value)
+    except ValueError:
+        try:
+            delay = parsedate_to_datetime(value).timestamp() - time.time()
+        except (TypeError, ValueError, IndexError):
+            return None
+    else:
+        if delay > 1_000_000_000:
+            delay -= time.time()
+
+    return max(delay, 0.0)
+
+
 def _read_tags_json() -> Dict[str, str]:
     file_ = pkgutil.get_data(__name__, 'tags.json')
     return json.loads(file_)  # type: ignore - file_ will never be None
@@ -86,7 +167,9 @@ async def _async_read_tags_json() -> Dict[str, str]:
     return r
 
 
-def _gifs_iter(gifs: List[GifInfo]) -> List[GIF]:
+def _gifs_iter(gifs: List[GifInfo], lazy: bool = False) -> List[GIF]:
+    if lazy:
+        return [LazyGIF(g, int_duration=True) for g in gifs]
     return [
         GIF(
             id=g['id'],
@@ -118,7 +201,14 @@ def _gifs_iter(gifs: List[GifInfo]) -> List[GIF]:
     ]
 
 
-def _images_iter(images: List[ImageInfo]) -> List[Image]:
+def _no_embed_url(urls: MediaInfo) -> None:
+    # The images from _images_iter have no embed URL, for LazyImage
+    return None
+
+
+def _images_iter(images: List[ImageInfo], lazy: bool = False) -> List[Image]:
+    if lazy:
+        return [LazyImage(i, embed_url=_no_embed_url) for i in images]
     return [
         Image(
             id=i['id'],
@@ -0,0 +1,16 @@
+import pytest
+
+from redgifs import ReplayTransport
+
+
+@pytest.fixture
+def replay():
+    # Builds a replay transport that answers the canned responses of a test module,
+    # each one holds the arguments of ReplayTransport.add
+    def make(fixtures, cls=ReplayTransport):
+        transport = cls()
+        for fixture in fixtures:
+            transport.add(**fixture)
+        return transport
+
+    return make
@@ -0,0 +1,172 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from redgifs import API, AsyncReplayTransport, ReplayTransport, TokenStore
+from redgifs import aio
+from redgifs.const import TEMP_TOKEN_PATH
+from redgifs.http import Route
+from redgifs.stub import _temporary_token
+
+TOKEN_URL = Route.BASE + TEMP_TOKEN_PATH
+UNAUTHORIZED_URL = Route.BASE + '/unauthorized'
+
+
+class TokenServer:
+    # Hands out a new token on every fetch and only accepts the latest one
+
+    def __init__(self, transport, ttl=3600):
+        self.transport = transport
+        self.ttl = ttl
+        self.token = None
+        self.fetches = 0
+        self.unauthorized = 0
+        self.sent = []
+        self._lock = threading.Lock()
+        transport.add('GET', UNAUTHORIZED_URL, {'error': {'code': 'Unauthorized'}}, status=401)
+        for id in range(8):
+            transport.add('GET', Route('GET', '/v2/gifs/{id}', id=f'gif{id}').url, {'gif': {'id': f'gif{id}'}})
+
+    def route(self, url, headers):
+        with self._lock:
+            if url == TOKEN_URL:
+                self.fetches += 1
+                self.token = _temporary_token(self.ttl)
+                self.transport.add('GET', TOKEN_URL, {'token': self.token})
+                return url
+
+            self.sent.append(headers.get('authorization'))
+            if headers.get('authorization') != f'Bearer {self.token}':
+                self.unauthorized += 1
+                return UNAUTHORIZED_URL
+            return url
+
+    def revoke(self):
+        with self._lock:
+            self.token = 'revoked'
+
+
+class SyncTokenTransport(ReplayTransport):
+    def __init__(self, ttl=3600):
+        super().__init__()
+        self.server = TokenServer(self, ttl)
+
+    def request(self, method, url, **kwargs):
+        return super().request(method, self.server.route(url, kwargs.get('headers') or {}), **kwargs)
+
+
+class AsyncTokenTransport(AsyncReplayTransport):
+    def __init__(self, ttl=3600):
+        super().__init__()
+        self.server = TokenServer(self, ttl)
+
+    def request(self, method, url, **kwargs):
+        return super().request(method, self.server.route(url, kwargs.get('headers') or {}), **kwargs)
+
+
+def test_concurrent_401_refreshes_once():
+    transport = SyncTokenTransport()
+    api = API(transport=transport).login()
+    assert transport.server.fetches == 1
+
+    # Every request in flight is rejected with the same token, but only one of them fetches a new one
+    transport.server.revoke()
+    barrier = threading.Barrier(8)
+
+    def get(id):
+        barrier.wait()
+        return api.http.get_gif(f'gif{id}')['gif']['id']
+
+    with ThreadPoolExecutor(8) as pool:
+        assert list(pool.map(get, range(8))) == [f'gif{id}' for id in range(8)]
+    assert transport.server.fetches == 2
+    assert transport.server.unauthorized >= 1
+    assert api.http.headers['authorization'] == f'Bearer {transport.server.token}'
+
+
+def test_expiring_token_is_refreshed_before_the_request():
+    # A token that expires within TOKEN_EXPIRY_MARGIN is replaced before it's sent
+    transport = SyncTokenTransport(ttl=30)
+    api = API(transport=transport).login()
+    stale = api.http.headers['authorization']
+    transport.server.ttl = 3600
+
+    assert api.http.get_gif('gif0')['gif']['id'] == 'gif0'
+    assert transport.server.fetches == 2
+    assert transport.server.unauthorized == 0
+    assert transport.server.sent == [f'Bearer {transport.server.token}']
+    assert transport.server.sent[0] != stale
+
+    # The new token is valid for long enough, so it's reused
+    api.http.get_gif('gif1')
+    assert transport.server.fetches == 2
+
+
+def test_async_concurrent_401_refreshes_once():
+    async def main():
+        transport = AsyncTokenTransport()
+        api = aio.API(transport=transport)
+        await api.login()
+        transport.server.revoke()
+
+        ids = await asyncio.gather(*(api.http.get_gif(f'gif{id}') for id in range(8)))
+        assert [gif['gif']['id'] for gif in ids] == [f'gif{id}' for id in range(8)]
+        assert transport.server.fetches == 2
+        assert transport.server.unauthorized == 8
+        await api.close()
+
+    asyncio.run(main())
+
+
+def test_async_expiring_token_is_refreshed_before_the_request():
+    async def main():
+        transport = AsyncTokenTransport(ttl=30)
+        api = aio.API(transport=transport)
+        await api.login()
+        transport.server.ttl = 3600
+
+        await api.http.get_gif('gif0')
+        assert transport.server.fetches == 2
+        assert transport.server.sent == [f'Bearer {transport.server.token}']
+        await api.close()
+
+    asyncio.run(main())
+
+
+def test_token_store_is_shared(tmp_path):
+    store = TokenStore(tmp_path / 'token.json')
+    transport = SyncTokenTransport()
+    first = API(transport=transport, token_store=store).login()
+    second = API(transport=transport, token_store=TokenStore(tmp_path / 'token.json')).login()
+
+    assert transport.server.fetches == 1
+    assert second.http.headers['authorization'] == first.http.headers['authorization']
+    assert store.get(first.http._token_store_key) == transport.server.token
+
+
+def test_token_store_ignores_expired_tokens(tmp_path):
+    store = TokenStore(tmp_path / 'token.json')
+    store.set('key', _temporary_token(30))
+    assert store.get('key') is None
+
+    # An expired token is replaced on login instead of being reused
+    transport = SyncTokenTransport()
+    api = API(transport=transport, token_store=store)
+    store.set(api.http._token_store_key, _temporary_token(-10))
+    api.login()
+    assert transport.server.fetches == 1
+    assert store.get(api.http._token_store_key) == transport.server.token
+
+
+def test_token_store_corrupted_file(tmp_path):
+    path = tmp_path / 'token.json'
+    store = TokenStore(path)
+    for content in ('{"key": ', '["not", "a", "dict"]', ''):
+        path.write_text(content)
+        assert store.get('key') is None
+
+    # A corrupted file is overwritten with the new token
+    transport = SyncTokenTransport()
+    api = API(transport=transport, token_store=store).login()
+    assert transport.server.fetches == 1
+    assert store.get(api.http._token_store_key) == transport.server.token
@@ -0,0 +1,85 @@
+import random
+import asyncio
+
+from redgifs import AsyncReplayTransport, HTTPException
+from redgifs import aio
+from redgifs.aio import _bulk
+from redgifs.http import Route
+from redgifs.stub import make_user
+
+
+def test_get_users():
+    async def main():
+        transport = AsyncReplayTransport()
+        rnd = random.Random(0)
+        for username in ('alice', 'bob'):
+            transport.add('GET', Route('GET', '/v1/users/{username}', username=username).url, make_user(rnd, username))
+        transport.add('GET', Route('GET', '/v1/users/{username}', username='nobody').url, {'error': {}}, status=404)
+
+        api = aio.API(transport=transport)
+        results = [r async for r in api.get_users(['alice', 'nobody', 'bob'], concurrency=2)]
+        await api.close()
+        return results
+
+    results = asyncio.run(main())
+    assert [r.key for r in results] == ['alice', 'nobody', 'bob']
+    assert [r.ok for r in results] == [True, False, True]
+    assert results[0].result.username == 'alice'
+    assert results[1].result is None
+    assert isinstance(results[1].error, HTTPException)
+
+
+def run_bulk(ordered):
+    running = 0
+    highest = 0
+
+    async def func(delay):
+        nonlocal running, highest
+        running += 1
+        highest = max(highest, running)
+        # Delays are 100ms apart so the completion order holds on a loaded machine
+        await asyncio.sleep(delay / 10)
+        running -= 1
+        if delay == 0:
+            raise ValueError('no delay')
+        return delay * 2
+
+    async def main():
+        return [r async for r in _bulk([5, 1, 2, 0, 1], func, 2, ordered)], highest
+
+    return asyncio.run(main())
+
+
+def test_bulk_ordered():
+    results, highest = run_bulk(ordered=True)
+    assert [r.key for r in results] == [5, 1, 2, 0, 1]
+    assert [r.result for r in results] == [10, 2, 4, None, 2]
+    assert isinstance(results[3].error, ValueError)
+    assert highest == 2
+
+
+def test_bulk_as_completed():
+    results, highest = run_bulk(ordered=False)
+    assert [r.key for r in results] == [1, 2, 0, 1, 5]
+    assert [r.result for r in results] == [2, 4, None, 2, 10]
+    assert highest == 2
+
+
+def test_bulk_close_awaits_pending_tasks():
+    tasks = []
+
+    async def func(delay):
+        tasks.append(asyncio.current_task())
+        await asyncio.sleep(delay)
+        return delay
+
+    async def main():
+        results = _bulk([0, 10, 10], func, 3, True)
+        assert (await results.__anext__()).result == 0
+        await results.aclose()
+        # The items that were still being requested are cancelled and finished, not left pending
+        assert len(tasks) == 3
+        assert all(task.done() for task in tasks[1:])
+        assert all(task.cancelled() for task in tasks[1:])
+
+    asyncio.run(main())
@@ -0,0 +1,87 @@
+import time
+
+from redgifs import ResponseCache, SQLiteCache
+from redgifs.http import Route
+
+
+def test_hit_and_miss():
+    cache = ResponseCache()
+    route = Route('GET', '/v2/gifs/{id}', id='abc')
+    assert cache.get(route) is None
+    cache.set(route, {'gif': {'id': 'abc'}})
+    assert cache.get(Route('GET', '/v2/gifs/{id}', id='abc')) == {'gif': {'id': 'abc'}}
+    assert cache.get(Route('GET', '/v2/gifs/{id}', id='xyz')) is None
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_ttl_per_route():
+    cache = ResponseCache({'/v2/search/trending': 0.05, '/v1/tags': 0})
+    trending = Route('GET', '/v2/search/trending')
+    tags = Route('GET', '/v1/tags')
+    cache.set(trending, {'tags': []})
+    cache.set(tags, {'tags': []})
+    assert cache.get(trending) is not None
+    assert cache.get(tags) is None
+    time.sleep(0.06)
+    assert cache.get(trending) is None
+
+
+def test_lru_eviction():
+    cache = ResponseCache(max_size=2)
+    a, b, c = (Route('GET', '/v2/gifs/{id}', id=id) for id in 'abc')
+    cache.set(a, 1)
+    cache.set(b, 2)
+    cache.get(a)
+    cache.set(c, 3)
+    assert cache.get(b) is None
+    assert cache.get(a) == 1 and cache.get(c) == 3
+
+
+def test_token_is_never_cached():
+    cache = ResponseCache()
+    route = Route('GET', '/v2/auth/temporary')
+    cache.set(route, {'token': 'abc'})
+    assert cache.get(route) is None
+
+
+def test_sqlite_persists(tmp_path):
+    route = Route('GET', '/v2/gifs/{id}', id='abc')
+    cache = SQLiteCache(tmp_path / 'cache.sqlite')
+    cache.set(route, {'gif': {'id': 'abc'}}, {'ETag': '"v1"'})
+    cache.close()
+
+    cache = SQLiteCache(tmp_path / 'cache.sqlite')
+    assert cache.get(route) == {'gif': {'id': 'abc'}}
+    assert len(cache) == 1
+
+
+def test_expired_entry_is_revalidated(tmp_path):
+    route = Route('GET', '/v2/gifs/{id}', id='abc')
+    for cache in (ResponseCache({'/v2/gifs/{id}': 0.05}), SQLiteCache(tmp_path / 'c.sqlite', {'/v2/gifs/{id}': 0.05})):
+        cache.set(route, {'id': 'abc'}, {'ETag': '"v1"', 'Last-Modified': 'Sat, 01 Jan 2022 00:00:00 GMT'})
+        time.sleep(0.06)
+        assert cache.get(route) is None
+
+        entry = cache.lookup(route)
+        assert entry is not None and not entry.fresh
+        assert entry.conditional_headers() == {
+            'If-None-Match': '"v1"',
+            'If-Modified-Since': 'Sat, 01 Jan 2022 00:00:00 GMT',
+        }
+        cache.revalidated(route, entry)
+        assert cache.get(route) == {'id': 'abc'}
+        assert cache.revalidations == 1
+
+
+def test_sqlite_evicts_by_size_and_age(tmp_path):
+    cache = SQLiteCache(tmp_path / 'cache.sqlite', max_size=100)
+    routes = [Route('GET', '/v2/gifs/{id}', id=str(i)) for i in range(5)]
+    for route in routes:
+        cache.set(route, 'x' * 30)
+    assert len(cache) == 3
+    assert cache.get(routes[0]) is None and cache.get(routes[4]) is not None
+
+    cache.max_age = 0.05
+    time.sleep(0.06)
+    cache.set(routes[0], 'x')
+    assert len(cache) == 1
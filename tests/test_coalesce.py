@@ -0,0 +1,67 @@
+import asyncio
+
+from redgifs.http import AsyncHttp, Route
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+async def make_http(calls):
+    http = AsyncHttp()
+
+    async def _request(route, **kwargs):
+        calls.append(route.url)
+        await asyncio.sleep(0.05)
+        return {'url': route.url}
+
+    http._request = _request
+    return http
+
+
+def test_identical_requests_are_shared():
+    async def main():
+        calls = []
+        http = await make_http(calls)
+        route = Route('GET', '/v2/gifs/{id}', id='abc')
+        results = await asyncio.gather(*(http.request(route) for _ in range(20)))
+        await http.request(Route('GET', '/v2/gifs/{id}', id='xyz'))
+        await http.close()
+        return calls, results
+
+    calls, results = run(main())
+    assert len(calls) == 2
+    assert all(r == results[0] for r in results)
+
+
+def test_cancelling_one_caller_keeps_the_request():
+    async def main():
+        calls = []
+        http = await make_http(calls)
+        route = Route('GET', '/v2/gifs/{id}', id='abc')
+        first = asyncio.ensure_future(http.request(route))
+        second = asyncio.ensure_future(http.request(route))
+        await asyncio.sleep(0.01)
+        first.cancel()
+        result = await second
+        await http.close()
+        return calls, first, result
+
+    calls, first, result = run(main())
+    assert first.cancelled()
+    assert result == {'url': Route('GET', '/v2/gifs/{id}', id='abc').url}
+    assert len(calls) == 1
+
+
+def test_cancelling_every_caller_cancels_the_request():
+    async def main():
+        http = await make_http([])
+        task = asyncio.ensure_future(http.request(Route('GET', '/v1/tags')))
+        await asyncio.sleep(0.01)
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+        inflight = dict(http._inflight)
+        await http.close()
+        return inflight
+
+    assert run(main()) == {}
@@ -0,0 +1,44 @@
+import random
+import asyncio
+
+from redgifs import API, AsyncReplayTransport
+from redgifs import aio
+from redgifs.http import Route
+from redgifs.stub import make_gif
+
+IDS = ['boldhappyfox', 'calmtinyowl', 'quickredhare', 'softbluecat', 'missingone']
+
+RANDOM = random.Random(0)
+GIFS = {id: make_gif(RANDOM, 'someone', id=id) for id in IDS[:-1]}
+FIXTURES = [
+    {
+        'method': 'GET',
+        'url': Route('GET', '/v2/gifs?ids={ids}', ids=','.join(chunk)).url,
+        'body': {'gifs': [GIFS[id] for id in reversed(chunk) if id in GIFS], 'users': []},
+    }
+    for chunk in (IDS[0:2], IDS[2:4], IDS[4:])
+]
+
+
+def test_get_gifs(replay):
+    api = API(transport=replay(FIXTURES))
+    # Duplicates are looked up once and the results follow the input order, not the response order
+    ids = ['BoldHappyFox', 'calmtinyowl', 'quickredhare', 'boldhappyfox', 'softbluecat', 'missingone', 'calmtinyowl']
+    gifs = api.get_gifs(ids, chunk_size=2)
+    assert list(gifs) == ids[:-1]
+    assert gifs['BoldHappyFox'].id == 'boldhappyfox'
+    assert gifs['BoldHappyFox'] is gifs['boldhappyfox']
+    assert gifs['missingone'] is None
+    assert api.get_gifs([]) == {}
+
+
+def test_async_get_gifs(replay):
+    async def main():
+        api = aio.API(transport=replay(FIXTURES, AsyncReplayTransport))
+        gifs = await api.get_gifs(IDS + ['CalmTinyOwl'], chunk_size=2, concurrency=2)
+        assert list(gifs) == IDS + ['CalmTinyOwl']
+        assert [gif.id for gif in gifs.values() if gif is not None] == IDS[:-1] + ['calmtinyowl']
+        assert gifs['missingone'] is None
+        await api.close()
+
+    asyncio.run(main())
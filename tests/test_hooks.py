@@ -0,0 +1,46 @@
+from redgifs import RequestEvent, RequestHook, RequestStats
+from redgifs.hooks import _RequestTrace
+from redgifs.http import Route
+
+
+def event(total, status=200, error=None, route='/v2/gifs/{id}'):
+    return RequestEvent('GET', route, 'https://api.redgifs.com', status, 100, 1, total=total, error=error)
+
+
+def test_stats_per_route():
+    stats = RequestStats(buckets=(0.1, 1.0))
+    for total in (0.05, 0.05, 0.5, 3.0):
+        stats.on_request_end(event(total))
+    stats.on_request_error(event(0.2, status=404, error=Exception()))
+    stats.on_request_error(event(0.2, status=None, error=TimeoutError(), route='/v2/gifs/search'))
+
+    gifs = stats.routes['GET /v2/gifs/{id}']
+    assert gifs.count == 5
+    assert gifs.histogram == [2, 2, 1]
+    assert gifs.errors == {404: 1}
+    assert gifs.retries == 5 and gifs.bytes == 500
+    assert gifs.percentile(50) == 1.0
+    assert gifs.percentile(100) == 3.0
+    assert stats.routes['GET /v2/gifs/search'].errors == {'TimeoutError': 1}
+
+
+def test_trace_dispatches_and_ignores_hook_errors():
+    seen = []
+
+    class Broken(RequestHook):
+        def on_request_start(self, event):
+            raise ValueError
+
+    class Recorder(RequestHook):
+        def on_request_start(self, event):
+            seen.append(('start', event.total))
+
+        def on_request_error(self, event):
+            seen.append(('error', event.status, event.error))
+
+    trace = _RequestTrace(Route('GET', '/v1/tags'), [Broken(), Recorder()])
+    trace.start()
+    trace.status = 500
+    error = Exception()
+    trace.error(error)
+    assert seen == [('start', None), ('error', 500, error)]
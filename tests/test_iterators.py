@@ -0,0 +1,211 @@
+import time
+import asyncio
+import threading
+
+import pytest
+
+from redgifs import API, AsyncPageIterator, AsyncReplayTransport, MediaType, Order, PageIterator
+from redgifs import aio
+from redgifs.http import Route
+from redgifs.iterators import _BloomFilter
+from redgifs.stub import creator_payload
+
+PAGES = 3
+
+
+def creator_fixture(payload, pages, order=Order.RECENT):
+    payload['pages'] = pages
+    route = Route(
+        'GET',
+        '/v2/users/{username}/search?page={page}&count={count}&order={order}&type={type}',
+        username='someone',
+        page=payload['page'],
+        count=5,
+        order=order.value,
+        type='g',
+    )
+    return {'method': 'GET', 'url': route.url, 'body': payload}
+
+
+FIXTURES = [
+    creator_fixture(creator_payload(5, seed=page, page=page, username='someone'), PAGES) for page in range(1, PAGES + 1)
+]
+
+
+def expected():
+    return [gif['id'] for page in range(1, PAGES + 1) for gif in creator_payload(5, seed=page, username='someone')['gifs']]
+
+
+@pytest.mark.parametrize('prefetch', [0, 1, 4])
+def test_iter_creator(replay, prefetch):
+    api = API(transport=replay(FIXTURES))
+    gifs = api.iter_creator('someone', count=5, type=MediaType.GIF, prefetch=prefetch)
+    assert [gif.id for gif in gifs] == expected()
+    assert (gifs.page, gifs.pages, gifs.total) == (PAGES, PAGES, 50)
+
+
+@pytest.mark.parametrize('prefetch', [0, 1, 4])
+def test_async_iter_creator(replay, prefetch):
+    async def main():
+        api = aio.API(transport=replay(FIXTURES, AsyncReplayTransport))
+        gifs = api.iter_creator('someone', count=5, prefetch=prefetch)
+        ids = [gif.id async for gif in gifs]
+        await api.close()
+        return ids, gifs
+
+    ids, gifs = asyncio.run(main())
+    assert ids == expected()
+    assert gifs.page == PAGES
+
+
+class Page:
+    def __init__(self, page, pages=5):
+        self.page = page
+        self.pages = pages
+        self.total = pages * 2
+        self.items = [f'{page}-a', f'{page}-b']
+
+
+def test_prefetch_depth():
+    requested = []
+    lock = threading.Lock()
+
+    def fetch(page):
+        with lock:
+            requested.append(page)
+        return Page(page)
+
+    items = PageIterator(fetch, lambda result: result.items, prefetch=2)
+    assert next(items) == '1-a'
+    # The first page is handed out while the next two are requested
+    deadline = time.monotonic() + 1
+    while len(requested) < 3 and time.monotonic() < deadline:
+        time.sleep(0.001)
+    assert sorted(requested) == [1, 2, 3]
+    assert list(items) == ['1-b'] + [f'{page}-{x}' for page in range(2, 6) for x in 'ab']
+    assert sorted(requested) == [1, 2, 3, 4, 5]
+
+
+def test_async_prefetch_and_close():
+    requested = []
+
+    async def fetch(page):
+        requested.append(page)
+        await asyncio.sleep(0)
+        return Page(page)
+
+    async def main():
+        items = AsyncPageIterator(fetch, lambda result: result.items, prefetch=2)
+        assert await items.__anext__() == '1-a'
+        await asyncio.sleep(0.01)
+        assert requested == [1, 2, 3]
+        await items.aclose()
+
+    asyncio.run(main())
+
+
+def test_async_close_awaits_pending_pages():
+    tasks = []
+
+    async def fetch(page):
+        tasks.append(asyncio.current_task())
+        if page > 1:
+            await asyncio.sleep(10)
+        return Page(page)
+
+    async def main():
+        items = AsyncPageIterator(fetch, lambda result: result.items, prefetch=2)
+        assert await items.__anext__() == '1-a'
+        await asyncio.sleep(0)
+        await items.aclose()
+        # The pages that were still being requested are cancelled and finished, not left pending
+        assert len(tasks) == 3
+        assert all(task.done() for task in tasks[1:])
+        assert all(task.cancelled() for task in tasks[1:])
+
+    asyncio.run(main())
+
+
+def delayed_fetch(delays):
+    # Later pages are received first
+    def fetch(page):
+        time.sleep(delays[page])
+        return Page(page, pages=len(delays))
+
+    async def async_fetch(page):
+        await asyncio.sleep(delays[page])
+        return Page(page, pages=len(delays))
+
+    return fetch, async_fetch
+
+
+DELAYS = {1: 0, 2: 0.15, 3: 0.1, 4: 0.05}
+
+
+def test_fan_out():
+    fetch, _ = delayed_fetch(DELAYS)
+    start = time.monotonic()
+    items = list(PageIterator(fetch, lambda result: result.items, prefetch=10))
+    assert items == [f'{page}-{x}' for page in range(1, 5) for x in 'ab']
+    # Every remaining page is requested at once
+    assert time.monotonic() - start < 0.25
+
+    items = list(PageIterator(fetch, lambda result: result.items, prefetch=10, ordered=False))
+    assert items == [f'{page}-{x}' for page in (1, 4, 3, 2) for x in 'ab']
+
+
+def test_async_fan_out():
+    _, fetch = delayed_fetch(DELAYS)
+
+    async def main():
+        ordered = [i async for i in AsyncPageIterator(fetch, lambda result: result.items, prefetch=10)]
+        unordered = AsyncPageIterator(fetch, lambda result: result.items, prefetch=10, ordered=False)
+        return ordered, [i async for i in unordered], unordered.page
+
+    ordered, unordered, page = asyncio.run(main())
+    assert ordered == [f'{page}-{x}' for page in range(1, 5) for x in 'ab']
+    assert unordered == [f'{page}-{x}' for page in (1, 4, 3, 2) for x in 'ab']
+    assert page == 2
+
+
+def shifting_fixtures():
+    # Two GIFs of the first page move to the second one while paginating
+    pages = [creator_payload(5, seed=page, page=page, username='someone') for page in (1, 2)]
+    pages[1]['gifs'][:2] = pages[0]['gifs'][3:]
+    fixtures = [creator_fixture(payload, 2, Order.TRENDING) for payload in pages]
+    return fixtures, [gif['id'] for payload in pages for gif in payload['gifs']]
+
+
+@pytest.mark.parametrize('dedupe', [True, 1000])
+def test_dedupe(replay, dedupe):
+    fixtures, ids = shifting_fixtures()
+    api = API(transport=replay(fixtures))
+
+    gifs = api.iter_creator('someone', count=5, order=Order.TRENDING)
+    assert [gif.id for gif in gifs] == ids
+    assert gifs.duplicates == 0
+
+    gifs = api.iter_creator('someone', count=5, order=Order.TRENDING, dedupe=dedupe)
+    assert [gif.id for gif in gifs] == ids[:5] + ids[7:]
+    assert gifs.duplicates == 2
+
+
+def test_async_dedupe(replay):
+    async def main():
+        fixtures, ids = shifting_fixtures()
+        api = aio.API(transport=replay(fixtures, AsyncReplayTransport))
+        gifs = api.iter_creator('someone', count=5, order=Order.TRENDING, dedupe=True)
+        assert [gif.id async for gif in gifs] == ids[:5] + ids[7:]
+        assert gifs.duplicates == 2
+        await api.close()
+
+    asyncio.run(main())
+
+
+def test_bloom_filter():
+    seen = _BloomFilter(10_000)
+    assert len(seen._bits) < 20_000
+    # New IDs are rarely reported as seen, but seen IDs always are
+    assert sum(seen.add(f'gif{i}') for i in range(10_000)) < 50
+    assert all(seen.add(f'gif{i}') for i in range(10_000))
+    assert sum(seen.add(f'other{i}') for i in range(1_000)) < 10
@@ -0,0 +1,65 @@
+import dataclasses
+from datetime import datetime, timezone
+
+from redgifs import API, MediaType, Order, ReplayTransport
+from redgifs.http import Route
+from redgifs.models import _MISSING, GIF, Image, LazyGIF, LazyImage
+from redgifs.parser import parse_creator, parse_search, parse_search_image
+from redgifs.stub import creator_payload, search_payload
+from redgifs.utils import _gifs_iter, _images_iter
+
+
+def eager_and_lazy():
+    # Every parser that has a lazy mode, with the eager and lazy items it returns
+    for image in (False, True):
+        media_type = MediaType.IMAGE if image else MediaType.GIF
+        creator = creator_payload(10, image=image)
+        search = search_payload(10, image=image)
+        for parse in (
+            lambda lazy: parse_creator(creator, media_type, lazy),
+            lambda lazy: parse_search('amateur', search, media_type, lazy),
+        ):
+            eager, lazy = parse(False), parse(True)
+            yield (eager.images, lazy.images) if image else (eager.gifs, lazy.gifs)
+
+    search = search_payload(10, image=True)
+    yield parse_search_image('amateur', search).images, parse_search_image('amateur', search, lazy=True).images
+    gifs = search_payload(10)['gifs']
+    yield _gifs_iter(gifs), _gifs_iter(gifs, lazy=True)
+    yield _images_iter(search['gifs']), _images_iter(search['gifs'], lazy=True)
+
+
+def test_lazy_matches_eager():
+    for eager, lazy in eager_and_lazy():
+        assert len(lazy) == len(eager) == 10
+        assert all(isinstance(item, LazyImage if isinstance(eager[0], Image) else LazyGIF) for item in lazy)
+        assert [dataclasses.asdict(i) for i in lazy] == [dataclasses.asdict(i) for i in eager]
+        # Lazy and eager models with the same values are equal, either way around
+        assert lazy == eager and eager == lazy
+
+
+def test_lazy_fields_are_cached():
+    gif = parse_creator(creator_payload(1), MediaType.GIF, lazy=True).gifs[0]
+    assert isinstance(gif, GIF)
+    assert gif._create_date is _MISSING and gif._urls is _MISSING
+    assert gif.urls is gif.urls
+    assert gif.create_date.tzinfo is timezone.utc
+
+    gif.create_date = datetime(2020, 1, 1)
+    assert gif.create_date == datetime(2020, 1, 1)
+
+
+def test_lazy_client():
+    transport = ReplayTransport()
+    route = Route(
+        'GET',
+        '/v2/users/{username}/search?page={page}&count={count}&order={order}&type={type}',
+        username='someone',
+        page=1,
+        count=80,
+        order=Order.RECENT.value,
+        type='g',
+    )
+    transport.add('GET', route.url, creator_payload(80))
+    assert isinstance(API(transport=transport, lazy=True).search_creator('someone').gifs[0], LazyGIF)
+    assert not isinstance(API(transport=transport).search_creator('someone').gifs[0], LazyGIF)
@@ -0,0 +1,52 @@
+import asyncio
+
+import aiohttp
+import pytest
+
+from redgifs import API, PoolLimits
+from redgifs import aio
+from redgifs.http import Route
+
+
+def test_sync_adapters():
+    api = API(limits=PoolLimits(max_connections=4), media_limits=PoolLimits(max_connections=16, max_connections_per_host=2))
+    session = api.http.transport.session  # type: ignore
+    adapter = session.get_adapter(Route.BASE + '/v2/gifs/search')
+    assert adapter._pool_maxsize == 4
+    assert adapter._pool_block is True
+    assert adapter.poolmanager.connection_pool_kw['maxsize'] == 4
+    assert adapter.poolmanager.connection_pool_kw['block'] is True
+
+    media = session.get_adapter('https://media.redgifs.com/BoldHappyFox.mp4')
+    assert media is not adapter
+    assert media._pool_maxsize == 2
+    assert media._pool_block is True
+    api.close()
+
+
+def test_async_connectors():
+    async def main():
+        api = aio.API(limits=PoolLimits(max_connections=4, max_connections_per_host=2))
+        connector = api.http._make_connector(PoolLimits(max_connections=4, max_connections_per_host=2))
+        assert connector.limit == 4
+        assert connector.limit_per_host == 2
+        await connector.close()
+        await api.close()
+
+    asyncio.run(main())
+
+
+def test_async_session_with_limits():
+    async def main():
+        session = aiohttp.ClientSession()
+        # The connector of a session that was passed in can't be changed
+        with pytest.raises(TypeError):
+            aio.API(session=session, limits=PoolLimits(max_connections=4))
+
+        api = aio.API(session=session, media_limits=PoolLimits(max_connections=2))
+        assert api.http.transport.session is session  # type: ignore
+        assert api.http.media_transport.session.connector.limit == 2  # type: ignore
+        await api.close()
+        await session.close()
+
+    asyncio.run(main())
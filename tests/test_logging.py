@@ -0,0 +1,31 @@
+import logging
+
+from redgifs.const import LOG_BODY_LIMIT
+from redgifs.hooks import _RequestTrace
+from redgifs.http import Route, _log_response
+
+
+def make_trace():
+    trace = _RequestTrace(Route('GET', '/v2/gifs/{id}', id='abc'), [])
+    trace.status, trace.bytes = 200, 123
+    return trace
+
+
+def test_body_is_truncated(caplog):
+    caplog.set_level(logging.DEBUG, logger='redgifs.http')
+    _log_response(make_trace(), {'gifs': [{'id': str(i), 'tags': ['x' * 500] * 10} for i in range(100)]})
+
+    (record,) = caplog.records
+    assert 'returned code: 200 (123 bytes in' in record.getMessage()
+    assert len(record.getMessage()) < LOG_BODY_LIMIT + 200
+    assert record.request.route == '/v2/gifs/{id}'
+
+
+def test_nothing_is_formatted_when_disabled(caplog):
+    class Body:
+        def __repr__(self):
+            raise AssertionError('formatted')
+
+    caplog.set_level(logging.INFO, logger='redgifs.http')
+    _log_response(make_trace(), Body())
+    assert caplog.records == []
@@ -0,0 +1,52 @@
+import time
+
+import pytest
+
+from redgifs import RateLimit, RateLimiter
+from redgifs.ratelimit import _route_family
+
+
+@pytest.mark.parametrize(
+    'path, family',
+    [
+        ('/v2/gifs/search?type=g', 'search'),
+        ('/v2/search/suggest?query={query}', 'search'),
+        ('/v2/niches/search?query={query}', 'search'),
+        ('/v2/users/{username}/search', 'users'),
+        ('/v1/creators/search?page={page}', 'users'),
+        ('/v2/gifs/{id}', 'gifs'),
+        ('/v2/niches/{niche_id}/gifs', 'gifs'),
+        ('/v2/auth/temporary', 'auth'),
+    ],
+)
+def test_route_family(path, family):
+    assert _route_family(path) == family
+
+
+def test_burst_then_paced():
+    limiter = RateLimiter({'search': RateLimit(rate=20, per=1.0, burst=2)})
+    start = time.monotonic()
+    for _ in range(4):
+        limiter.acquire('search')
+    # 2 requests are sent at once, the next 2 are 50ms apart
+    assert 0.09 <= time.monotonic() - start < 0.5
+
+
+def test_unlimited_family_is_not_paced():
+    limiter = RateLimiter({'search': RateLimit(rate=1)})
+    start = time.monotonic()
+    for _ in range(100):
+        limiter.acquire('gifs')
+    assert time.monotonic() - start < 0.1
+
+
+def test_pause_on_429():
+    limiter = RateLimiter()
+    limiter.update('gifs', 429, {'Retry-After': '0.2'})
+    start = time.monotonic()
+    limiter.acquire('gifs')
+    assert time.monotonic() - start >= 0.15
+    # Other families are not affected
+    start = time.monotonic()
+    limiter.acquire('search')
+    assert time.monotonic() - start < 0.05
@@ -0,0 +1,137 @@
+import random
+import asyncio
+
+import pytest
+
+from redgifs import API, AsyncReplayTransport, MediaType, Order, ReplayTransport
+from redgifs import aio
+from redgifs.http import Route
+from redgifs.models import GIF, GIFRecord, ImageRecord, UserRecord
+from redgifs.parser import parse_search, parse_search_image, parse_search_image_records, parse_search_records
+from redgifs.stub import creator_payload, make_gif, search_payload
+
+
+def creator_route(page: int = 1, count: int = 80, type: str = 'g') -> str:
+    return Route(
+        'GET',
+        '/v2/users/{username}/search?page={page}&count={count}&order={order}&type={type}',
+        username='someone',
+        page=page,
+        count=count,
+        order=Order.RECENT.value,
+        type=type,
+    ).url
+
+
+def test_invalid_result_format():
+    with pytest.raises(ValueError):
+        API(result_format='dict')  # type: ignore
+
+
+def test_raw_results():
+    payload = creator_payload(80)
+    transport = ReplayTransport()
+    transport.add('GET', creator_route(), payload)
+    result = API(transport=transport, result_format='raw').search_creator('someone')
+    assert result == payload
+
+
+def test_tuple_results():
+    transport = ReplayTransport()
+    transport.add('GET', creator_route(), creator_payload(80))
+    transport.add('GET', creator_route(type='i'), creator_payload(80, image=True))
+    api = API(transport=transport, result_format='tuple')
+
+    result = api.search_creator('someone')
+    assert isinstance(result.creator, UserRecord)
+    assert len(result.gifs) == 80 and result.images == []
+    gif = result.gifs[0]
+    assert isinstance(gif, GIFRecord)
+    assert isinstance(gif.create_date, int) and isinstance(gif.urls, dict)
+
+    # The records hold the same values as the models, only unconverted
+    model = API(transport=transport).search_creator('someone').gifs[0]
+    assert gif.id == model.id and gif.username == model.username
+    assert gif.urls['hd'] == model.urls.hd
+
+    images = api.search_creator('someone', type=MediaType.IMAGE)
+    assert images.gifs == [] and isinstance(images.images[0], ImageRecord)
+
+
+def shape(items):
+    return None if items is None else len(items)
+
+
+@pytest.mark.parametrize(
+    'model, record, json',
+    [
+        (
+            lambda json: parse_search('query', json, MediaType.GIF),
+            lambda json: parse_search_records('query', json, MediaType.GIF),
+            search_payload(8),
+        ),
+        (
+            lambda json: parse_search('query', json, MediaType.IMAGE),
+            lambda json: parse_search_records('query', json, MediaType.IMAGE),
+            search_payload(8, image=True),
+        ),
+        (
+            lambda json: parse_search_image('query', json),
+            lambda json: parse_search_image_records('query', json),
+            search_payload(8, image=True),
+        ),
+    ],
+)
+def test_search_records_match_models(model, record, json):
+    # The unused field is None or empty like it is with the models
+    model, record = model(json), record(json)
+    assert (shape(record.gifs), shape(record.images)) == (shape(model.gifs), shape(model.images))
+
+
+def test_get_gifs_result_format():
+    gif = make_gif(random.Random(0), 'someone', id='boldhappyfox')
+    transport = ReplayTransport()
+    transport.add('GET', Route('GET', '/v2/gifs?ids={ids}', ids='boldhappyfox,missingone').url, {'gifs': [gif], 'users': []})
+
+    ids = ['BoldHappyFox', 'missingone']
+    raw = API(transport=transport, result_format='raw').get_gifs(ids)
+    assert raw == {'BoldHappyFox': gif, 'missingone': None}
+    records = API(transport=transport, result_format='tuple').get_gifs(ids)
+    assert isinstance(records['BoldHappyFox'], GIFRecord) and records['missingone'] is None
+    models = API(transport=transport).get_gifs(ids)
+    assert isinstance(models['BoldHappyFox'], GIF)
+
+
+def test_iter_creator_raw():
+    transport = ReplayTransport()
+    pages = [creator_payload(5, seed=page, page=page) for page in range(1, 11)]
+    for page, payload in enumerate(pages, start=1):
+        transport.add('GET', creator_route(page, count=5), payload)
+
+    api = API(transport=transport, result_format='raw')
+    gifs = api.iter_creator('someone', count=5, prefetch=3, dedupe=True)
+    seen, expected = set(), []
+    for gif in (gif for payload in pages for gif in payload['gifs']):
+        if gif['id'] not in seen:
+            seen.add(gif['id'])
+            expected.append(gif)
+    assert list(gifs) == expected
+    assert gifs.duplicates == 50 - len(expected)
+    assert gifs.page == gifs.pages == 10 and gifs.total == 50
+
+
+def test_async_result_format():
+    async def main():
+        transport = AsyncReplayTransport()
+        transport.add('GET', creator_route(), creator_payload(80))
+
+        api = aio.API(transport=transport, result_format='tuple')
+        result = await api.search_creator('someone')
+        assert isinstance(result.gifs[0], GIFRecord)
+
+        raw = aio.API(transport=transport, result_format='raw')
+        assert (await raw.search_creator('someone')) == creator_payload(80)
+        await api.close()
+        await raw.close()
+
+    asyncio.run(main())
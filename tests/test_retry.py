@@ -0,0 +1,25 @@
+from redgifs import RetryPolicy
+
+
+def test_backoff_is_exponential_and_capped():
+    policy = RetryPolicy(max_retries=10, backoff_base=1.0, backoff_max=5.0, jitter=False, max_wait=None)
+    assert [policy._next_delay(i, 0.0) for i in range(5)] == [1.0, 2.0, 4.0, 5.0, 5.0]
+
+
+def test_jitter_stays_within_backoff():
+    policy = RetryPolicy(backoff_base=2.0)
+    for _ in range(100):
+        delay = policy._next_delay(1, 0.0)
+        assert delay is not None and 0.0 <= delay <= 4.0
+
+
+def test_retry_after_is_honoured():
+    policy = RetryPolicy(jitter=False)
+    assert policy._next_delay(0, 0.0, '7') == 7.0
+
+
+def test_budget_is_respected():
+    policy = RetryPolicy(max_retries=2, jitter=False, max_wait=10.0)
+    assert policy._next_delay(2, 0.0) is None
+    assert policy._next_delay(0, 9.9) is None
+    assert policy._next_delay(0, 0.0, '60') is None
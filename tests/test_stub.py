@@ -0,0 +1,80 @@
+import asyncio
+import threading
+
+import pytest
+
+from redgifs import API, RetryPolicy, aio
+from redgifs.http import Route
+from redgifs.stub import StubServer
+
+
+@pytest.fixture
+def stub(monkeypatch):
+    # The server runs on its own loop so that the sync client can use it too
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+
+    def start(**kwargs):
+        server = StubServer(**kwargs)
+        asyncio.run_coroutine_threadsafe(server.start(), loop).result()
+        monkeypatch.setattr(Route, 'BASE', server.url)
+        servers.append(server)
+        return server
+
+    servers = []
+    yield start
+    for server in servers:
+        asyncio.run_coroutine_threadsafe(server.close(), loop).result()
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join()
+    loop.close()
+
+
+def test_sync_client(stub, tmp_path):
+    server = stub(media_size=300_000)
+    api = API().login()
+    try:
+        result = api.search('amateur', count=80)
+        assert len(result.gifs) == 80
+
+        gif = api.get_gif('boldhappyfox')
+        assert gif.id == 'boldhappyfox'
+        path = tmp_path / 'gif.mp4'
+        assert api.download(gif.urls.hd, str(path), segments=4) == 300_000
+        assert path.stat().st_size == 300_000
+        assert server.requests['GET /v2/auth/temporary'] == 1
+    finally:
+        api.close()
+
+
+def test_async_client_with_failures(stub, tmp_path):
+    server = stub(error_rate=0.2, rate_limit_rate=0.1, retry_after=0.01, media_size=100_000)
+
+    async def main():
+        api = aio.API(retry=RetryPolicy(max_retries=10, backoff_base=0.001, backoff_max=0.01))
+        try:
+            await api.login()
+            creators = await asyncio.gather(*(api.search_creator(f'user{i}', count=40) for i in range(20)))
+            written = await api.download(creators[0].gifs[0].urls.hd, str(tmp_path / 'a.mp4'), resume=True)
+        finally:
+            await api.close()
+        return creators, written
+
+    creators, written = asyncio.run(main())
+    assert [c.creator.username for c in creators] == [f'user{i}' for i in range(20)]
+    assert written == 100_000
+    assert sum(server.requests.values()) > 22
+
+
+def test_get_gifs(stub):
+    server = stub()
+    api = API().login()
+    try:
+        ids = [f'gif{i}' for i in range(250)]
+        gifs = api.get_gifs(ids + ids[:10])
+        assert list(gifs) == ids
+        assert all(gif is not None and gif.id == id for id, gif in gifs.items())
+        assert server.requests['GET /v2/gifs'] == 3
+    finally:
+        api.close()
@@ -0,0 +1,176 @@
+import io
+import os
+import time
+import asyncio
+
+import pytest
+
+from redgifs import API, AsyncReplayTransport, RedGifsError, ReplayTransport
+from redgifs import aio
+from redgifs.http import Route
+
+GIF = {
+    'id': 'boldhappyfox',
+    'client_id': None,
+    'createDate': 1600000000,
+    'hasAudio': False,
+    'width': 1080,
+    'height': 1920,
+    'likes': 10,
+    'tags': ['Amateur'],
+    'verified': True,
+    'views': 100,
+    'duration': 10.0,
+    'published': True,
+    'type': 1,
+    'urls': {
+        'sd': 'https://media.redgifs.com/BoldHappyFox-mobile.mp4',
+        'hd': 'https://media.redgifs.com/BoldHappyFox.mp4',
+        'poster': 'https://media.redgifs.com/BoldHappyFox-poster.jpg',
+        'thumbnail': 'https://media.redgifs.com/BoldHappyFox-mobile.jpg',
+        'vthumbnail': 'https://media.redgifs.com/BoldHappyFox-mobile.mp4',
+        'html': 'https://www.redgifs.com/ifr/boldhappyfox',
+    },
+    'userName': 'someone',
+    'avgColor': '#000000',
+    'gallery': None,
+}
+MEDIA = bytes(range(256)) * 1200
+MEDIA_HEADERS = {'Content-Type': 'video/mp4', 'Accept-Ranges': 'bytes'}
+
+
+FIXTURES = [
+    {'method': 'GET', 'url': Route('GET', '/v2/gifs/{id}', id='boldhappyfox').url, 'body': {'gif': GIF, 'user': None}},
+    {'method': 'GET', 'url': GIF['urls']['hd'], 'body': MEDIA, 'headers': MEDIA_HEADERS},
+    {
+        'method': 'GET',
+        'url': Route('GET', '/v2/gifs/{id}', id='missing').url,
+        'body': {'error': {'code': 'NotFound'}},
+        'status': 404,
+    },
+]
+
+
+def test_replay_api_calls(replay):
+    api = API(transport=replay(FIXTURES))
+    assert api.get_gif('boldhappyfox').id == 'boldhappyfox'
+
+    with pytest.raises(RedGifsError) as e:
+        api.get_gif('missing')
+    assert e.value.status == 404
+
+    with pytest.raises(RedGifsError, match='No fixture'):
+        api.get_gif('unknown')
+
+
+@pytest.mark.parametrize('kwargs', [{}, {'segments': 4, 'chunk_size': 1024}, {'resume': True}])
+def test_replay_download(replay, tmp_path, kwargs):
+    api = API(transport=replay(FIXTURES))
+    path = tmp_path / 'media.mp4'
+    if kwargs.get('resume'):
+        path.with_name('media.mp4.part').write_bytes(MEDIA[:1000])
+    api.download('https://www.redgifs.com/watch/boldhappyfox', str(path), **kwargs)
+    assert path.read_bytes() == MEDIA
+
+
+def test_record_then_replay(replay, tmp_path):
+    upstream = replay(FIXTURES)
+    api = API(transport=ReplayTransport(tmp_path, fallback=upstream))
+    api.get_gif('boldhappyfox')
+    assert len(os.listdir(tmp_path)) == 1
+
+    api = API(transport=ReplayTransport(tmp_path))
+    assert api.get_gif('boldhappyfox').urls.hd == GIF['urls']['hd']
+
+
+def test_async_replay(replay, tmp_path):
+    async def main():
+        api = aio.API(transport=replay(FIXTURES, AsyncReplayTransport))
+        gif = await api.get_gif('boldhappyfox')
+        await api.download(gif.urls.hd, str(tmp_path / 'a.mp4'), segments=3, chunk_size=4096)
+        with pytest.raises(RedGifsError) as e:
+            await api.get_gif('missing')
+        await api.close()
+        return gif, e.value.status
+
+    gif, status = asyncio.run(main())
+    assert gif.id == 'boldhappyfox' and status == 404
+    assert (tmp_path / 'a.mp4').read_bytes() == MEDIA
+
+
+def test_record_resumed_download(replay, tmp_path):
+    # The Range of a resumed download isn't forwarded, so the whole media is recorded
+    fixtures, path = tmp_path / 'fixtures', tmp_path / 'media.mp4'
+    path.with_name('media.mp4.part').write_bytes(MEDIA[:1000])
+    api = API(transport=ReplayTransport(fixtures, fallback=replay(FIXTURES)))
+    api.download(GIF['urls']['hd'], str(path), resume=True)
+    assert path.read_bytes() == MEDIA
+
+    api = API(transport=ReplayTransport(fixtures))
+    api.download(GIF['urls']['hd'], str(tmp_path / 'replayed.mp4'))
+    api.download(GIF['urls']['hd'], str(tmp_path / 'segmented.mp4'), segments=4, chunk_size=1024)
+    assert (tmp_path / 'replayed.mp4').read_bytes() == (tmp_path / 'segmented.mp4').read_bytes() == MEDIA
+
+
+def test_async_record_resumed_download(replay, tmp_path):
+    fixtures, path = tmp_path / 'fixtures', tmp_path / 'media.mp4'
+    path.with_name('media.mp4.part').write_bytes(MEDIA[:1000])
+
+    async def main():
+        api = aio.API(transport=AsyncReplayTransport(fixtures, fallback=replay(FIXTURES, AsyncReplayTransport)))
+        await api.download(GIF['urls']['hd'], str(path), resume=True)
+        await api.close()
+
+        api = aio.API(transport=AsyncReplayTransport(fixtures))
+        await api.download(GIF['urls']['hd'], str(tmp_path / 'replayed.mp4'), segments=3, chunk_size=4096)
+        await api.close()
+
+    asyncio.run(main())
+    assert path.read_bytes() == (tmp_path / 'replayed.mp4').read_bytes() == MEDIA
+
+
+class SlowBody(io.RawIOBase):
+    def __init__(self, body):
+        self.body = io.BytesIO(body)
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        time.sleep(0.02)
+        data = self.body.read(len(b))
+        b[: len(data)] = data
+        return len(data)
+
+
+class FailingSegmentTransport(ReplayTransport):
+    # The last segment is answered without its range, the other ones are sent slowly
+    def __init__(self, failing):
+        super().__init__()
+        self.failing = failing
+        self.requested = 0
+
+    def request(self, method, url, **kwargs):
+        r = super().request(method, url, **kwargs)
+        if method == 'GET':
+            self.requested += 1
+            if kwargs['headers']['Range'].startswith(f'bytes={self.failing}-'):
+                r.status_code = 200
+            else:
+                r.raw = SlowBody(r.raw.read())
+        return r
+
+
+def test_segmented_download_stops_at_first_error(tmp_path):
+    transport = FailingSegmentTransport(len(MEDIA) * 3 // 4)
+    for fixture in FIXTURES:
+        transport.add(**fixture)
+    path = tmp_path / 'media.mp4'
+
+    start = time.perf_counter()
+    with pytest.raises(RedGifsError, match='did not return the requested range'):
+        API(transport=transport).download(GIF['urls']['hd'], str(path), segments=4, chunk_size=1024)
+    # Every segment takes more than a second to be sent in full
+    assert time.perf_counter() - start < 1
+    assert transport.requested == 4
+    assert os.listdir(tmp_path) == []